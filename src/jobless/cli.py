@@ -1,13 +1,97 @@
+import sys
+from functools import cache
+from importlib import import_module
+from typing import Annotated
+
 import typer
-from sqlalchemy.orm import sessionmaker
+from typer.core import TyperGroup
+
+from jobless.constants import APP_NAME
+
+# Subcommands are registered by name so that their modules (and everything
+# they pull in) are only imported once they're actually invoked.
+LAZY_COMMANDS: dict[str, tuple[str, str]] = {
+    "app": ("jobless.commands.applications", "manage job applications"),
+    "skill": ("jobless.commands.skills", "manage skills"),
+    "company": ("jobless.commands.companies", "manage companies"),
+    "contact": ("jobless.commands.contacts", "manage contacts"),
+    "shell": ("jobless.commands.shell", "start an interactive shell"),
+    "batch": ("jobless.commands.batch", "run many commands in one transaction"),
+    "import": ("jobless.commands.imports", "import applications from CSV or JSONL"),
+    "export": ("jobless.commands.exports", "export data to CSV or JSONL"),
+    "daemon": ("jobless.commands.daemon", "keep jobless warm in the background"),
+}
+
+
+def profile_options(args: list[str]) -> tuple[bool, bool]:
+    """
+    Whether the root options in `args`, the ones before the command, ask for
+    a profile and for it to be saved.
+    """
+    options = set()
+    for arg in args:
+        if not arg.startswith("-"):
+            break
+
+        options.add(arg)
+
+    save = "--save-profile" in options
+    return save or "--profile" in options, save
+
+
+class LazyGroup(TyperGroup):
+    """
+    Root group that imports subcommand modules on demand.
+
+    Until a subcommand is resolved it is represented by an empty placeholder
+    carrying only its name and help text, which is all `--help` and command
+    suggestions need.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._pending: set[str] = set()
+
+        for name, (_, help) in LAZY_COMMANDS.items():
+            self.add_command(TyperGroup(name=name, help=help), name)
+            self._pending.add(name)
+
+    def main(self, args=None, **kwargs):
+        # Profiling has to start before the command is resolved, which is
+        # when its module and the database layer get imported.
+        profile, save = profile_options(sys.argv[1:] if args is None else args)
+        if not profile:
+            return super().main(args, **kwargs)
+
+        from jobless.profiling import Profiler
+
+        profiler = Profiler()
+        # Commands dispatched from a long-running process didn't just start it.
+        profiler.start(since_process_start=kwargs.get("obj") is None)
+        try:
+            return super().main(args, **kwargs)
+        finally:
+            profiler.stop()
+            typer.echo(profiler.report(), err=True)
+            if save:
+                typer.echo(f"Profile saved to {profiler.save()}", err=True)
+
+    def resolve_command(self, ctx, args):
+        if args and args[0] in self._pending:
+            self._load(args[0])
+
+        return super().resolve_command(ctx, args)
+
+    def _load(self, name: str) -> None:
+        module_path, _ = LAZY_COMMANDS[name]
+        module = import_module(module_path)
+
+        self.add_command(typer.main.get_command(module.cli), name)
+        self._pending.discard(name)
 
-from jobless.commands import applications, companies, contacts, skills
-from jobless.context import AppContext
-from jobless.db import get_engine, init_db
-from jobless.mapper import Mapper
-from jobless.settings import load_settings
 
 cli = typer.Typer(
+    cls=LazyGroup,
     help="Track and manage your job applications from the terminal.",
     no_args_is_help=True,
     suggest_commands=True,
@@ -15,10 +99,52 @@ cli = typer.Typer(
 
 
 @cli.callback()
-def main(ctx: typer.Context):
-    settings = load_settings()
-    engine = get_engine(settings.db_url)
-    init_db(engine)
+def main(
+    ctx: typer.Context,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="profile the command and print where the time went",
+        ),
+    ] = False,
+    save_profile: Annotated[
+        bool,
+        typer.Option(
+            "--save-profile",
+            help="like --profile, also saving the stats in the app directory",
+        ),
+    ] = False,
+):
+    # Both profiling options are handled by `LazyGroup.main`, which sees them
+    # before the command is resolved.
+
+    # Commands dispatched from a long-running process (e.g. `jobless shell`)
+    # reuse the context that was set up when it started.
+    if ctx.obj is not None:
+        return
+
+    from sqlalchemy.orm import sessionmaker
+
+    from jobless.context import AppContext
+    from jobless.db import get_engine, init_db
+    from jobless.mapper import Mapper
+    from jobless.settings import load_settings
+
+    try:
+        settings = load_settings()
+    except ValueError as e:
+        typer.echo(f"invalid configuration: {e}", err=True)
+        raise typer.Exit(1)
+
+    engine = get_engine(settings.db_url, pragmas=settings.sqlite_pragmas())
+    init_db(
+        engine,
+        on_migration=lambda migration: typer.echo(
+            f"Upgrading database: {migration.description}",
+            err=True,
+        ),
+    )
 
     ctx.obj = AppContext(
         session_factory=sessionmaker(
@@ -26,13 +152,29 @@ def main(ctx: typer.Context):
             expire_on_commit=False,
         ),
         mapper=Mapper(),
+        settings=settings,
     )
 
 
-cli.add_typer(applications.cli)
-cli.add_typer(skills.cli)
-cli.add_typer(companies.cli)
-cli.add_typer(contacts.cli)
+@cache
+def get_root_command() -> LazyGroup:
+    return typer.main.get_command(cli)
+
+
+def dispatch(args: list[str], obj) -> int:
+    """
+    Run a command line against an existing `AppContext` and return its exit
+    code instead of exiting the process.
+    """
+    try:
+        get_root_command().main(args=args, prog_name=APP_NAME, obj=obj)
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+
+        return 1
+
+    return 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,69 @@
+# Thin client for `jobless daemon`. Imports are kept to a minimum on purpose,
+# interpreter start up plus imports is exactly what the daemon saves.
+import json
+import os
+import socket
+import sys
+
+from jobless.constants import DAEMON_SOCKET_PATH
+
+# Commands that need a terminal or read stdin always run in-process, and so
+# do those moving a lot of data through files of their own.
+LOCAL_COMMANDS = {"batch", "daemon", "export", "import", "shell"}
+
+
+def send(connection: socket.socket, message: dict) -> None:
+    connection.sendall(json.dumps(message).encode() + b"\n")
+
+
+def forward(argv: list[str]) -> int | None:
+    """
+    Run `argv` on the daemon and return its exit code, or `None` if it
+    should run in-process instead.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(str(DAEMON_SOCKET_PATH))
+    except OSError:
+        connection.close()
+        return None
+
+    with connection, connection.makefile("rb") as reader:
+        send(
+            connection,
+            {
+                "argv": argv,
+                "cwd": os.getcwd(),
+                "db_url": os.environ.get("JOBLESS_DB_URL"),
+            },
+        )
+
+        for line in reader:
+            message = json.loads(line)
+            if message.get("fallback"):
+                return None
+
+            if "exit" in message:
+                return message["exit"]
+
+            stream = sys.stdout if message["stream"] == "stdout" else sys.stderr
+            stream.write(message["data"])
+            stream.flush()
+
+    print("error: lost connection to the daemon", file=sys.stderr)
+    return 1
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    if not argv or argv[0] not in LOCAL_COMMANDS:
+        exit_code = forward(argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from jobless.main import main as run
+
+    run()
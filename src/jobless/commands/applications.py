@@ -1,6 +1,7 @@
-import webbrowser
-from datetime import datetime
-from typing import Annotated
+from collections.abc import Callable
+from datetime import date, datetime
+from itertools import chain
+from typing import TYPE_CHECKING, Annotated, Any
 
 import typer
 
@@ -8,9 +9,15 @@ from jobless import schemas
 from jobless.commands.utils import (
     print_application,
     print_applications,
+    print_matches,
+    print_summaries,
     resolve_field,
 )
-from jobless.context import AppContext
+from jobless.completion import (
+    complete_companies,
+    complete_contacts,
+    complete_skills,
+)
 from jobless.enums import (
     ApplicationSortField,
     Location,
@@ -18,12 +25,11 @@ from jobless.enums import (
     SortOrder,
     Status,
 )
-from jobless.repositories import (
-    ApplicationRepository,
-    CompanyRepository,
-    ContactRepository,
-    SkillRepository,
-)
+
+# The database layer is imported by each command, so that resolving `app`
+# for shell completion, which only reads the completion index, stays cheap.
+if TYPE_CHECKING:
+    from jobless.context import AppContext
 
 cli = typer.Typer(
     name="app",
@@ -32,6 +38,68 @@ cli = typer.Typer(
     suggest_commands=True,
 )
 
+# Keys accepted by `app update --where`, named after the `app list` options
+# they stand for, with the filter field and how to parse their values.
+WHERE_KEYS: dict[str, tuple[str, Callable[[str], Any]]] = {
+    "title": ("title", str),
+    "status": ("statuses", Status),
+    "location-type": ("location_types", Location),
+    "company-name": ("company_name", str),
+    "company-id": ("company_id", int),
+    "contact-id": ("contact_id", int),
+    "contact-name": ("contact_name", str),
+    "contact-email": ("contact_email", str),
+    "contact-url": ("contact_url", str),
+    "skill": ("skills", str),
+    "all-skills": ("all_skills", lambda value: value.lower() in {"true", "yes", "1"}),
+    "applied-after": ("applied_after", date.fromisoformat),
+    "applied-before": ("applied_before", date.fromisoformat),
+    "follow-up-after": ("follow_up_date_after", date.fromisoformat),
+    "follow-up-before": ("follow_up_date_before", date.fromisoformat),
+}
+
+# Repeating these matches any of the values, like with `app list`.
+REPEATABLE_WHERE_FIELDS = {"statuses", "location_types", "skills"}
+
+
+def parse_where(conditions: list[str]) -> schemas.ApplicationFilter:
+    """
+    Build a filter from `key=value` conditions. Raises ValueError for unknown
+    keys and values that can't be parsed.
+    """
+    fields: dict[str, Any] = {}
+    for condition in conditions:
+        key, _, value = condition.partition("=")
+        if key not in WHERE_KEYS:
+            raise ValueError(
+                f"invalid condition '{condition}', "
+                f"expected key=value with one of: {', '.join(WHERE_KEYS)}"
+            )
+
+        if not value.strip():
+            raise ValueError(f"missing a value for {key} in '{condition}'")
+
+        field, parse = WHERE_KEYS[key]
+        try:
+            parsed = parse(value)
+        except ValueError:
+            raise ValueError(f"invalid value for {key}: '{value}'")
+
+        if field in REPEATABLE_WHERE_FIELDS:
+            fields.setdefault(field, []).append(parsed)
+        else:
+            fields[field] = parsed
+
+    return schemas.ApplicationFilter(**fields)
+
+
+def has_conditions(f: schemas.ApplicationFilter) -> bool:
+    """
+    Whether the filter narrows anything down. Matching all skills is only a
+    modifier, so on its own it still matches every application.
+    """
+    return f != schemas.ApplicationFilter(all_skills=f.all_skills)
+
 
 @cli.command("add")
 def create(
@@ -51,6 +119,7 @@ def create(
             "-c",
             "--company",
             prompt="company name",
+            autocompletion=complete_companies,
             help="company name",
         ),
     ],
@@ -109,6 +178,7 @@ def create(
         list[str] | None,
         typer.Option(
             "--skill",
+            autocompletion=complete_skills,
             help="add a skill; repeat to add multiple",
         ),
     ] = None,
@@ -116,6 +186,7 @@ def create(
         list[int] | None,
         typer.Option(
             "--contact",
+            autocompletion=complete_contacts,
             help="link a contact by id; repeat to link multiple",
         ),
     ] = None,
@@ -129,6 +200,13 @@ def create(
       $ jobless app add -t "PM" -c Acme --contact 3 --contact 7
     """
 
+    from jobless.repositories import (
+        ApplicationRepository,
+        CompanyRepository,
+        ContactRepository,
+        SkillRepository,
+    )
+
     context: AppContext = ctx.obj
     with context.get_session() as session:
         app_repo = ApplicationRepository(session, context.mapper)
@@ -138,9 +216,7 @@ def create(
 
         target_company = company_repo.get_or_create(company)
 
-        skill_schemas = []
-        if skills:
-            skill_schemas = [skill_repo.get_or_create(s) for s in skills]
+        skill_schemas = skill_repo.get_or_create_many(skills) if skills else []
 
         contact_schemas = []
         if contacts:
@@ -196,6 +272,8 @@ def view(
       $ jobless app view 3 --web
     """
 
+    from jobless.repositories import ApplicationRepository
+
     context: AppContext = ctx.obj
     with context.get_session() as session:
         app_repo = ApplicationRepository(session, context.mapper)
@@ -209,6 +287,8 @@ def view(
                 typer.echo(f"application {app_id} has no URL ", err=True)
                 raise typer.Exit(1)
             else:
+                import webbrowser
+
                 webbrowser.open(app.url)
                 return
 
@@ -219,9 +299,9 @@ def view(
 def update(
     ctx: typer.Context,
     id: Annotated[
-        int,
-        typer.Argument(help="application id"),
-    ],
+        int | None,
+        typer.Argument(help="application id; leave out when using --where"),
+    ] = None,
     title: Annotated[
         str | None,
         typer.Option(
@@ -235,6 +315,7 @@ def update(
         typer.Option(
             "-c",
             "--company",
+            autocompletion=complete_companies,
             help="new company name",
         ),
     ] = None,
@@ -289,6 +370,20 @@ def update(
             help="new follow up date (YYYY-MM-DD).",
         ),
     ] = None,
+    clear_date_applied: Annotated[
+        bool,
+        typer.Option(
+            "--clear-date-applied",
+            help="remove the submission date",
+        ),
+    ] = False,
+    clear_follow_up_date: Annotated[
+        bool,
+        typer.Option(
+            "--clear-follow-up-date",
+            help="remove the follow up date",
+        ),
+    ] = False,
     notes: Annotated[
         str | None,
         typer.Option(
@@ -300,6 +395,7 @@ def update(
         list[str] | None,
         typer.Option(
             "--add-skill",
+            autocompletion=complete_skills,
             help="add a skill by name; repeat to add multiple",
         ),
     ] = None,
@@ -307,6 +403,7 @@ def update(
         list[str] | None,
         typer.Option(
             "--remove-skill",
+            autocompletion=complete_skills,
             help="remove a skill by name; repeat to add multiple",
         ),
     ] = None,
@@ -314,6 +411,7 @@ def update(
         list[int] | None,
         typer.Option(
             "--add-contact",
+            autocompletion=complete_contacts,
             help="link a contact by id; repeat to link multiple",
         ),
     ] = None,
@@ -321,12 +419,36 @@ def update(
         list[int] | None,
         typer.Option(
             "--remove-contact",
+            autocompletion=complete_contacts,
             help="unlink a contact by id; repeat to unlink multiple",
         ),
     ] = None,
+    where: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--where",
+            help="update every application matching key=value instead of one; "
+            "keys are named after the `app list` filters",
+        ),
+    ] = None,
+    all_applications: Annotated[
+        bool,
+        typer.Option(
+            "--all",
+            help="update every application; needed when there is no --where",
+        ),
+    ] = False,
+    dry_run: Annotated[
+        bool,
+        typer.Option(
+            "--dry-run",
+            help="with --where or --all, only print how many applications would change",
+        ),
+    ] = False,
 ):
     """
-    Update an existing job application.
+    Update an existing job application, or every application matching
+    --where.
 
     Only the fields provided will be changed. To clear an optional field
     pass an empty string.
@@ -338,9 +460,112 @@ def update(
       $ jobless app update 3 --notes ''
       $ jobless app update 3 --add-contact 5
       $ jobless app update 3 --remove-contact 2 --add-contact 9
+      $ jobless app update --where status=applied --where applied-before=2024-01-01 --status ghosted
+      $ jobless app update --where status=rejected --clear-follow-up-date --dry-run
+      $ jobless app update --all --clear-follow-up-date
     """
 
+    if title is not None and not title.strip():
+        typer.echo("application title cannot be empty", err=True)
+        raise typer.Exit(1)
+
+    if company is not None and not company.strip():
+        typer.echo("company name cannot be empty", err=True)
+        raise typer.Exit(1)
+
+    if clear_date_applied and date_applied:
+        typer.echo("--date-applied and --clear-date-applied conflict", err=True)
+        raise typer.Exit(1)
+
+    if clear_follow_up_date and follow_up_date:
+        typer.echo("--follow-up-date and --clear-follow-up-date conflict", err=True)
+        raise typer.Exit(1)
+
+    from jobless.repositories import (
+        ApplicationRepository,
+        CompanyRepository,
+        ContactRepository,
+        SkillRepository,
+    )
+
     context: AppContext = ctx.obj
+    if where or all_applications:
+        if id is not None:
+            typer.echo("pass either an application id or --where/--all", err=True)
+            raise typer.Exit(1)
+
+        if add_skills or remove_skills or add_contacts or remove_contacts:
+            typer.echo("skills and contacts can't be changed with --where", err=True)
+            raise typer.Exit(1)
+
+        try:
+            f = parse_where(where or [])
+        except ValueError as e:
+            typer.echo(e, err=True)
+            raise typer.Exit(1)
+
+        # An empty filter matches every application, so that has to be asked
+        # for explicitly.
+        if not has_conditions(f) and not all_applications:
+            typer.echo(
+                "--where has no conditions, pass --all to update every application",
+                err=True,
+            )
+            raise typer.Exit(1)
+
+        # Same rules as below, but only for the fields that were given: an
+        # empty string clears the optional ones.
+        values: dict[str, Any] = {
+            field: value or None
+            for field, value in [
+                ("description", description),
+                ("salary", salary),
+                ("url", url),
+                ("notes", notes),
+            ]
+            if value is not None
+        }
+        for field, value in [
+            ("title", title),
+            ("location_type", location_type),
+            ("status", status),
+        ]:
+            if value is not None:
+                values[field] = value
+
+        if date_applied or clear_date_applied:
+            values["date_applied"] = date_applied.date() if date_applied else None
+        if follow_up_date or clear_follow_up_date:
+            values["follow_up_date"] = follow_up_date.date() if follow_up_date else None
+
+        if not values and company is None:
+            typer.echo("nothing to update", err=True)
+            raise typer.Exit(1)
+
+        with context.get_session() as session:
+            app_repo = ApplicationRepository(session, context.mapper)
+            if dry_run:
+                typer.echo(f"{app_repo.count(f)} application(s) would be updated")
+                return
+
+            if company is not None:
+                company_repo = CompanyRepository(session, context.mapper)
+                values["company_id"] = company_repo.get_or_create(company).id
+
+            updated = app_repo.update_where(f, values)
+            session.commit()
+
+        typer.echo(f"{updated} application(s) updated")
+        return
+
+    if id is None:
+        typer.echo("missing an application id or --where", err=True)
+        raise typer.Exit(1)
+
+    if dry_run:
+        typer.echo("--dry-run needs --where or --all", err=True)
+        raise typer.Exit(1)
+
     with context.get_session() as session:
         app_repo = ApplicationRepository(session, context.mapper)
         skill_repo = SkillRepository(session, context.mapper)
@@ -365,9 +590,9 @@ def update(
 
             if add_skills:
                 existing_names = {s.name.lower() for s in target_skills}
-                for skill_name in add_skills:
-                    if skill_name.lower() not in existing_names:
-                        target_skills.append(skill_repo.get_or_create(skill_name))
+                target_skills += skill_repo.get_or_create_many(
+                    [name for name in add_skills if name.lower() not in existing_names]
+                )
 
         target_contacts = list(existing_app.contacts)
         if add_contacts or remove_contacts:
@@ -403,8 +628,12 @@ def update(
             if location_type is not None
             else existing_app.location_type,
             status=status if status is not None else existing_app.status,
-            date_applied=resolve_field(date_applied, existing_app.date_applied),
-            follow_up_date=resolve_field(follow_up_date, existing_app.follow_up_date),
+            date_applied=None
+            if clear_date_applied
+            else resolve_field(date_applied, existing_app.date_applied),
+            follow_up_date=None
+            if clear_follow_up_date
+            else resolve_field(follow_up_date, existing_app.follow_up_date),
             notes=resolve_field(notes, existing_app.notes),
             skills=target_skills,
             contacts=target_contacts,
@@ -445,6 +674,7 @@ def get_all(
         str | None,
         typer.Option(
             "--company-name",
+            autocompletion=complete_companies,
             help="filter by company name",
         ),
     ] = None,
@@ -455,13 +685,50 @@ def get_all(
             help="filter by company id",
         ),
     ] = None,
+    contact_id: Annotated[
+        int | None,
+        typer.Option(
+            "--contact-id",
+            autocompletion=complete_contacts,
+            help="filter by linked contact id",
+        ),
+    ] = None,
+    contact_name: Annotated[
+        str | None,
+        typer.Option(
+            "--contact-name",
+            help="filter by linked contact name",
+        ),
+    ] = None,
+    contact_email: Annotated[
+        str | None,
+        typer.Option(
+            "--contact-email",
+            help="filter by linked contact email",
+        ),
+    ] = None,
+    contact_url: Annotated[
+        str | None,
+        typer.Option(
+            "--contact-url",
+            help="filter by linked contact url",
+        ),
+    ] = None,
     skills: Annotated[
         list[str] | None,
         typer.Option(
             "--skill",
+            autocompletion=complete_skills,
             help="filter by skill; repeat to match multiple",
         ),
     ] = None,
+    all_skills: Annotated[
+        bool,
+        typer.Option(
+            "--all-skills",
+            help="only match applications with every --skill given",
+        ),
+    ] = False,
     applied_after: Annotated[
         datetime | None,
         typer.Option(
@@ -518,6 +785,28 @@ def get_all(
             help="limit the number of results",
         ),
     ] = None,
+    page_size: Annotated[
+        int | None,
+        typer.Option(
+            "--page-size",
+            min=1,
+            help="fetch results a page at a time, instead of up to --limit",
+        ),
+    ] = None,
+    after: Annotated[
+        str | None,
+        typer.Option(
+            "--after",
+            help="cursor printed after the previous page",
+        ),
+    ] = None,
+    count: Annotated[
+        bool,
+        typer.Option(
+            "--count",
+            help="print the number of matches instead of listing them",
+        ),
+    ] = False,
 ):
     """
     List job applications with optional filters.
@@ -525,10 +814,22 @@ def get_all(
     Examples:
       $ jobless app list --status applied --status interviewing
       $ jobless app list --location-type remote --skill python
+      $ jobless app list --skill python --skill rust --all-skills
       $ jobless app list --applied-after 2024-01-01
+      $ jobless app list --contact-email '@initech.com'
+      $ jobless app list --status applied --page-size 20
+      $ jobless app list --status applied --count
     """
 
-    # TODO: add option to filter by contact::{name, url, email, etc.}
+    if after and not page_size:
+        typer.echo("--after needs --page-size", err=True)
+        raise typer.Exit(1)
+
+    if limit is not None and page_size:
+        typer.echo("--limit and --page-size conflict", err=True)
+        raise typer.Exit(1)
+
+    from jobless.repositories import ApplicationRepository
 
     context: AppContext = ctx.obj
     f = schemas.ApplicationFilter(
@@ -536,25 +837,156 @@ def get_all(
         statuses=statuses or [],
         location_types=locations or [],
         skills=skills or [],
+        all_skills=all_skills,
         company_name=company,
         company_id=company_id,
+        contact_id=contact_id,
+        contact_name=contact_name,
+        contact_email=contact_email,
+        contact_url=contact_url,
         applied_after=applied_after.date() if applied_after else None,
         applied_before=applied_before.date() if applied_before else None,
         follow_up_date_after=follow_up_after.date() if follow_up_after else None,
         follow_up_date_before=follow_up_before.date() if follow_up_before else None,
         sort_by=sort_by,
         sort_order=sort_order,
+        limit=page_size or limit,
+    )
+    with context.get_session() as session:
+        app_repo = ApplicationRepository(session, context.mapper)
+        if count:
+            typer.echo(app_repo.count(f))
+            return
+
+        # Tables and lists only show a few fields, so skip loading the rest.
+        summary = format != OutputFormat.JSON
+        next_cursor = None
+        if page_size:
+            try:
+                page = (
+                    app_repo.page_summaries(f, after)
+                    if summary
+                    else app_repo.page(f, after)
+                )
+            except ValueError as e:
+                typer.echo(e, err=True)
+                raise typer.Exit(1)
+
+            applications = iter(page.items)
+            next_cursor = page.next_cursor
+        else:
+            applications = app_repo.summaries(f) if summary else app_repo.iter_filter(f)
+
+        first = next(applications, None)
+        if first is None:
+            typer.echo("No applications found", err=True)
+            raise typer.Exit(1)
+
+        if summary:
+            print_summaries(chain([first], applications), format)
+        else:
+            print_applications(chain([first], applications), format)
+        if next_cursor:
+            typer.echo(f"Next page: --after {next_cursor}", err=True)
+
+
+@cli.command("search")
+def search(
+    ctx: typer.Context,
+    query: Annotated[
+        list[str],
+        typer.Argument(help="words to look for; end one with '*' to match prefixes"),
+    ],
+    statuses: Annotated[
+        list[Status] | None,
+        typer.Option(
+            "--status",
+            help="filter by status; repeat to match multiple",
+        ),
+    ] = None,
+    locations: Annotated[
+        list[Location] | None,
+        typer.Option(
+            "--location-type",
+            help="filter by work arrangement; repeat to match multiple",
+        ),
+    ] = None,
+    applied_after: Annotated[
+        datetime | None,
+        typer.Option(
+            "--applied-after", help="filter by date submitted (on or after YYYY-MM-DD)"
+        ),
+    ] = None,
+    applied_before: Annotated[
+        datetime | None,
+        typer.Option(
+            "--applied-before",
+            help="filter by date submitted (on or before YYYY-MM-DD)",
+        ),
+    ] = None,
+    follow_up_after: Annotated[
+        datetime | None,
+        typer.Option(
+            "--follow-up-after",
+            help="filter by follow-up date (on or after YYYY-MM-DD)",
+        ),
+    ] = None,
+    follow_up_before: Annotated[
+        datetime | None,
+        typer.Option(
+            "--follow-up-before",
+            help="filter by follow-up date (on or before YYYY-MM-DD)",
+        ),
+    ] = None,
+    format: Annotated[
+        OutputFormat,
+        typer.Option(
+            "--format",
+            help="output format",
+        ),
+    ] = OutputFormat.TABLE,
+    limit: Annotated[
+        int,
+        typer.Option(
+            "--limit",
+            min=1,
+            help="limit the number of results",
+        ),
+    ] = 20,
+):
+    """
+    Search job applications by title, description, notes and company name.
+
+    Results are ranked by relevance, with matches in the title and company
+    name counting the most. Applications must contain every word given.
+
+    Examples:
+      $ jobless app search python django
+      $ jobless app search kube* --status applied
+      $ jobless app search "acme" --applied-after 2024-01-01 --format json
+    """
+
+    from jobless.repositories import ApplicationRepository
+
+    context: AppContext = ctx.obj
+    f = schemas.ApplicationFilter(
+        statuses=statuses or [],
+        location_types=locations or [],
+        applied_after=applied_after.date() if applied_after else None,
+        applied_before=applied_before.date() if applied_before else None,
+        follow_up_date_after=follow_up_after.date() if follow_up_after else None,
+        follow_up_date_before=follow_up_before.date() if follow_up_before else None,
         limit=limit,
     )
     with context.get_session() as session:
         app_repo = ApplicationRepository(session, context.mapper)
-        applications = app_repo.filter(f)
+        matches = app_repo.search(" ".join(query), f)
 
-        if not applications:
+        if not matches:
             typer.echo("No applications found", err=True)
             raise typer.Exit(1)
 
-        print_applications(applications, format)
+        print_matches(matches, format)
 
 
 @cli.command("del")
@@ -581,22 +1013,23 @@ def delete(
       $ jobless app del 4 7 12 --force
     """
 
+    from jobless.repositories import ApplicationRepository
+
     context: AppContext = ctx.obj
     with context.get_session() as session:
         app_repo = ApplicationRepository(session, context.mapper)
 
-        valid_apps = []
+        valid_apps = app_repo.get_summaries(app_ids)
+        found = {app.id for app in valid_apps}
         for id in app_ids:
-            app = app_repo.get(id)
-            if app:
-                valid_apps.append(app)
-            else:
+            if id not in found:
                 typer.echo(f"application {id} not found. skipping", err=True)
 
         if not valid_apps:
             typer.echo("nothing to do")
             raise typer.Exit(1)
 
+        confirmed = []
         for app in valid_apps:
             if not force:
                 if not typer.confirm(
@@ -605,7 +1038,10 @@ def delete(
                 ):
                     continue
 
-            app_repo.delete(app.id)
+            confirmed.append(app)
+
+        app_repo.delete_many([app.id for app in confirmed])
+        for app in confirmed:
             typer.echo(f"Application {app.id} deleted")
 
         session.commit()
@@ -0,0 +1,136 @@
+import io
+import json
+import shlex
+import sys
+from typing import Annotated
+
+import typer
+
+from jobless.cli import dispatch
+from jobless.context import AppContext
+
+# Commands that can't run from a batch or the shell: they manage sessions of
+# their own, or keep running until they're stopped.
+NESTED_COMMANDS = {"batch", "daemon", "export", "import", "shell"}
+
+cli = typer.Typer(
+    name="batch",
+    help="run many commands in one transaction",
+)
+
+
+def parse_operation(line: str) -> list[str]:
+    """
+    Turn a line of input into command line arguments.
+
+    A line is either a command as typed after `jobless`, a JSON array of
+    arguments, or a JSON object like:
+    {"command": "app update", "args": [3], "options": {"status": "applied"}}
+    """
+    if line[0] not in "[{":
+        return shlex.split(line)
+
+    data = json.loads(line)
+    if isinstance(data, list):
+        return [str(arg) for arg in data]
+
+    if not isinstance(data, dict) or "command" not in data:
+        raise ValueError("JSON operations must be an array or have a 'command' key")
+
+    command = data["command"]
+    args = shlex.split(command) if isinstance(command, str) else list(command)
+    args.extend(data.get("args", []))
+
+    for key, value in data.get("options", {}).items():
+        flag = f"--{key.replace('_', '-')}"
+        for v in value if isinstance(value, list) else [value]:
+            if v is True:
+                args.append(flag)
+            elif v is not None and v is not False:
+                args.extend([flag, v])
+
+    return [str(arg) for arg in args]
+
+
+@cli.command("batch")
+def batch(
+    ctx: typer.Context,
+    file: Annotated[
+        typer.FileText,
+        typer.Argument(help="file with one operation per line; '-' reads stdin"),
+    ] = "-",
+    commit_every: Annotated[
+        int,
+        typer.Option(
+            "--commit-every",
+            min=0,
+            help="commit after this many operations; 0 commits once at the end",
+        ),
+    ] = 0,
+):
+    """
+    Run many commands in a single transaction.
+
+    Each line holds one operation, either as you'd type it after 'jobless'
+    or as JSON. A failing operation is rolled back and reported without
+    stopping the rest. Operations can't prompt, so pass '--force' to 'del'.
+
+    Examples:
+      $ jobless batch changes.txt
+      $ printf 'app update 3 --status ghosted\\napp del 7 -f\\n' | jobless batch
+      $ jobless batch ops.jsonl --commit-every 500
+    """
+
+    context: AppContext = ctx.obj
+    succeeded = failed = pending = 0
+
+    # Prompts read from stdin, which may well be the batch itself. Give them
+    # an empty stream so they abort instead of consuming operations.
+    stdin, sys.stdin = sys.stdin, io.StringIO()
+
+    try:
+        with context.batch(profile=context.settings.sqlite_bulk_profile) as session:
+            for number, line in enumerate(file, start=1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+
+                try:
+                    args = parse_operation(line)
+                except ValueError as e:
+                    typer.echo(f"line {number}: {e}", err=True)
+                    failed += 1
+                    continue
+
+                if not args or args[0] in NESTED_COMMANDS:
+                    typer.echo(f"line {number}: invalid operation", err=True)
+                    failed += 1
+                    continue
+
+                savepoint = session.begin_nested()
+                try:
+                    error = "failed" if dispatch(args, context) else None
+                except Exception as e:
+                    error = str(e).splitlines()[0]
+
+                if error:
+                    savepoint.rollback()
+                    typer.echo(f"line {number}: {error}, rolled back", err=True)
+                    failed += 1
+                    continue
+
+                savepoint.commit()
+                succeeded += 1
+                pending += 1
+
+                if commit_every and pending >= commit_every:
+                    session.commit_batch()
+                    pending = 0
+
+            session.commit_batch()
+    finally:
+        sys.stdin = stdin
+
+    typer.echo(f"{succeeded} operation(s) succeeded, {failed} failed", err=True)
+    if failed:
+        raise typer.Exit(1)
@@ -1,4 +1,3 @@
-import webbrowser
 from typing import Annotated
 
 import typer
@@ -7,7 +6,7 @@ from jobless import schemas
 from jobless.commands.utils import print_companies, print_company, resolve_field
 from jobless.context import AppContext
 from jobless.enums import CompanySortField, OutputFormat, SortOrder
-from jobless.repositories import ApplicationRepository, CompanyRepository
+from jobless.repositories import CompanyRepository
 
 cli = typer.Typer(
     name="company",
@@ -103,6 +102,8 @@ def view(
                 typer.echo(f"company {company_id} has no URL ", err=True)
                 raise typer.Exit(1)
             else:
+                import webbrowser
+
                 webbrowser.open(company.url)
                 return
 
@@ -245,6 +246,28 @@ def get_all(
             help="limit the number of results",
         ),
     ] = None,
+    page_size: Annotated[
+        int | None,
+        typer.Option(
+            "--page-size",
+            min=1,
+            help="fetch results a page at a time, instead of up to --limit",
+        ),
+    ] = None,
+    after: Annotated[
+        str | None,
+        typer.Option(
+            "--after",
+            help="cursor printed after the previous page",
+        ),
+    ] = None,
+    count: Annotated[
+        bool,
+        typer.Option(
+            "--count",
+            help="print the number of matches instead of listing them",
+        ),
+    ] = False,
 ):
     """
     List all companies with optional filters.
@@ -253,10 +276,20 @@ def get_all(
         $ jobless company list
         $ jobless company list --industry 'fintech' --sort-by name
         $ jobless company list --min-applications 2 --order asc
+        $ jobless company list --page-size 50
+        $ jobless company list --count
     """
 
     # TODO: add option to filter by application::{title, id, etc.}
 
+    if after and not page_size:
+        typer.echo("--after needs --page-size", err=True)
+        raise typer.Exit(1)
+
+    if limit is not None and page_size:
+        typer.echo("--limit and --page-size conflict", err=True)
+        raise typer.Exit(1)
+
     context: AppContext = ctx.obj
     f = schemas.CompanyFilter(
         name=name,
@@ -266,17 +299,32 @@ def get_all(
         max_applications=max_applications,
         sort_by=sort_by,
         sort_order=sort_order,
-        limit=limit,
+        limit=page_size or limit,
     )
     with context.get_session() as session:
         company_repo = CompanyRepository(session, context.mapper)
-        companies = company_repo.filter(f)
+        if count:
+            typer.echo(company_repo.count(f))
+            return
+
+        if page_size:
+            try:
+                page = company_repo.page(f, after)
+            except ValueError as e:
+                typer.echo(e, err=True)
+                raise typer.Exit(1)
+        else:
+            page = schemas.Page(items=company_repo.filter(f))
+
+        companies = page.items
 
         if not companies:
             typer.echo("No companies found")
             return
 
         print_companies(companies, format)
+        if page.next_cursor:
+            typer.echo(f"Next page: --after {page.next_cursor}", err=True)
 
 
 @cli.command("del")
@@ -309,33 +357,35 @@ def delete(
     context: AppContext = ctx.obj
     with context.get_session() as session:
         company_repo = CompanyRepository(session, context.mapper)
-        app_repo = ApplicationRepository(session, context.mapper)
 
-        valid_companies = []
+        valid_companies = company_repo.get_many(company_ids)
+        found = {company.id for company in valid_companies}
         for company_id in company_ids:
-            company = company_repo.get(company_id)
-            if company:
-                linked_apps = app_repo.list_by_company(company.id)
-                valid_companies.append((company, linked_apps))
-            else:
+            if company_id not in found:
                 typer.echo(f"company {company_id} not found, skipping", err=True)
 
         if not valid_companies:
             typer.echo("nothing to do")
             raise typer.Exit(1)
 
-        for company, linked_apps in valid_companies:
+        counts = company_repo.application_counts(list(found))
+
+        confirmed = []
+        for company in valid_companies:
             if not force:
                 if not typer.confirm(
-                    f"Delete company '{company.name}' and {len(linked_apps)} application(s)?"
+                    f"Delete company '{company.name}' and {counts[company.id]} application(s)?"
                 ):
                     typer.echo(f"Skipping '{company.name}'")
                     continue
 
-            company_repo.delete(company.id)
-            if linked_apps:
+            confirmed.append(company)
+
+        company_repo.delete_many([company.id for company in confirmed])
+        for company in confirmed:
+            if counts[company.id]:
                 typer.echo(
-                    f"Deleted company '{company.name}' and {len(linked_apps)} application(s)"
+                    f"Deleted company '{company.name}' and {counts[company.id]} application(s)"
                 )
             else:
                 typer.echo(f"Deleted company '{company.name}'")
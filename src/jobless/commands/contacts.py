@@ -1,4 +1,3 @@
-import webbrowser
 from typing import Annotated
 
 import typer
@@ -120,6 +119,8 @@ def view(
                 typer.echo(f"contact {contact_id} has no URL ", err=True)
                 raise typer.Exit(1)
             else:
+                import webbrowser
+
                 webbrowser.open(contact.url)
                 return
 
@@ -272,6 +273,28 @@ def get_all(
             help="limit the number of results",
         ),
     ] = None,
+    page_size: Annotated[
+        int | None,
+        typer.Option(
+            "--page-size",
+            min=1,
+            help="fetch results a page at a time, instead of up to --limit",
+        ),
+    ] = None,
+    after: Annotated[
+        str | None,
+        typer.Option(
+            "--after",
+            help="cursor printed after the previous page",
+        ),
+    ] = None,
+    count: Annotated[
+        bool,
+        typer.Option(
+            "--count",
+            help="print the number of matches instead of listing them",
+        ),
+    ] = False,
 ):
     """
     List contacts with optional filters.
@@ -280,10 +303,20 @@ def get_all(
         $ jobless contact list
         $ jobless contact list --name 'sarah'
         $ jobless contact list --min-applications 2 --order asc
+        $ jobless contact list --page-size 50
+        $ jobless contact list --count
     """
 
     # TODO: add option to filter by application::{title, id, etc.}
 
+    if after and not page_size:
+        typer.echo("--after needs --page-size", err=True)
+        raise typer.Exit(1)
+
+    if limit is not None and page_size:
+        typer.echo("--limit and --page-size conflict", err=True)
+        raise typer.Exit(1)
+
     context: AppContext = ctx.obj
     f = schemas.ContactFilter(
         name=name,
@@ -293,18 +326,33 @@ def get_all(
         max_applications=max_applications,
         sort_by=sort_by,
         sort_order=sort_order,
-        limit=limit,
+        limit=page_size or limit,
     )
 
     with context.get_session() as session:
         contact_repo = ContactRepository(session, context.mapper)
-        contacts = contact_repo.filter(f)
+        if count:
+            typer.echo(contact_repo.count(f))
+            return
+
+        if page_size:
+            try:
+                page = contact_repo.page(f, after)
+            except ValueError as e:
+                typer.echo(e, err=True)
+                raise typer.Exit(1)
+        else:
+            page = schemas.Page(items=contact_repo.filter(f))
+
+        contacts = page.items
 
         if not contacts:
             typer.echo("No contacts found", err=True)
             raise typer.Exit(1)
 
         print_contacts(contacts, format)
+        if page.next_cursor:
+            typer.echo(f"Next page: --after {page.next_cursor}", err=True)
 
 
 @cli.command("del")
@@ -335,18 +383,17 @@ def delete(
     with context.get_session() as session:
         contact_repo = ContactRepository(session, context.mapper)
 
-        valid_contacts = []
+        valid_contacts = contact_repo.get_many(contact_ids)
+        found = {contact.id for contact in valid_contacts}
         for contact_id in contact_ids:
-            contact = contact_repo.get(contact_id)
-            if contact:
-                valid_contacts.append(contact)
-            else:
+            if contact_id not in found:
                 typer.echo(f"contact {contact_id} not found, skipping", err=True)
 
         if not valid_contacts:
             typer.echo("nothing to do")
             raise typer.Exit(1)
 
+        confirmed = []
         for contact in valid_contacts:
             if not force:
                 if not typer.confirm(
@@ -355,7 +402,10 @@ def delete(
                 ):
                     continue
 
-            contact_repo.delete(contact.id)
+            confirmed.append(contact)
+
+        contact_repo.delete_many([contact.id for contact in confirmed])
+        for contact in confirmed:
             typer.echo(f"Contact '{contact.name}' deleted")
 
         session.commit()
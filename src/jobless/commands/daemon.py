@@ -0,0 +1,246 @@
+import io
+import json
+import os
+import signal
+import socket
+import sys
+from typing import Annotated
+
+import typer
+
+from jobless.cli import dispatch
+from jobless.commands.batch import NESTED_COMMANDS
+from jobless.client import send
+from jobless.constants import DAEMON_SOCKET_PATH
+from jobless.context import AppContext
+
+# Output of a forwarded command held back before it starts being streamed.
+HOLD_LIMIT = 64 * 1024
+
+cli = typer.Typer(
+    name="daemon",
+    help="keep jobless warm in the background",
+)
+
+
+class PromptRequired(Exception):
+    pass
+
+
+class _NoInput(io.TextIOBase):
+    """
+    Stdin for forwarded commands. Prompting makes the client run the command
+    in-process, where there's a terminal to answer it.
+    """
+
+    def readable(self) -> bool:
+        return True
+
+    def readline(self, size: int = -1) -> str:
+        raise PromptRequired()
+
+
+class _Output:
+    """
+    Output of a forwarded command, kept in the order it was written.
+
+    If the command prompts, the client runs it again itself, so nothing can
+    have been shown yet. Output is therefore held back, but only up to
+    `HOLD_LIMIT`: past that it's streamed to the client in chunks of about
+    that size, so commands writing a lot don't pile it all up in memory, and
+    a prompt after that point is an error instead.
+    """
+
+    def __init__(self, connection: socket.socket) -> None:
+        self._connection = connection
+        self._held: list[tuple[str, str]] = []
+        self._size = 0
+        self.streaming = False
+
+    def write(self, name: str, s: str) -> None:
+        self._held.append((name, s))
+        self._size += len(s)
+        if self._size >= HOLD_LIMIT:
+            self.streaming = True
+            self.flush()
+
+    def flush(self) -> None:
+        # Runs of writes to the same stream go out as one message.
+        pending: list[str] = []
+        for i, (name, s) in enumerate(self._held):
+            pending.append(s)
+            if i + 1 == len(self._held) or self._held[i + 1][0] != name:
+                send(self._connection, {"stream": name, "data": "".join(pending)})
+                pending.clear()
+
+        self._held.clear()
+        self._size = 0
+
+
+class _ClientStream(io.TextIOBase):
+    """
+    Text stream writing to a forwarded command's `_Output`.
+    """
+
+    encoding = "utf-8"
+
+    def __init__(self, output: _Output, name: str) -> None:
+        self._output = output
+        self._name = name
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        # Like any text stream, and so that click doesn't take it for a binary one.
+        if not isinstance(s, str):
+            raise TypeError(f"write() argument must be str, not {type(s).__name__}")
+
+        self._output.write(self._name, s)
+        return len(s)
+
+
+def _handle(connection: socket.socket, context: AppContext) -> bool:
+    """
+    Serve a single request. Returns `False` once the daemon should stop.
+    """
+    with connection.makefile("rb") as reader:
+        request = json.loads(reader.readline())
+
+    if request.get("stop"):
+        send(connection, {"exit": 0})
+        return False
+
+    if request.get("db_url") != os.environ.get("JOBLESS_DB_URL"):
+        send(connection, {"fallback": True})
+        return True
+
+    argv = request["argv"]
+    if argv and argv[0] in NESTED_COMMANDS:
+        send(
+            connection,
+            {"stream": "stderr", "data": f"{argv[0]} can't run in the daemon\n"},
+        )
+        send(connection, {"exit": 1})
+        return True
+
+    output = _Output(connection)
+    streams = sys.stdin, sys.stdout, sys.stderr
+    cwd = os.getcwd()
+
+    sys.stdin = _NoInput()
+    sys.stdout = _ClientStream(output, "stdout")
+    sys.stderr = _ClientStream(output, "stderr")
+    try:
+        os.chdir(request["cwd"])
+        exit_code = dispatch(argv, context)
+    except PromptRequired:
+        if not output.streaming:
+            send(connection, {"fallback": True})
+            return True
+
+        print(
+            "error: can't prompt once output was sent, run it with jobless",
+            file=sys.stderr,
+        )
+        exit_code = 1
+    except Exception as e:
+        print(f"error: {e}", file=sys.stderr)
+        exit_code = 1
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = streams
+        os.chdir(cwd)
+
+    output.flush()
+    send(connection, {"exit": exit_code})
+    return True
+
+
+def _connect() -> socket.socket | None:
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(str(DAEMON_SOCKET_PATH))
+    except OSError:
+        connection.close()
+        return None
+
+    return connection
+
+
+def _raise_interrupt(signum, frame):
+    raise KeyboardInterrupt()
+
+
+@cli.command("daemon")
+def daemon(
+    ctx: typer.Context,
+    stop: Annotated[
+        bool,
+        typer.Option(
+            "--stop",
+            help="stop the running daemon",
+        ),
+    ] = False,
+):
+    """
+    Keep jobless running in the background.
+
+    The database connection and everything else jobless needs stay loaded,
+    so commands sent through 'jobless-client' skip most of the start up
+    cost. 'jobless-client' falls back to running commands itself when the
+    daemon isn't running. Commands that prompt also run in the client.
+
+    Examples:
+      $ jobless daemon &
+      $ jobless-client app list --status applied
+      $ jobless daemon --stop
+    """
+
+    if not hasattr(socket, "AF_UNIX"):
+        typer.echo("the daemon isn't supported on this platform", err=True)
+        raise typer.Exit(1)
+
+    running = _connect()
+    if stop:
+        if not running:
+            typer.echo("the daemon isn't running", err=True)
+            raise typer.Exit(1)
+
+        with running:
+            send(running, {"stop": True})
+            running.recv(1024)
+
+        typer.echo("Daemon stopped")
+        return
+
+    if running:
+        running.close()
+        typer.echo("the daemon is already running", err=True)
+        raise typer.Exit(1)
+
+    context: AppContext = ctx.obj
+    DAEMON_SOCKET_PATH.unlink(missing_ok=True)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(DAEMON_SOCKET_PATH))
+    DAEMON_SOCKET_PATH.chmod(0o600)
+    server.listen()
+    signal.signal(signal.SIGTERM, _raise_interrupt)
+
+    typer.echo(f"Listening on {DAEMON_SOCKET_PATH}", err=True)
+    try:
+        serving = True
+        while serving:
+            connection, _ = server.accept()
+            with connection:
+                try:
+                    serving = _handle(connection, context)
+                except (OSError, ValueError) as e:
+                    typer.echo(f"error: {e}", err=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        DAEMON_SOCKET_PATH.unlink(missing_ok=True)
+
+    typer.echo("Daemon stopped", err=True)
@@ -0,0 +1,101 @@
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from jobless.context import AppContext
+from jobless.enums import ExportTarget, FileFormat
+from jobless.exporter import FIELDS, export_parallel, read_records, write_records
+from jobless.utils import guess_file_format, open_data_file
+
+cli = typer.Typer(
+    name="export",
+    help="export data to CSV or JSONL",
+)
+
+
+@cli.command("export")
+def export(
+    ctx: typer.Context,
+    target: Annotated[
+        ExportTarget,
+        typer.Argument(help="what to export"),
+    ] = ExportTarget.APPLICATIONS,
+    output: Annotated[
+        Path,
+        typer.Option(
+            "-o",
+            "--output",
+            allow_dash=True,
+            help="file to write, compressed if it ends in .gz; '-' writes stdout",
+        ),
+    ] = Path("-"),
+    format: Annotated[
+        FileFormat | None,
+        typer.Option(
+            "--format",
+            help="file format; guessed from the extension, JSONL otherwise",
+        ),
+    ] = None,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            min=1,
+            help="split the export by id into this many files, written in parallel",
+        ),
+    ] = 1,
+):
+    """
+    Export applications, companies, contacts or skills to CSV or JSONL.
+
+    Rows are read and written a chunk at a time, so memory use stays the
+    same however many there are. Exported applications include their
+    company, skills and contact ids, and can be imported back with
+    'jobless import'.
+
+    With --workers, rows are split by id range between worker processes,
+    each writing its own numbered file next to --output.
+
+    Examples:
+      $ jobless export > applications.jsonl
+      $ jobless export companies -o companies.csv
+      $ jobless export -o applications.jsonl.gz --workers 4
+    """
+
+    format = format or guess_file_format(output) or FileFormat.JSONL
+    to_stdout = str(output) == "-"
+    if workers > 1 and to_stdout:
+        typer.echo("--workers needs --output", err=True)
+        raise typer.Exit(1)
+
+    context: AppContext = ctx.obj
+    try:
+        with context.get_session() as session:
+            if workers > 1:
+                counts = export_parallel(
+                    session,
+                    context.settings.db_url,
+                    context.settings.sqlite_pragmas(),
+                    target,
+                    format,
+                    output,
+                    workers,
+                )
+            else:
+                with open_data_file(output, "w") as file:
+                    records = read_records(session, context.mapper, target)
+                    counts = {
+                        output: write_records(records, file, format, FIELDS[target])
+                    }
+    except OSError as e:
+        typer.echo(e, err=True)
+        raise typer.Exit(1)
+
+    if not sum(counts.values()):
+        typer.echo(f"No {target} to export", err=True)
+        return
+
+    if not to_stdout:
+        for path, count in counts.items():
+            typer.echo(f"Exported {count} {target} to {path}", err=True)
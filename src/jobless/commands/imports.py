@@ -0,0 +1,119 @@
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from jobless.context import AppContext
+from jobless.enums import FileFormat
+from jobless.importer import Importer, read_records
+from jobless.utils import guess_file_format, open_data_file
+
+cli = typer.Typer(
+    name="import",
+    help="import applications from CSV or JSONL",
+)
+
+
+@cli.command("import")
+def import_applications(
+    ctx: typer.Context,
+    file: Annotated[
+        Path,
+        typer.Argument(
+            allow_dash=True,
+            help="CSV or JSONL file, optionally gzipped; '-' reads stdin",
+        ),
+    ],
+    format: Annotated[
+        FileFormat | None,
+        typer.Option(
+            "--format",
+            help="file format; guessed from the extension if not given",
+        ),
+    ] = None,
+    commit_every: Annotated[
+        int,
+        typer.Option(
+            "--commit-every",
+            min=1,
+            help="commit after this many applications",
+        ),
+    ] = 1000,
+    restart: Annotated[
+        bool,
+        typer.Option(
+            "--restart",
+            help="start over instead of resuming an interrupted import",
+        ),
+    ] = False,
+):
+    """
+    Import applications from a CSV or JSONL file.
+
+    Each row or line is an application with a 'title' and 'company', and
+    optionally 'description', 'salary', 'url', 'location_type', 'status',
+    'date_applied', 'follow_up_date', 'notes' and 'skills' (a list, or
+    separated by ';' in CSV). Missing companies and skills are created.
+
+    Applications whose URL is already taken are skipped. If an import of a
+    file is interrupted, running it again resumes where it stopped.
+
+    Examples:
+      $ jobless import applications.csv
+      $ jobless import backup.jsonl.gz
+      $ cat applications.jsonl | jobless import - --format jsonl
+    """
+
+    format = format or guess_file_format(file)
+    if not format:
+        typer.echo(f"can't tell the format of {file}, pass --format", err=True)
+        raise typer.Exit(1)
+
+    # Standard input can't be read again, so there is nothing to resume. A
+    # file is only resumed as long as it hasn't changed since.
+    source, version = None, ""
+    if str(file) != "-":
+        try:
+            stat = file.stat()
+        except OSError as e:
+            typer.echo(e, err=True)
+            raise typer.Exit(1)
+
+        source = str(file.resolve())
+        version = f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def report(number: int, error: str) -> None:
+        typer.echo(f"line {number}: {error}", err=True)
+
+    context: AppContext = ctx.obj
+    try:
+        with (
+            open_data_file(file) as f,
+            context.batch(profile=context.settings.sqlite_bulk_profile) as session,
+        ):
+            result = Importer(session, context.mapper).run(
+                read_records(f, format),
+                source=source,
+                version=version,
+                restart=restart,
+                chunk_size=commit_every,
+                commit=session.commit_batch,
+                on_error=report,
+            )
+    except OSError as e:
+        typer.echo(e, err=True)
+        raise typer.Exit(1)
+
+    if result.resumed_after:
+        typer.echo(
+            f"Resumed after {result.resumed_after} record(s) imported earlier",
+            err=True,
+        )
+
+    typer.echo(
+        f"{result.imported} application(s) imported, "
+        f"{result.duplicates} duplicate(s) skipped, {result.failed} failed",
+        err=True,
+    )
+    if result.failed:
+        raise typer.Exit(1)
@@ -0,0 +1,86 @@
+import shlex
+
+import typer
+
+from jobless.cli import dispatch
+from jobless.commands.batch import NESTED_COMMANDS
+from jobless.constants import APP_DIR, APP_NAME
+from jobless.context import AppContext
+
+HISTORY_FILE = APP_DIR / "history"
+EXIT_COMMANDS = {"exit", "quit"}
+
+cli = typer.Typer(
+    name="shell",
+    help="start an interactive shell",
+)
+
+
+def _setup_history() -> None:
+    try:
+        import readline
+    except ImportError:
+        return
+
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+
+    import atexit
+
+    atexit.register(readline.write_history_file, HISTORY_FILE)
+
+
+@cli.command("shell")
+def shell(ctx: typer.Context):
+    """
+    Start an interactive shell.
+
+    The database connection is set up once and reused by every command, so
+    each one only pays for its own queries. Type 'exit' or press Ctrl-D to
+    leave.
+
+    Examples:
+      $ jobless shell
+      jobless> app list --status applied
+      jobless> app update 3 --status interviewing
+      jobless> exit
+    """
+
+    context: AppContext = ctx.obj
+    _setup_history()
+
+    while True:
+        try:
+            line = input(f"{APP_NAME}> ")
+        except KeyboardInterrupt:
+            typer.echo()
+            continue
+        except EOFError:
+            typer.echo()
+            break
+
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            typer.echo(f"error: {e}", err=True)
+            continue
+
+        if not args:
+            continue
+
+        if args[0] in EXIT_COMMANDS:
+            break
+
+        if args[0] in NESTED_COMMANDS:
+            typer.echo(f"{args[0]} can't run inside the shell", err=True)
+            continue
+
+        if args[0] == "help":
+            args = ["--help"]
+
+        try:
+            dispatch(args, context)
+        except Exception as e:
+            typer.echo(f"error: {e}", err=True)
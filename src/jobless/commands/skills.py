@@ -112,6 +112,28 @@ def get_all(
             help="limit the number of results",
         ),
     ] = None,
+    page_size: Annotated[
+        int | None,
+        typer.Option(
+            "--page-size",
+            min=1,
+            help="fetch results a page at a time, instead of up to --limit",
+        ),
+    ] = None,
+    after: Annotated[
+        str | None,
+        typer.Option(
+            "--after",
+            help="cursor printed after the previous page",
+        ),
+    ] = None,
+    count: Annotated[
+        bool,
+        typer.Option(
+            "--count",
+            help="print the number of matches instead of listing them",
+        ),
+    ] = False,
 ):
     """
     List all skills with optional filters.
@@ -120,10 +142,20 @@ def get_all(
         $ jobless skill list
         $ jobless skill list --name 'python'
         $ jobless skill list --min-applications 5
+        $ jobless skill list --page-size 50
+        $ jobless skill list --count
     """
 
     # TODO: add option to filter by application::{title, id, etc.}
 
+    if after and not page_size:
+        typer.echo("--after needs --page-size", err=True)
+        raise typer.Exit(1)
+
+    if limit is not None and page_size:
+        typer.echo("--limit and --page-size conflict", err=True)
+        raise typer.Exit(1)
+
     context: AppContext = ctx.obj
     f = schemas.SkillFilter(
         name=name,
@@ -131,17 +163,32 @@ def get_all(
         max_applications=max_applications,
         sort_by=sort_by,
         sort_order=sort_order,
-        limit=limit,
+        limit=page_size or limit,
     )
     with context.get_session() as session:
         skill_repo = SkillRepository(session, context.mapper)
-        skills = skill_repo.filter(f)
+        if count:
+            typer.echo(skill_repo.count(f))
+            return
+
+        if page_size:
+            try:
+                page = skill_repo.page(f, after)
+            except ValueError as e:
+                typer.echo(e, err=True)
+                raise typer.Exit(1)
+        else:
+            page = schemas.Page(items=skill_repo.filter(f))
+
+        skills = page.items
 
         if not skills:
             typer.echo("No skills found", err=True)
             raise typer.Exit(1)
 
         print_skills(skills, format)
+        if page.next_cursor:
+            typer.echo(f"Next page: --after {page.next_cursor}", err=True)
 
 
 @cli.command("del")
@@ -173,18 +220,17 @@ def delete(
     with context.get_session() as session:
         skill_repo = SkillRepository(session, context.mapper)
 
-        valid_skills = []
+        valid_skills = skill_repo.get_many(skill_ids)
+        found = {skill.id for skill in valid_skills}
         for id in skill_ids:
-            skill = skill_repo.get(id)
-            if skill:
-                valid_skills.append(skill)
-            else:
+            if id not in found:
                 typer.echo(f"skill {id} not found, skipping", err=True)
 
         if not valid_skills:
             typer.echo("nothing to do")
             raise typer.Exit(1)
 
+        confirmed = []
         for skill in valid_skills:
             if not force:
                 if not typer.confirm(
@@ -193,7 +239,10 @@ def delete(
                 ):
                     continue
 
-            skill_repo.delete(skill.id)
+            confirmed.append(skill)
+
+        skill_repo.delete_many([skill.id for skill in confirmed])
+        for skill in confirmed:
             typer.echo(f"Skill '{skill.name}' deleted")
 
         session.commit()
@@ -1,17 +1,27 @@
 import json
+import textwrap
+from collections.abc import Iterable
 from dataclasses import asdict
 from datetime import date, datetime
-
-from rich.columns import Columns
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+from functools import cache
+from typing import TYPE_CHECKING, TextIO
 
 from jobless import schemas
 from jobless.enums import OutputFormat
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.text import Text
+
+
+@cache
+def get_console() -> Console:
+    """
+    Return the shared console, importing rich only on first use.
+    """
+    from rich.console import Console
+
+    return Console()
 
 
 def resolve_field(new, existing):
@@ -45,17 +55,56 @@ def _or_dash(value: str | None) -> str:
     return value or "-"
 
 
-def print_applications(apps: list[schemas.Application], format: OutputFormat):
-    if format == OutputFormat.JSON:
-        output = [asdict(app) for app in apps]
-        console.print(
-            json.dumps(
-                output,
-                indent=2,
-                default=date_serializer,
-                ensure_ascii=False,
-            )
+def write_json_list(items: Iterable[dict], file: TextIO) -> None:
+    """
+    Write items as `json.dumps(list(items), indent=2)` would, one at a time.
+    """
+    empty = True
+    for item in items:
+        file.write("[\n" if empty else ",\n")
+        empty = False
+
+        output = json.dumps(
+            item,
+            indent=2,
+            default=date_serializer,
+            ensure_ascii=False,
         )
+        file.write(textwrap.indent(output, "  "))
+
+    file.write("[]\n" if empty else "\n]\n")
+
+
+def _summarize(app: schemas.Application) -> schemas.ApplicationSummary:
+    return schemas.ApplicationSummary(
+        id=app.id,
+        title=app.title,
+        company_name=app.company.name,
+        status=app.status,
+        date_applied=app.date_applied,
+        follow_up_date=app.follow_up_date,
+    )
+
+
+def print_applications(apps: Iterable[schemas.Application], format: OutputFormat):
+    if format == OutputFormat.JSON:
+        write_json_list((asdict(app) for app in apps), get_console().file)
+        return
+
+    print_summaries((_summarize(app) for app in apps), format)
+
+
+def print_summaries(
+    apps: Iterable[schemas.ApplicationSummary],
+    format: OutputFormat,
+):
+    from rich.table import Table
+    from rich.text import Text
+
+    console = get_console()
+
+    if format == OutputFormat.JSON:
+        write_json_list((asdict(app) for app in apps), console.file)
         return
 
     if format == OutputFormat.TABLE:
@@ -71,7 +120,7 @@ def print_applications(apps: list[schemas.Application], format: OutputFormat):
             table.add_row(
                 str(app.id),
                 app.title,
-                app.company.name,
+                app.company_name,
                 app.status.value,
                 _fmt_date(app.date_applied),
                 _fmt_date(app.follow_up_date),
@@ -82,7 +131,7 @@ def print_applications(apps: list[schemas.Application], format: OutputFormat):
             line = Text.assemble(
                 (f"{app.id},", "bold"),
                 f" '{app.title}',",
-                f" '{app.company.name}',",
+                f" '{app.company_name}',",
                 f" {app.status.value.capitalize()},",
                 f" {_fmt_date(app.date_applied)},",
                 f" {_fmt_date(app.follow_up_date)}",
@@ -90,7 +139,72 @@ def print_applications(apps: list[schemas.Application], format: OutputFormat):
             console.print(line)
 
 
+def _highlight(snippet: str) -> Text:
+    from rich.text import Text
+
+    text = Text()
+    for i, part in enumerate(snippet.split(schemas.MATCH_START)):
+        match, _, rest = part.partition(schemas.MATCH_END) if i else ("", "", part)
+        text.append(match, style="bold yellow")
+        text.append(rest)
+
+    return text
+
+
+def _plain(snippet: str) -> str:
+    return snippet.replace(schemas.MATCH_START, "").replace(schemas.MATCH_END, "")
+
+
+def print_matches(matches: list[schemas.ApplicationMatch], format: OutputFormat):
+    from rich.table import Table
+    from rich.text import Text
+
+    console = get_console()
+
+    if format == OutputFormat.JSON:
+        write_json_list(
+            ({**asdict(m.application), "snippet": _plain(m.snippet)} for m in matches),
+            console.file,
+        )
+        return
+
+    if format == OutputFormat.TABLE:
+        table = Table(box=None, header_style="bold")
+        table.add_column("ID", style="dim")
+        table.add_column("Title")
+        table.add_column("Company")
+        table.add_column("Status")
+        table.add_column("Match")
+
+        for m in matches:
+            table.add_row(
+                str(m.application.id),
+                m.application.title,
+                m.application.company.name,
+                m.application.status.value,
+                _highlight(m.snippet),
+            )
+        console.print(table)
+    else:
+        for m in matches:
+            line = Text.assemble(
+                (f"{m.application.id},", "bold"),
+                f" '{m.application.title}',",
+                f" '{m.application.company.name}',",
+                f" {m.application.status.value.capitalize()},",
+                " ",
+                _highlight(m.snippet),
+            )
+            console.print(line)
+
+
 def print_application(app: schemas.Application) -> None:
+    from rich.columns import Columns
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = get_console()
+
     tags = [f"[bold]{app.status.value}[/]", app.location_type.value]
     if app.salary:
         tags.append(app.salary)
@@ -193,6 +307,11 @@ def print_application(app: schemas.Application) -> None:
 
 
 def print_companies(companies: list[schemas.Company], format: OutputFormat):
+    from rich.table import Table
+    from rich.text import Text
+
+    console = get_console()
+
     if format == OutputFormat.JSON:
         output = [asdict(company) for company in companies]
         console.print(
@@ -231,6 +350,11 @@ def print_companies(companies: list[schemas.Company], format: OutputFormat):
 
 
 def print_company(company: schemas.Company) -> None:
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = get_console()
+
     body_parts: list = [_or_dash(company.industry)]
     body_parts.append("\n" + _or_dash(company.url))
     console.print(
@@ -244,6 +368,11 @@ def print_company(company: schemas.Company) -> None:
 
 
 def print_contacts(contacts: list[schemas.Contact], format: OutputFormat):
+    from rich.table import Table
+    from rich.text import Text
+
+    console = get_console()
+
     if format == OutputFormat.JSON:
         output = [asdict(contact) for contact in contacts]
         console.print(
@@ -285,6 +414,11 @@ def print_contacts(contacts: list[schemas.Contact], format: OutputFormat):
 
 
 def print_contact(contact: schemas.Contact) -> None:
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = get_console()
+
     body_parts: list = [(_or_dash(contact.email), "")]
     body_parts.append("\n" + _or_dash(contact.phone))
     body_parts.append("\n" + _or_dash(contact.url))
@@ -299,6 +433,11 @@ def print_contact(contact: schemas.Contact) -> None:
 
 
 def print_skills(skills: list[schemas.Skill], format: OutputFormat):
+    from rich.table import Table
+    from rich.text import Text
+
+    console = get_console()
+
     if format == OutputFormat.JSON:
         output = [asdict(skill) for skill in skills]
         console.print(
@@ -0,0 +1,125 @@
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+from jobless.constants import APP_DIR
+
+INDEX_PATH = APP_DIR / "completion.json"
+
+
+def _db_path() -> Path | None:
+    from jobless.settings import load_settings
+
+    prefix = "sqlite:///"
+    db_url = load_settings().db_url
+    if not db_url.startswith(prefix) or db_url.endswith(":memory:"):
+        return None
+
+    return Path(db_url.removeprefix(prefix))
+
+
+def db_signature(db_path: Path) -> list[int]:
+    """
+    Cheap fingerprint of the database contents.
+
+    `PRAGMA data_version` only means something within a single connection,
+    so this combines the file change counter in the database header with the
+    size and modification time of the database and its WAL file, which is
+    where commits go in WAL mode.
+    """
+    with open(db_path, "rb") as f:
+        f.seek(24)
+        signature = [int.from_bytes(f.read(4), "big")]
+
+    for path in (db_path, db_path.with_name(f"{db_path.name}-wal")):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            signature.extend([0, 0])
+            continue
+
+        # Readers leave an empty WAL behind, which says nothing about the data.
+        if stat.st_size:
+            signature.extend([stat.st_mtime_ns, stat.st_size])
+        else:
+            signature.extend([0, 0])
+
+    return signature
+
+
+def build_index(db_path: Path) -> dict:
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        return {
+            "companies": [
+                name
+                for (name,) in connection.execute(
+                    "SELECT name FROM companies ORDER BY name"
+                )
+            ],
+            "skills": [
+                name
+                for (name,) in connection.execute(
+                    "SELECT name FROM skills ORDER BY name"
+                )
+            ],
+            "contacts": connection.execute(
+                "SELECT id, name FROM contacts ORDER BY id"
+            ).fetchall(),
+        }
+    finally:
+        connection.close()
+
+
+def load_index(db_path: Path, index_path: Path = INDEX_PATH) -> dict:
+    """
+    Return the name index, rebuilding it only if the database changed.
+    """
+    signature = db_signature(db_path)
+
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+        if index.get("signature") == signature:
+            return index
+    except OSError, ValueError:
+        pass
+
+    index = {"signature": signature, **build_index(db_path)}
+
+    tmp_path = index_path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, index_path)
+
+    return index
+
+
+def _index() -> dict:
+    try:
+        db_path = _db_path()
+        return load_index(db_path, INDEX_PATH) if db_path else {}
+    except OSError, ValueError, sqlite3.Error:
+        return {}
+
+
+def _match(names: list[str], incomplete: str) -> list[str]:
+    incomplete = incomplete.lower()
+    return [name for name in names if name.lower().startswith(incomplete)]
+
+
+def complete_companies(incomplete: str) -> list[str]:
+    return _match(_index().get("companies", []), incomplete)
+
+
+def complete_skills(incomplete: str) -> list[str]:
+    return _match(_index().get("skills", []), incomplete)
+
+
+def complete_contacts(incomplete: str) -> list[tuple[str, str]]:
+    return [
+        (str(id), name)
+        for id, name in _index().get("contacts", [])
+        if str(id).startswith(incomplete)
+    ]
@@ -1,10 +1,19 @@
-from importlib.metadata import version
 from pathlib import Path
 
 from jobless.utils import get_app_dir
 
 APP_NAME = "jobless"
-APP_VERSION = version(APP_NAME)
 APP_DIR: Path = get_app_dir(app_name=APP_NAME)
 DB_URL: Path = APP_DIR / "jobs.db"
 CONFIG_FILE_PATH = APP_DIR / "config.toml"
+DAEMON_SOCKET_PATH = APP_DIR / "daemon.sock"
+
+
+def __getattr__(name: str):
+    # Reading the installed metadata is slow, so only do it when asked for.
+    if name == "APP_VERSION":
+        from importlib.metadata import version
+
+        return version(APP_NAME)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,33 @@
-from sqlalchemy.orm import sessionmaker
+from collections.abc import Iterator
+from contextlib import contextmanager
 
+from sqlalchemy.orm import Session, sessionmaker
+
+from jobless.db import use_pragmas
 from jobless.mapper import Mapper
+from jobless.settings import Settings
+
+
+class BatchSession(Session):
+    """
+    Session shared by every command run as part of a batch.
+
+    Commands keep committing and closing their session as usual, but here
+    that only flushes, leaving it to the batch runner to decide when the
+    transaction actually ends.
+    """
+
+    def commit(self) -> None:
+        self.flush()
+
+    def close(self) -> None:
+        pass
+
+    def commit_batch(self) -> None:
+        super().commit()
+
+    def close_batch(self) -> None:
+        super().close()
 
 
 class AppContext:
@@ -8,9 +35,40 @@ class AppContext:
         self,
         session_factory: sessionmaker,
         mapper: Mapper,
+        settings: Settings | None = None,
     ) -> None:
         self.session_factory = session_factory
         self.mapper = mapper
+        self.settings = settings or Settings()
+        self._batch_session: BatchSession | None = None
 
     def get_session(self):
+        if self._batch_session is not None:
+            return self._batch_session
+
         return self.session_factory()
+
+    @contextmanager
+    def batch(self, profile: str | None = None) -> Iterator[BatchSession]:
+        """
+        Make every session handed out until exit the same `BatchSession`,
+        optionally switching to another SQLite profile while it's open.
+
+        Its transactions begin with the write lock, since a batch is there to
+        write, and what it reads stays current until it commits.
+        """
+        pragmas = self.settings.sqlite_pragmas(profile) if profile else {}
+        engine = self.session_factory.kw["bind"]
+
+        with (
+            engine.connect().execution_options(sqlite_immediate=True) as connection,
+            use_pragmas(connection, pragmas),
+        ):
+            session = BatchSession(**{**self.session_factory.kw, "bind": connection})
+            self._batch_session = session
+
+            try:
+                yield session
+            finally:
+                self._batch_session = None
+                session.close_batch()
@@ -0,0 +1,65 @@
+from sqlalchemy import Connection, event
+
+from jobless.models import Base
+
+# Tables with an `application_count` column, and the table and column whose
+# rows are being counted. Triggers keep the counts up to date, so sorting and
+# filtering by them doesn't need to join and group by applications.
+APPLICATION_COUNTERS: dict[str, tuple[str, str]] = {
+    "companies": ("applications", "company_id"),
+    "contacts": ("application_contact_link", "contact_id"),
+    "skills": ("application_skill_link", "skill_id"),
+}
+
+
+def _counter_ddl(table: str, source: str, column: str) -> list[str]:
+    increment = (
+        f"UPDATE {table} SET application_count = application_count + 1 "
+        f"WHERE id = new.{column};"
+    )
+    decrement = (
+        f"UPDATE {table} SET application_count = application_count - 1 "
+        f"WHERE id = old.{column};"
+    )
+
+    return [
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_count_insert AFTER INSERT ON {source}
+        BEGIN {increment} END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_count_delete AFTER DELETE ON {source}
+        BEGIN {decrement} END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_count_update
+        AFTER UPDATE OF {column} ON {source}
+        WHEN old.{column} IS NOT new.{column}
+        BEGIN {decrement} {increment} END
+        """,
+    ]
+
+
+def create_application_counters(connection: Connection) -> None:
+    """
+    Create the triggers that keep every `application_count` up to date.
+    """
+    for table, (source, column) in APPLICATION_COUNTERS.items():
+        for statement in _counter_ddl(table, source, column):
+            connection.exec_driver_sql(statement)
+
+
+def count_applications(table: str) -> str:
+    """
+    SQL assignment that sets a row's `application_count` from scratch.
+    """
+    source, column = APPLICATION_COUNTERS[table]
+    return (
+        f"application_count = "
+        f"(SELECT count(*) FROM {source} WHERE {source}.{column} = {table}.id)"
+    )
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_counters(target, connection: Connection, **kw) -> None:
+    create_application_counters(connection)
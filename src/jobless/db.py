@@ -1,33 +1,122 @@
-from sqlalchemy import create_engine, event
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
 
+from sqlalchemy import Connection, create_engine, event
+
+from jobless.migrations import SCHEMA_VERSION, Migration, migrate
 from jobless.models import Base
+from jobless.settings import SQLITE_PROFILES
 
 
-def set_sqlite_pragmas(dbapi_connection, connection_record):
+def apply_pragmas(dbapi_connection, pragmas: Mapping[str, int | str]) -> None:
     cursor = dbapi_connection.cursor()
 
-    cursor.execute("PRAGMA foreign_keys = ON;")
-    cursor.execute("PRAGMA journal_mode = WAL;")
-    cursor.execute("PRAGMA synchronous = NORMAL;")
-    cursor.execute("PRAGMA mmap_size = 134217728;")
-    cursor.execute("PRAGMA journal_size_limit = 27103364;")
-    cursor.execute("PRAGMA cache_size = 2000;")
+    for pragma, value in pragmas.items():
+        cursor.execute(f"PRAGMA {pragma} = {value};")
 
     cursor.close()
 
 
-def get_engine(db_url: str, connect_args: dict | None = None):
+def read_pragmas(dbapi_connection, pragmas: Iterable[str]) -> dict[str, int | str]:
+    cursor = dbapi_connection.cursor()
+
+    values = {
+        pragma: cursor.execute(f"PRAGMA {pragma};").fetchone()[0] for pragma in pragmas
+    }
+
+    cursor.close()
+    return values
+
+
+@contextmanager
+def use_pragmas(
+    connection: Connection,
+    pragmas: Mapping[str, int | str],
+) -> Iterator[None]:
+    """
+    Apply `pragmas` to the connection until exit, then restore the old values.
+
+    Some pragmas, like `synchronous`, can't be changed inside a transaction,
+    so this must be entered and left while the connection isn't in one.
+    """
+    dbapi_connection = connection.connection.dbapi_connection
+    previous = read_pragmas(dbapi_connection, pragmas)
+    apply_pragmas(dbapi_connection, pragmas)
+
+    try:
+        yield
+    finally:
+        apply_pragmas(dbapi_connection, previous)
+
+
+def begin_transaction(connection) -> None:
+    # Connections that are only used to write take the write lock as soon as
+    # they begin, so nothing they read can be changed by someone else before
+    # they write.
+    if connection.get_execution_options().get("sqlite_immediate"):
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+    else:
+        connection.exec_driver_sql("BEGIN")
+
+
+def get_engine(
+    db_url: str,
+    connect_args: dict | None = None,
+    pragmas: Mapping[str, int | str] | None = None,
+):
     if not connect_args:
         connect_args = {"check_same_thread": False}
 
+    if pragmas is None:
+        pragmas = SQLITE_PROFILES["interactive"]
+
     engine = create_engine(
         db_url,
         connect_args=connect_args,
     )
 
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        apply_pragmas(
+            dbapi_connection,
+            {"foreign_keys": "ON", "journal_mode": "WAL", **pragmas},
+        )
+
+        # pysqlite only emits BEGIN right before the first DML statement,
+        # which breaks savepoints. Let SQLAlchemy control transactions instead.
+        dbapi_connection.isolation_level = None
+
     event.listen(engine, "connect", set_sqlite_pragmas)
+    event.listen(engine, "begin", begin_transaction)
     return engine
 
 
-def init_db(engine) -> None:
-    Base.metadata.create_all(engine)
+def get_schema_version(connection) -> int:
+    return connection.exec_driver_sql("PRAGMA user_version").scalar_one()
+
+
+def init_db(
+    engine,
+    on_migration: Callable[[Migration], None] | None = None,
+) -> None:
+    """
+    Create the schema if the database is new, or migrate it if it's outdated.
+
+    Up-to-date databases only pay for reading a single integer, instead of
+    having every table inspected on each invocation.
+    """
+    with engine.connect() as connection:
+        version = get_schema_version(connection)
+        if version >= SCHEMA_VERSION:
+            return
+
+        is_empty = not connection.exec_driver_sql(
+            "SELECT count(*) FROM sqlite_master WHERE type = 'table'"
+        ).scalar_one()
+
+        if not is_empty:
+            migrate(connection, version, on_migration)
+            return
+
+        Base.metadata.create_all(connection)
+        connection.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        connection.commit()
@@ -25,6 +25,18 @@ class OutputFormat(StrEnum):
     JSON = "json"
 
 
+class FileFormat(StrEnum):
+    CSV = "csv"
+    JSONL = "jsonl"
+
+
+class ExportTarget(StrEnum):
+    APPLICATIONS = "applications"
+    COMPANIES = "companies"
+    CONTACTS = "contacts"
+    SKILLS = "skills"
+
+
 class SortOrder(StrEnum):
     ASC = "asc"
     DESC = "desc"
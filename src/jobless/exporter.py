@@ -0,0 +1,220 @@
+import csv
+import json
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, TextIO
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from jobless import models, schemas
+from jobless.db import get_engine
+from jobless.enums import ExportTarget, FileFormat
+from jobless.importer import LIST_SEPARATOR
+from jobless.mapper import Mapper
+from jobless.repositories import (
+    ApplicationRepository,
+    CompanyRepository,
+    ContactRepository,
+    SkillRepository,
+)
+from jobless.utils import open_data_file
+
+# Fields written for each target, in order. Exported applications can be
+# imported back with `jobless import`.
+FIELDS: dict[ExportTarget, list[str]] = {
+    ExportTarget.APPLICATIONS: [
+        "id",
+        "title",
+        "company",
+        "status",
+        "location_type",
+        "date_applied",
+        "follow_up_date",
+        "salary",
+        "url",
+        "description",
+        "notes",
+        "skills",
+        "contacts",
+    ],
+    ExportTarget.COMPANIES: ["id", "name", "url", "industry"],
+    ExportTarget.CONTACTS: ["id", "name", "email", "phone", "url"],
+    ExportTarget.SKILLS: ["id", "name"],
+}
+
+MODELS = {
+    ExportTarget.APPLICATIONS: models.Application,
+    ExportTarget.COMPANIES: models.Company,
+    ExportTarget.CONTACTS: models.Contact,
+    ExportTarget.SKILLS: models.Skill,
+}
+
+
+def _application_record(app: schemas.Application) -> dict[str, Any]:
+    return {
+        "id": app.id,
+        "title": app.title,
+        "company": app.company.name,
+        "status": app.status,
+        "location_type": app.location_type,
+        "date_applied": app.date_applied.isoformat() if app.date_applied else None,
+        "follow_up_date": app.follow_up_date.isoformat()
+        if app.follow_up_date
+        else None,
+        "salary": app.salary,
+        "url": app.url,
+        "description": app.description,
+        "notes": app.notes,
+        "skills": [skill.name for skill in app.skills],
+        "contacts": [contact.id for contact in app.contacts],
+    }
+
+
+def read_records(
+    session: Session,
+    mapper: Mapper,
+    target: ExportTarget,
+    first_id: int | None = None,
+    last_id: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield every row of `target` as a record, in id order and optionally only
+    those with ids from `first_id` to `last_id`.
+    """
+    if target == ExportTarget.APPLICATIONS:
+        apps = ApplicationRepository(session, mapper).iter_by_id(first_id, last_id)
+        yield from map(_application_record, apps)
+        return
+
+    repo = {
+        ExportTarget.COMPANIES: CompanyRepository,
+        ExportTarget.CONTACTS: ContactRepository,
+        ExportTarget.SKILLS: SkillRepository,
+    }[target](session, mapper)
+    fields = FIELDS[target]
+    for item in repo.iter_by_id(first_id, last_id):
+        yield {field: getattr(item, field) for field in fields}
+
+
+def write_records(
+    records: Iterable[dict[str, Any]],
+    file: TextIO,
+    format: FileFormat,
+    fields: list[str],
+) -> int:
+    """
+    Write records as JSON lines, or CSV rows under a header of `fields`, one
+    at a time. Returns how many were written.
+    """
+    written = 0
+    if format == FileFormat.CSV:
+        writer = csv.DictWriter(file, fieldnames=fields)
+        writer.writeheader()
+        for record in records:
+            writer.writerow(
+                {
+                    key: LIST_SEPARATOR.join(map(str, value))
+                    if isinstance(value, list)
+                    else value
+                    for key, value in record.items()
+                }
+            )
+            written += 1
+
+        return written
+
+    for record in records:
+        file.write(json.dumps(record, ensure_ascii=False))
+        file.write("\n")
+        written += 1
+
+    return written
+
+
+def split_ids(
+    session: Session,
+    target: ExportTarget,
+    parts: int,
+) -> list[tuple[int, int]]:
+    """
+    Split the ids of `target` into up to `parts` ranges with about as many
+    rows each.
+    """
+    model = MODELS[target]
+    total = session.scalar(select(func.count()).select_from(model))
+    if not total:
+        return []
+
+    parts = min(parts, total)
+    firsts = [
+        session.scalar(
+            select(model.id).order_by(model.id).offset(total * part // parts).limit(1)
+        )
+        for part in range(parts)
+    ]
+    last = session.scalar(select(func.max(model.id)))
+
+    return [
+        (first, next_first - 1)
+        for first, next_first in zip(firsts, [*firsts[1:], last + 1])
+    ]
+
+
+def part_path(path: Path, number: int) -> Path:
+    """
+    Number a file, keeping its extensions: `apps.jsonl.gz` -> `apps-1.jsonl.gz`.
+    """
+    suffix = "".join(path.suffixes[-2:]) if path.suffix == ".gz" else path.suffix
+    return path.with_name(f"{path.name.removesuffix(suffix)}-{number}{suffix}")
+
+
+def export_part(
+    db_url: str,
+    pragmas: Mapping[str, int | str],
+    target: ExportTarget,
+    format: FileFormat,
+    path: Path,
+    first_id: int,
+    last_id: int,
+) -> int:
+    """
+    Export one range of ids to its own file, from a worker process with its
+    own connection. Returns how many records were written.
+    """
+    engine = get_engine(db_url, pragmas=pragmas)
+    try:
+        with Session(engine) as session, open_data_file(path, "w") as file:
+            records = read_records(session, Mapper(), target, first_id, last_id)
+            return write_records(records, file, format, FIELDS[target])
+    finally:
+        engine.dispose()
+
+
+def export_parallel(
+    session: Session,
+    db_url: str,
+    pragmas: Mapping[str, int | str],
+    target: ExportTarget,
+    format: FileFormat,
+    path: Path,
+    workers: int,
+) -> dict[Path, int]:
+    """
+    Split `target` by id range into a file per worker, numbered after `path`,
+    and export them all at once. Returns how many records went to each file.
+    """
+    ranges = split_ids(session, target, workers)
+    if not ranges:
+        return {}
+
+    paths = [part_path(path, number) for number in range(1, len(ranges) + 1)]
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = {
+            part: executor.submit(
+                export_part, db_url, pragmas, target, format, part, first_id, last_id
+            )
+            for part, (first_id, last_id) in zip(paths, ranges)
+        }
+        return {part: future.result() for part, future in futures.items()}
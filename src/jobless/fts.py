@@ -0,0 +1,153 @@
+from sqlalchemy import Connection, event
+
+from jobless.models import Base
+
+# Full-text index over applications. It stores its own copy of the text,
+# since the company name lives in another table, and uses the application id
+# as rowid. Triggers keep it in sync with `applications` and `companies`.
+APPLICATIONS_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS applications_fts USING fts5(
+        title,
+        description,
+        notes,
+        company_name,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    # Make `ORDER BY rank` weigh matches in the title and company name higher.
+    """
+    INSERT INTO applications_fts (applications_fts, rank)
+    VALUES ('rank', 'bm25(10.0, 1.0, 1.0, 5.0)')
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_insert
+    AFTER INSERT ON applications
+    BEGIN
+        INSERT INTO applications_fts (rowid, title, description, notes, company_name)
+        VALUES (
+            new.id,
+            new.title,
+            new.description,
+            new.notes,
+            (SELECT name FROM companies WHERE id = new.company_id)
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_update
+    AFTER UPDATE OF title, description, notes, company_id ON applications
+    BEGIN
+        UPDATE applications_fts
+        SET
+            title = new.title,
+            description = new.description,
+            notes = new.notes,
+            company_name = (SELECT name FROM companies WHERE id = new.company_id)
+        WHERE rowid = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_delete
+    AFTER DELETE ON applications
+    BEGIN
+        DELETE FROM applications_fts WHERE rowid = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_company_update
+    AFTER UPDATE OF name ON companies
+    BEGIN
+        UPDATE applications_fts
+        SET company_name = new.name
+        WHERE rowid IN (SELECT id FROM applications WHERE company_id = new.id);
+    END
+    """,
+]
+
+
+def create_application_search(connection: Connection) -> None:
+    """
+    Create the full-text index over applications and index existing rows.
+    """
+    for statement in APPLICATIONS_FTS_DDL:
+        connection.exec_driver_sql(statement)
+
+    connection.exec_driver_sql(
+        """
+        INSERT INTO applications_fts (rowid, title, description, notes, company_name)
+        SELECT a.id, a.title, a.description, a.notes, c.name
+        FROM applications AS a
+        LEFT JOIN companies AS c ON c.id = a.company_id
+        WHERE a.id NOT IN (SELECT rowid FROM applications_fts)
+        """
+    )
+
+
+# Columns filtered with `LIKE '%term%'`, which can't use a regular index.
+# Each table gets an FTS5 trigram index over them, named `<table>_trgm`,
+# that answers those same LIKE patterns without scanning the table.
+TRIGRAM_COLUMNS: dict[str, list[str]] = {
+    "applications": ["title"],
+    "companies": ["name", "url", "industry"],
+    "contacts": ["name", "url", "email"],
+    "skills": ["name"],
+}
+
+
+def _trigram_ddl(table: str, columns: list[str]) -> list[str]:
+    index = f"{table}_trgm"
+    names = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+
+    # An external content table only stores the index, so rows are removed
+    # with the 'delete' command and the values that were indexed.
+    delete = (
+        f"INSERT INTO {index} ({index}, rowid, {names}) "
+        f"VALUES ('delete', old.id, {old});"
+    )
+    insert = f"INSERT INTO {index} (rowid, {names}) VALUES (new.id, {new});"
+
+    return [
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5(
+            {names},
+            content = '{table}',
+            content_rowid = 'id',
+            tokenize = 'trigram'
+        )
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {index}_insert AFTER INSERT ON {table}
+        BEGIN {insert} END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {index}_delete AFTER DELETE ON {table}
+        BEGIN {delete} END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {index}_update AFTER UPDATE OF {names} ON {table}
+        BEGIN {delete} {insert} END
+        """,
+    ]
+
+
+def create_substring_indexes(connection: Connection) -> None:
+    """
+    Create the trigram indexes and rebuild them from their tables.
+    """
+    for table, columns in TRIGRAM_COLUMNS.items():
+        for statement in _trigram_ddl(table, columns):
+            connection.exec_driver_sql(statement)
+
+        index = f"{table}_trgm"
+        connection.exec_driver_sql(
+            f"INSERT INTO {index} ({index}) VALUES ('rebuild')",
+        )
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_tables(target, connection: Connection, **kw) -> None:
+    create_application_search(connection)
+    create_substring_indexes(connection)
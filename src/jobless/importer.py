@@ -0,0 +1,326 @@
+import csv
+import json
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, replace
+from datetime import date
+from typing import Any, TextIO
+
+from sqlalchemy.orm import Session
+
+from jobless import schemas
+from jobless.enums import FileFormat, Location, Status
+from jobless.mapper import Mapper
+from jobless.repositories import (
+    ApplicationRepository,
+    CompanyRepository,
+    SkillRepository,
+)
+
+# Fields an imported application can have. Only title and company are
+# required. Ids, of the application or its contacts (as exported), are
+# ignored since they belong to another database.
+FIELDS = {
+    "id",
+    "contacts",
+    "title",
+    "company",
+    "description",
+    "salary",
+    "url",
+    "location_type",
+    "status",
+    "date_applied",
+    "follow_up_date",
+    "notes",
+    "skills",
+}
+
+# CSV has no lists, so list items (like skills) share a column separated by this.
+LIST_SEPARATOR = ";"
+
+
+@dataclass(slots=True)
+class ImportResult:
+    imported: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    # Records skipped because an earlier, interrupted import got past them.
+    resumed_after: int = 0
+
+
+def read_records(
+    file: TextIO,
+    format: FileFormat,
+) -> Iterator[tuple[int, dict[str, Any] | str]]:
+    """
+    Yield the records in `file` with the line they end on, one at a time.
+
+    CSV rows come out as dicts and JSONL lines as they are, to be decoded by
+    `parse_record` so that a broken line only fails itself.
+    """
+    if format == FileFormat.CSV:
+        reader = csv.DictReader(file)
+        for row in reader:
+            yield reader.line_num, row
+
+        return
+
+    for number, line in enumerate(file, start=1):
+        if line.strip():
+            yield number, line
+
+
+def _text(record: dict[str, Any], key: str) -> str | None:
+    value = record.get(key)
+    if value is None or value == "":
+        return None
+
+    return str(value)
+
+
+def _date(record: dict[str, Any], key: str) -> date | None:
+    value = _text(record, key)
+    return date.fromisoformat(value) if value else None
+
+
+def parse_record(record: dict[str, Any] | str) -> schemas.Application:
+    """
+    Turn a CSV row or JSONL line into an application whose company and
+    skills only have names. Raises ValueError if it isn't a valid one.
+    """
+    if isinstance(record, str):
+        record = json.loads(record)
+        if not isinstance(record, dict):
+            raise ValueError("expected a JSON object")
+
+    unknown = sorted(str(key) for key in record.keys() - FIELDS)
+    if unknown:
+        raise ValueError(f"unknown field(s): {', '.join(unknown)}")
+
+    title = _text(record, "title")
+    company = _text(record, "company")
+    if not title or not company:
+        raise ValueError("title and company are required")
+
+    skills = record.get("skills") or []
+    if isinstance(skills, str):
+        skills = skills.split(LIST_SEPARATOR)
+    elif not isinstance(skills, list):
+        raise ValueError("skills must be a list")
+
+    status = _text(record, "status")
+    location_type = _text(record, "location_type")
+
+    return schemas.Application(
+        title=title,
+        company=schemas.Company(name=company),
+        description=_text(record, "description"),
+        salary=_text(record, "salary"),
+        url=_text(record, "url"),
+        location_type=Location(location_type) if location_type else Location.ON_SITE,
+        status=Status(status) if status else Status.SAVED,
+        date_applied=_date(record, "date_applied"),
+        follow_up_date=_date(record, "follow_up_date"),
+        notes=_text(record, "notes"),
+        skills=[
+            schemas.Skill(name=name)
+            for name in dict.fromkeys(str(skill).strip() for skill in skills)
+            if name
+        ],
+    )
+
+
+def _ensure_progress_table(session: Session) -> None:
+    session.connection().exec_driver_sql(
+        "CREATE TABLE IF NOT EXISTS import_progress "
+        "(source TEXT PRIMARY KEY, version TEXT NOT NULL, records INTEGER NOT NULL)"
+    )
+
+
+def _load_progress(session: Session, source: str, version: str) -> int:
+    """
+    How many records of `source` an earlier import got through. Progress made
+    on another version of it, like a file that was edited since, is dropped.
+    """
+    row = (
+        session.connection()
+        .exec_driver_sql(
+            "SELECT version, records FROM import_progress WHERE source = ?",
+            (source,),
+        )
+        .one_or_none()
+    )
+    if row and row.version != version:
+        _clear_progress(session, source)
+        return 0
+
+    return row.records if row else 0
+
+
+def _save_progress(session: Session, source: str, version: str, records: int) -> None:
+    session.connection().exec_driver_sql(
+        "INSERT INTO import_progress (source, version, records) VALUES (?, ?, ?) "
+        "ON CONFLICT (source) DO UPDATE "
+        "SET version = excluded.version, records = excluded.records",
+        (source, version, records),
+    )
+
+
+def _clear_progress(session: Session, source: str) -> None:
+    session.connection().exec_driver_sql(
+        "DELETE FROM import_progress WHERE source = ?",
+        (source,),
+    )
+
+
+def _drop_progress_table(session: Session) -> None:
+    """
+    Drop the progress table once no import is left to resume, so it doesn't
+    stay behind in the schema.
+    """
+    connection = session.connection()
+    if not connection.exec_driver_sql(
+        "SELECT count(*) FROM import_progress"
+    ).scalar_one():
+        connection.exec_driver_sql("DROP TABLE import_progress")
+
+
+class Importer:
+    """
+    Adds applications a chunk at a time.
+
+    Companies and skills are looked up (or created) once per chunk for the
+    names not seen before, and each chunk is inserted with a handful of
+    executemany statements. Applications whose URL is already taken are
+    skipped as duplicates.
+    """
+
+    def __init__(self, session: Session, mapper: Mapper) -> None:
+        self._session = session
+        self._app_repo = ApplicationRepository(session, mapper)
+        self._company_repo = CompanyRepository(session, mapper)
+        self._skill_repo = SkillRepository(session, mapper)
+        self._company_ids: dict[str, int] = {}
+        self._skill_ids: dict[str, int] = {}
+
+    def add(self, apps: list[schemas.Application]) -> tuple[int, int]:
+        """
+        Insert `apps`, returning how many were added and how many skipped.
+        """
+        taken = self._app_repo.existing_urls([app.url for app in apps if app.url])
+        new = []
+        for app in apps:
+            if app.url in taken:
+                continue
+
+            if app.url:
+                taken.add(app.url)
+
+            new.append(app)
+
+        self._company_ids.update(
+            (company.name, company.id)
+            for company in self._company_repo.get_or_create_many(
+                [
+                    app.company.name
+                    for app in new
+                    if app.company.name not in self._company_ids
+                ]
+            )
+        )
+        self._skill_ids.update(
+            (skill.name, skill.id)
+            for skill in self._skill_repo.get_or_create_many(
+                [
+                    skill.name
+                    for app in new
+                    for skill in app.skills
+                    if skill.name not in self._skill_ids
+                ]
+            )
+        )
+
+        self._app_repo.add_many(
+            [
+                replace(
+                    app,
+                    company=replace(
+                        app.company,
+                        id=self._company_ids[app.company.name],
+                    ),
+                    skills=[
+                        replace(skill, id=self._skill_ids[skill.name])
+                        for skill in app.skills
+                    ],
+                )
+                for app in new
+            ]
+        )
+        return len(new), len(apps) - len(new)
+
+    def run(
+        self,
+        records: Iterable[tuple[int, dict[str, Any] | str]],
+        source: str | None = None,
+        version: str = "",
+        restart: bool = False,
+        chunk_size: int = 1000,
+        commit: Callable[[], None] | None = None,
+        on_error: Callable[[int, str], None] | None = None,
+    ) -> ImportResult:
+        """
+        Import every record, committing after each chunk.
+
+        With a `source`, how far the import got is committed along with each
+        chunk, and an import of the same `version` of the source picks up
+        from there instead of adding the same applications again, unless
+        it's a `restart`.
+        """
+        commit = commit or self._session.commit
+        result = ImportResult()
+
+        if source:
+            _ensure_progress_table(self._session)
+            if restart:
+                _clear_progress(self._session, source)
+
+            result.resumed_after = _load_progress(self._session, source, version)
+
+        position = 0
+        chunk: list[schemas.Application] = []
+
+        def flush() -> None:
+            imported, duplicates = self.add(chunk)
+            result.imported += imported
+            result.duplicates += duplicates
+            chunk.clear()
+
+            if source:
+                _save_progress(self._session, source, version, position)
+
+            commit()
+
+        for number, record in records:
+            position += 1
+            if position <= result.resumed_after:
+                continue
+
+            try:
+                chunk.append(parse_record(record))
+            except ValueError as e:
+                result.failed += 1
+                if on_error:
+                    on_error(number, str(e))
+
+                continue
+
+            if len(chunk) >= chunk_size:
+                flush()
+
+        flush()
+        if source:
+            _clear_progress(self._session, source)
+            _drop_progress_table(self._session)
+            commit()
+
+        return result
@@ -0,0 +1,208 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from sqlalchemy import Connection, Index
+from sqlalchemy.schema import CreateColumn
+
+from jobless.counters import (
+    APPLICATION_COUNTERS,
+    count_applications,
+    create_application_counters,
+)
+from jobless.fts import create_application_search, create_substring_indexes
+from jobless.models import Base
+
+# Rows updated per transaction by `backfill`. Small enough that the write
+# lock is only held for a moment, so other commands can still get through.
+BACKFILL_CHUNK_SIZE = 5000
+
+
+@dataclass(frozen=True, slots=True)
+class Migration:
+    version: int
+    description: str
+    upgrade: Callable[[Connection], None]
+    # Whether upgrading announces it. Steps that leave existing data as it
+    # was, and only matter to jobless itself, go unmentioned.
+    announce: bool = True
+
+
+def _ensure_progress_table(connection: Connection) -> None:
+    connection.exec_driver_sql(
+        "CREATE TABLE IF NOT EXISTS migration_progress "
+        "(name TEXT PRIMARY KEY, last_id INTEGER NOT NULL)"
+    )
+
+
+def create_indexes(connection: Connection, *names: str) -> None:
+    """
+    Create the named indexes, as declared on the models, unless they exist.
+    """
+    indexes: dict[str | None, Index] = {
+        index.name: index
+        for table in Base.metadata.tables.values()
+        for index in table.indexes
+    }
+
+    for name in names:
+        indexes[name].create(connection, checkfirst=True)
+        connection.commit()
+
+
+def add_column(connection: Connection, table: str, column: str) -> None:
+    """
+    Add a column, as declared on the models, unless the table already has it.
+    """
+    existing = {
+        row.name for row in connection.exec_driver_sql(f"PRAGMA table_info({table})")
+    }
+    if column in existing:
+        return
+
+    ddl = CreateColumn(Base.metadata.tables[table].c[column])
+    connection.exec_driver_sql(
+        f"ALTER TABLE {table} ADD COLUMN {ddl.compile(dialect=connection.dialect)}"
+    )
+    connection.commit()
+
+
+def backfill(
+    connection: Connection,
+    name: str,
+    table: str,
+    assignments: str,
+    chunk_size: int = BACKFILL_CHUNK_SIZE,
+) -> None:
+    """
+    Run `UPDATE <table> SET <assignments>` over the whole table in chunks.
+
+    Every chunk is committed along with how far it got, so an interrupted
+    backfill picks up from there the next time it runs.
+    """
+    _ensure_progress_table(connection)
+    last_id = connection.exec_driver_sql(
+        "SELECT last_id FROM migration_progress WHERE name = ?",
+        (name,),
+    ).scalar_one_or_none()
+    last_id = last_id or 0
+
+    while True:
+        upper_id = connection.exec_driver_sql(
+            f"SELECT id FROM {table} WHERE id > ? ORDER BY id LIMIT 1 OFFSET ?",
+            (last_id, chunk_size - 1),
+        ).scalar_one_or_none()
+        if upper_id is None:
+            upper_id = connection.exec_driver_sql(
+                f"SELECT max(id) FROM {table}"
+            ).scalar_one()
+
+        if upper_id is None or upper_id <= last_id:
+            break
+
+        connection.exec_driver_sql(
+            f"UPDATE {table} SET {assignments} WHERE id > ? AND id <= ?",
+            (last_id, upper_id),
+        )
+        connection.exec_driver_sql(
+            "INSERT INTO migration_progress (name, last_id) VALUES (?, ?) "
+            "ON CONFLICT (name) DO UPDATE SET last_id = excluded.last_id",
+            (name, upper_id),
+        )
+        connection.commit()
+        last_id = upper_id
+
+    connection.exec_driver_sql(
+        "DELETE FROM migration_progress WHERE name = ?",
+        (name,),
+    )
+
+    # Once nothing is left to resume, the schema is the same as a new one's.
+    if not connection.exec_driver_sql(
+        "SELECT count(*) FROM migration_progress"
+    ).scalar_one():
+        connection.exec_driver_sql("DROP TABLE migration_progress")
+
+    connection.commit()
+
+
+def _baseline(connection: Connection) -> None:
+    Base.metadata.create_all(connection)
+
+
+def _add_application_indexes(connection: Connection) -> None:
+    create_indexes(
+        connection,
+        "ix_applications_status_created_at",
+        "ix_applications_company_id_created_at",
+        "ix_applications_created_at",
+        "ix_applications_last_updated",
+        "ix_applications_location_type",
+        "ix_applications_date_applied",
+        "ix_applications_follow_up_date",
+        "ix_application_skill_link_skill_id",
+        "ix_application_contact_link_contact_id",
+    )
+
+    # Superseded by ix_applications_status_created_at.
+    connection.exec_driver_sql("DROP INDEX IF EXISTS ix_applications_status")
+    connection.commit()
+
+
+def _add_application_counts(connection: Connection) -> None:
+    for table in APPLICATION_COUNTERS:
+        add_column(connection, table, "application_count")
+
+    create_indexes(
+        connection,
+        *(f"ix_{table}_application_count" for table in APPLICATION_COUNTERS),
+    )
+
+    # Triggers go first, so rows that change during the backfill stay exact.
+    create_application_counters(connection)
+    connection.commit()
+
+    for table in APPLICATION_COUNTERS:
+        backfill(
+            connection,
+            f"{table}.application_count",
+            table,
+            count_applications(table),
+        )
+
+
+# Ordered by version. A database's `PRAGMA user_version` is the last one it
+# went through. Steps must be safe to run again, since a migration that gets
+# interrupted is started over (backfills resume on their own). New databases
+# get the models' schema straight away and skip them all.
+MIGRATIONS: list[Migration] = [
+    Migration(1, "baseline schema", _baseline, announce=False),
+    Migration(2, "full-text search over applications", create_application_search),
+    Migration(
+        3, "indexes for filtering and sorting applications", _add_application_indexes
+    ),
+    Migration(4, "indexes for substring filters", create_substring_indexes),
+    Migration(5, "application counts", _add_application_counts),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def pending_migrations(version: int) -> list[Migration]:
+    return [m for m in MIGRATIONS if m.version > version]
+
+
+def migrate(
+    connection: Connection,
+    version: int,
+    on_migration: Callable[[Migration], None] | None = None,
+) -> None:
+    """
+    Bring a database at schema `version` up to date, one migration at a time.
+    """
+    for migration in pending_migrations(version):
+        if on_migration and migration.announce:
+            on_migration(migration)
+
+        migration.upgrade(connection)
+        connection.exec_driver_sql(f"PRAGMA user_version = {migration.version}")
+        connection.commit()
@@ -1,6 +1,6 @@
 from datetime import date, datetime
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, String, Table, func
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, String, Table, func
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -28,6 +28,8 @@ application_skill_link = Table(
         ForeignKey("skills.id", ondelete="CASCADE"),
         primary_key=True,
     ),
+    # The primary key only helps going from applications to skills.
+    Index("ix_application_skill_link_skill_id", "skill_id", "application_id"),
 )
 
 application_contact_link = Table(
@@ -43,6 +45,7 @@ application_contact_link = Table(
         ForeignKey("contacts.id", ondelete="CASCADE"),
         primary_key=True,
     ),
+    Index("ix_application_contact_link_contact_id", "contact_id", "application_id"),
 )
 
 
@@ -58,19 +61,31 @@ class TimestampMixin:
     )
 
 
-class Company(Base, TimestampMixin):
+class ApplicationCountMixin:
+    # Maintained by triggers, see `jobless.counters`.
+    application_count: Mapped[int] = mapped_column(
+        default=0,
+        server_default="0",
+        index=True,
+    )
+
+
+class Company(Base, TimestampMixin, ApplicationCountMixin):
     __tablename__ = "companies"
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String, index=True, unique=True)
     url: Mapped[str | None] = mapped_column(String, unique=True)
     industry: Mapped[str | None] = mapped_column(String)
+    # Deleting is left to the foreign keys' ON DELETE CASCADE, so the
+    # applications (and their links) aren't loaded just to be deleted.
     applications: Mapped[list[Application]] = relationship(
         back_populates="company",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
-class Skill(Base, TimestampMixin):
+class Skill(Base, TimestampMixin, ApplicationCountMixin):
     __tablename__ = "skills"
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(
@@ -81,10 +96,11 @@ class Skill(Base, TimestampMixin):
     applications: Mapped[list[Application]] = relationship(
         secondary=application_skill_link,
         back_populates="skills",
+        passive_deletes=True,
     )
 
 
-class Contact(Base, TimestampMixin):
+class Contact(Base, TimestampMixin, ApplicationCountMixin):
     __tablename__ = "contacts"
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String, index=True)
@@ -94,11 +110,20 @@ class Contact(Base, TimestampMixin):
     applications: Mapped[list["Application"]] = relationship(
         secondary=application_contact_link,
         back_populates="contacts",
+        passive_deletes=True,
     )
 
 
 class Application(Base, TimestampMixin):
     __tablename__ = "applications"
+    __table_args__ = (
+        # Listing by status or company comes sorted by creation date by default.
+        # These also serve plain lookups by status and company.
+        Index("ix_applications_status_created_at", "status", "created_at"),
+        Index("ix_applications_company_id_created_at", "company_id", "created_at"),
+        Index("ix_applications_created_at", "created_at"),
+        Index("ix_applications_last_updated", "last_updated"),
+    )
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String, index=True)
     description: Mapped[str | None] = mapped_column(String)
@@ -107,14 +132,14 @@ class Application(Base, TimestampMixin):
     location_type: Mapped[Location] = mapped_column(
         Enum(Location),
         default=Location.ON_SITE,
+        index=True,
     )
     status: Mapped[Status] = mapped_column(
         Enum(Status),
         default=Status.SAVED,
-        index=True,
     )
-    date_applied: Mapped[date | None] = mapped_column()
-    follow_up_date: Mapped[date | None] = mapped_column()
+    date_applied: Mapped[date | None] = mapped_column(index=True)
+    follow_up_date: Mapped[date | None] = mapped_column(index=True)
     notes: Mapped[str | None] = mapped_column(String)
     company_id: Mapped[int] = mapped_column(
         ForeignKey(
@@ -126,8 +151,10 @@ class Application(Base, TimestampMixin):
     contacts: Mapped[list[Contact]] = relationship(
         secondary=application_contact_link,
         back_populates="applications",
+        passive_deletes=True,
     )
     skills: Mapped[list[Skill]] = relationship(
         secondary=application_skill_link,
         back_populates="applications",
+        passive_deletes=True,
     )
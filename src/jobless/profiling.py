@@ -0,0 +1,121 @@
+import cProfile
+import pstats
+import time
+from datetime import datetime
+from pathlib import Path
+
+from jobless.constants import APP_DIR
+
+PROFILES_DIR = APP_DIR / "profiles"
+
+# A function's own time is counted towards the first phase with a marker in
+# its file path (or, for builtins, its name), and imports are "startup".
+# Anything else, like `isinstance` or typing internals, counts towards what its
+# callers were doing, which leaves the command's own code and the CLI
+# framework as "other".
+PHASE_MARKERS: dict[str, tuple[str, ...]] = {
+    "sql": ("/sqlalchemy/", "sqlite3"),
+    "mapping": ("/jobless/mapper.py", "/jobless/schemas.py", "/email_validator/"),
+    "rendering": ("/rich/", "/jobless/commands/utils.py"),
+}
+
+Function = tuple[str, int, str]
+
+
+def phase_of(filename: str, function: str) -> str | None:
+    if function == "<module>" or filename.startswith("<frozen importlib"):
+        return "startup"
+
+    # cProfile reports builtins, like sqlite3's C methods, with a "~" file.
+    location = function if filename == "~" else filename.replace("\\", "/")
+    for phase, markers in PHASE_MARKERS.items():
+        if any(marker in location for marker in markers):
+            return phase
+
+    return None
+
+
+def _phase_shares(stats: dict, function: Function, cache: dict) -> dict[str, float]:
+    if function in cache:
+        return cache[function]
+
+    filename, _, name = function
+    phase = phase_of(filename, name)
+    if phase:
+        cache[function] = {phase: 1.0}
+        return cache[function]
+
+    # Break cycles in the call graph.
+    cache[function] = {"other": 1.0}
+
+    callers = stats[function][4]
+    weights = {caller: timing[3] or timing[0] for caller, timing in callers.items()}
+    total = sum(weights.values())
+    if not total:
+        return cache[function]
+
+    shares: dict[str, float] = {}
+    for caller, weight in weights.items():
+        for phase, share in _phase_shares(stats, caller, cache).items():
+            shares[phase] = shares.get(phase, 0.0) + share * weight / total
+
+    cache[function] = shares
+    return shares
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self._profile = cProfile.Profile()
+        self._started = 0.0
+        self.elapsed = 0.0
+        # CPU time the process spent before profiling started, i.e. starting
+        # the interpreter and importing the CLI, when it's worth reporting.
+        self.before: float | None = None
+
+    def start(self, since_process_start: bool = False) -> None:
+        if since_process_start:
+            self.before = time.process_time()
+
+        self._started = time.perf_counter()
+        self._profile.enable()
+
+    def stop(self) -> None:
+        self._profile.disable()
+        self.elapsed = time.perf_counter() - self._started
+
+    def phases(self) -> dict[str, float]:
+        totals = dict.fromkeys(["startup", *PHASE_MARKERS, "other"], 0.0)
+
+        stats = pstats.Stats(self._profile).stats
+        cache: dict[Function, dict[str, float]] = {}
+        for function, (_, _, tottime, _, _) in stats.items():
+            for phase, share in _phase_shares(stats, function, cache).items():
+                totals[phase] += tottime * share
+
+        return totals
+
+    def report(self) -> str:
+        phases = self.phases()
+        profiled = sum(phases.values()) or 1.0
+
+        header = f"Profiled {self.elapsed:.3f}s"
+        if self.before is not None:
+            header += f", after {self.before:.3f}s starting Python and the CLI"
+
+        lines = [f"{header}:"]
+        for phase, seconds in phases.items():
+            lines.append(
+                f"  {phase:<10} {seconds:8.3f}s {seconds / profiled:6.1%}",
+            )
+
+        return "\n".join(lines)
+
+    def save(self, directory: Path = PROFILES_DIR) -> Path:
+        """
+        Write the raw stats, readable with `python -m pstats` or snakeviz.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{datetime.now():%Y%m%d-%H%M%S-%f}.pstats"
+        self._profile.dump_stats(path)
+
+        return path
@@ -1,5 +1,37 @@
-from sqlalchemy import and_, func, select
-from sqlalchemy.orm import Session, joinedload, selectinload
+import base64
+import json
+from collections import defaultdict
+from collections.abc import Callable, Iterator, Sequence
+from itertools import batched, product
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    column,
+    delete,
+    func,
+    literal_column,
+    select,
+    table,
+    text,
+    tuple_,
+    type_coerce,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    Session,
+    contains_eager,
+    joinedload,
+    selectinload,
+)
+from sqlalchemy.sql.expression import Join, Update
+from sqlalchemy.types import NullType
 
 from jobless import models, schemas
 from jobless.enums import (
@@ -12,6 +44,316 @@ from jobless.enums import (
 from jobless.mapper import Mapper
 
 
+class _CrossJoin(Join):
+    """
+    Inner join that SQLite won't reorder, so the left table is walked first.
+
+    Without statistics, SQLite prefers scanning and sorting every application
+    over walking companies by name when there's a LIMIT.
+    """
+
+    inherit_cache = True
+
+
+@compiles(_CrossJoin, "sqlite")
+def _compile_cross_join(join: _CrossJoin, compiler, **kw) -> str:
+    # Same as `compiler.visit_join`, with the join's own keyword swapped, so
+    # nested joins and aliases on either side are left as they are.
+    kw.pop("asfrom", None)
+    from_linter = kw.get("from_linter")
+    if from_linter:
+        from_linter.edges.update(
+            product(join.left._from_objects, join.right._from_objects)
+        )
+
+    return (
+        join.left._compiler_dispatch(compiler, asfrom=True, **kw)
+        + " CROSS JOIN "
+        + join.right._compiler_dispatch(compiler, asfrom=True, **kw)
+        + " ON "
+        + join.onclause._compiler_dispatch(compiler, **kw)
+    )
+
+
+def _containing(attribute: InstrumentedAttribute, term: str) -> Select:
+    """
+    Select the ids of rows where `attribute` contains `term`, ignoring case.
+
+    It's the same as `ILIKE '%term%'`, but answered by the table's trigram
+    index (see `jobless.fts`) instead of scanning every row. Terms shorter
+    than a trigram can't use it, so those are matched against the table.
+    """
+    expression = attribute.expression
+    if len(term) < 3:
+        return select(expression.table.c.id).where(attribute.ilike(f"%{term}%"))
+
+    index = table(
+        f"{expression.table.name}_trgm",
+        column("rowid"),
+        column(expression.name),
+    )
+    return select(index.c.rowid).where(index.c[expression.name].like(f"%{term}%"))
+
+
+def _with_all_skills(names: list[str]) -> Select:
+    """
+    Select the ids of applications linked to every skill in `names`.
+
+    Each skill's links are read from the link table's skill index, and an
+    application is kept if it showed up once for each of them.
+    """
+    unique = set(names)
+    link = models.application_skill_link
+    return (
+        select(link.c.application_id)
+        .join(models.Skill, models.Skill.id == link.c.skill_id)
+        .where(models.Skill.name.in_(unique))
+        .group_by(link.c.application_id)
+        .having(func.count() == len(unique))
+    )
+
+
+def _with_contact(f: schemas.ApplicationFilter) -> Select:
+    """
+    Select the ids of applications linked to a contact matching the filter.
+
+    Links are read from the contact side of the link table, so only the
+    matching contacts' applications are looked at. An EXISTS per application
+    would check every application, since SQLite can't start from it.
+    """
+    link = models.application_contact_link
+    stmt = select(link.c.application_id)
+
+    if f.contact_id:
+        stmt = stmt.where(link.c.contact_id == f.contact_id)
+
+    for attribute, term in [
+        (models.Contact.name, f.contact_name),
+        (models.Contact.email, f.contact_email),
+        (models.Contact.url, f.contact_url),
+    ]:
+        if term:
+            stmt = stmt.where(link.c.contact_id.in_(_containing(attribute, term)))
+
+    return stmt
+
+
+# Names or ids per statement when working on many rows at once, well under
+# SQLite's limit on bound parameters.
+IN_CHUNK_SIZE = 500
+
+
+def _get_or_create_many[M: (models.Company, models.Skill)](
+    session: Session,
+    model: type[M],
+    names: list[str],
+) -> list[M]:
+    """
+    Return the rows with these names, without repeats and in the order given,
+    inserting the missing ones. Each chunk of names takes one INSERT that
+    skips existing names and one SELECT, however many names it has.
+    """
+    unique = list(dict.fromkeys(names))
+    by_name: dict[str, M] = {}
+
+    for chunk in batched(unique, IN_CHUNK_SIZE):
+        session.execute(
+            insert(model)
+            .values([{"name": name} for name in chunk])
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+        instances = session.scalars(select(model).where(model.name.in_(chunk)))
+        by_name.update((instance.name, instance) for instance in instances)
+
+    return [by_name[name] for name in unique]
+
+
+def _get_many[M: (models.Company, models.Contact, models.Skill)](
+    session: Session,
+    model: type[M],
+    ids: list[int],
+) -> list[M]:
+    """
+    Return the rows with these ids, in the order given, skipping missing ones.
+    """
+    unique = list(dict.fromkeys(ids))
+    by_id: dict[int, M] = {}
+
+    for chunk in batched(unique, IN_CHUNK_SIZE):
+        instances = session.scalars(select(model).where(model.id.in_(chunk)))
+        by_id.update((instance.id, instance) for instance in instances)
+
+    return [by_id[id] for id in unique if id in by_id]
+
+
+def _chunks_by_id(
+    session: Session,
+    stmt: Select,
+    id_column: InstrumentedAttribute[int],
+    first_id: int | None,
+    last_id: int | None,
+    chunk_size: int,
+) -> Iterator[Sequence[Row]]:
+    """
+    Run `stmt`, which has to select `id_column` first, in id order a chunk at
+    a time, optionally only for ids from `first_id` to `last_id`. Each chunk
+    is a separate query starting after the last id read, so memory use stays
+    flat and every chunk takes an index seek, however far in it is.
+    """
+    if first_id is not None:
+        stmt = stmt.where(id_column >= first_id)
+
+    if last_id is not None:
+        stmt = stmt.where(id_column <= last_id)
+
+    stmt = stmt.order_by(id_column).limit(chunk_size)
+    chunk = session.execute(stmt).all()
+    while chunk:
+        yield chunk
+
+        if len(chunk) < chunk_size:
+            break
+
+        chunk = session.execute(stmt.where(id_column > chunk[-1][0])).all()
+
+
+def _delete_many(session: Session, model: type[models.Base], ids: list[int]) -> int:
+    """
+    Delete the rows with these ids with a DELETE per chunk, without loading
+    them. Links, and a company's applications, go with them through their
+    foreign keys. Returns the number of rows deleted.
+    """
+    deleted = 0
+    for chunk in batched(set(ids), IN_CHUNK_SIZE):
+        result = session.execute(delete(model).where(model.id.in_(chunk)))
+        deleted += result.rowcount
+
+    return deleted
+
+
+def _fts_query(query: str) -> str:
+    """
+    Turn user input into an FTS5 query matching rows with every word in it.
+
+    Words are quoted so characters like '-' or ':' aren't taken as query
+    syntax, while a trailing '*' still matches any word starting with it.
+    """
+    terms = []
+    for word in query.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*").replace('"', '""')
+        if word:
+            terms.append(f'"{word}"*' if prefix else f'"{word}"')
+
+    return " ".join(terms)
+
+
+def _order_by(stmt: Select, columns: list, order: SortOrder) -> Select:
+    return stmt.order_by(
+        *(c.desc() if order == SortOrder.DESC else c.asc() for c in columns)
+    )
+
+
+def _raw(column) -> ColumnElement:
+    # Dates, timestamps and enums are compared and returned as SQLite stores
+    # them, so cursors hold plain JSON values that sort the same way.
+    return type_coerce(column, NullType())
+
+
+def _encode_cursor(f, values: tuple) -> str:
+    payload = json.dumps([f.sort_by.value, f.sort_order.value, list(values)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, f, size: int) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_by, sort_order, values = json.loads(base64.urlsafe_b64decode(padded))
+    except ValueError, TypeError:
+        raise ValueError("invalid cursor")
+
+    if (sort_by, sort_order) != (f.sort_by.value, f.sort_order.value):
+        raise ValueError("cursor doesn't match the sort options")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("invalid cursor")
+
+    return values
+
+
+def _after(columns: list, values: list, order: SortOrder) -> list[ColumnElement]:
+    """
+    Conditions matching the rows sorted after `values`, in order.
+
+    Only the first column can be NULL, and SQLite sorts NULLs first. Row
+    values can't compare them, so those rows get their own condition, which
+    leaves each one a single range of the sort index to seek to.
+    """
+    first, *rest = (_raw(c) for c in columns)
+    value, *rest_values = values
+    nullable = getattr(columns[0].expression, "nullable", False)
+
+    if order == SortOrder.DESC:
+        if value is None:
+            return [and_(first.is_(None), tuple_(*rest) < tuple_(*rest_values))]
+
+        after = [tuple_(first, *rest) < tuple_(value, *rest_values)]
+        return [*after, first.is_(None)] if nullable else after
+
+    if value is None:
+        return [
+            and_(first.is_(None), tuple_(*rest) > tuple_(*rest_values)),
+            first.is_not(None),
+        ]
+
+    return [tuple_(first, *rest) > tuple_(value, *rest_values)]
+
+
+def _page[T](
+    session: Session,
+    stmt: Select,
+    columns: list,
+    f,
+    after: str | None,
+    to_schema: Callable[..., T],
+) -> schemas.Page[T]:
+    """
+    Fetch the `f.limit` rows of an ordered `stmt` that follow the `after`
+    cursor, seeking past the previous pages instead of skipping them.
+    """
+    assert f.limit
+
+    conditions = (
+        _after(columns, _decode_cursor(after, f, len(columns)), f.sort_order)
+        if after
+        else [None]
+    )
+
+    stmt = stmt.add_columns(
+        *(_raw(c).label(f"cursor_{i}") for i, c in enumerate(columns))
+    )
+    rows = []
+    for condition in conditions:
+        query = stmt
+        if condition is not None:
+            query = query.where(condition)
+
+        rows += session.execute(query.limit(f.limit + 1 - len(rows))).all()
+        if len(rows) > f.limit:
+            break
+
+    # One extra row is fetched to know whether there's a next page.
+    next_cursor = None
+    if len(rows) > f.limit:
+        rows = rows[: f.limit]
+        next_cursor = _encode_cursor(f, tuple(rows[-1][-len(columns) :]))
+
+    return schemas.Page(
+        items=[to_schema(*row[: -len(columns)]) for row in rows],
+        next_cursor=next_cursor,
+    )
+
+
 class ApplicationRepository:
     def __init__(self, session: Session, mapper: Mapper) -> None:
         self._session = session
@@ -58,19 +400,88 @@ class ApplicationRepository:
         self._session.flush()
         return self._mapper.application_model_to_schema(application)
 
+    def add_many(self, apps: list[schemas.Application]) -> list[int]:
+        """
+        Insert applications whose company, skills and contacts already exist,
+        and return their ids in the order given. The applications and each
+        kind of link go in with one executemany INSERT.
+
+        The session's transaction has to hold the write lock already, like
+        the ones of `AppContext.batch` do.
+        """
+        if not apps:
+            return []
+
+        # SQLite doesn't promise RETURNING comes back in the order rows were
+        # given, so hand out ids after the current last one. Only one writer
+        # can hold the database, and this one has since its transaction
+        # began, so nobody else can take them meanwhile.
+        last_id = self._session.scalar(select(func.max(models.Application.id)))
+        ids = list(range((last_id or 0) + 1, (last_id or 0) + len(apps) + 1))
+
+        self._session.execute(
+            insert(models.Application),
+            [
+                {
+                    "id": id,
+                    "title": app.title,
+                    "description": app.description,
+                    "salary": app.salary,
+                    "url": app.url,
+                    "location_type": app.location_type,
+                    "status": app.status,
+                    "date_applied": app.date_applied,
+                    "follow_up_date": app.follow_up_date,
+                    "notes": app.notes,
+                    "company_id": app.company.id,
+                }
+                for id, app in zip(ids, apps)
+            ],
+            # Keep every row's columns the same, so they all go in one batch.
+            execution_options={"render_nulls": True},
+        )
+
+        for link, key, related in [
+            (models.application_skill_link, "skill_id", "skills"),
+            (models.application_contact_link, "contact_id", "contacts"),
+        ]:
+            rows = [
+                {"application_id": id, key: related_id}
+                for id, app in zip(ids, apps)
+                for related_id in dict.fromkeys(r.id for r in getattr(app, related))
+            ]
+            if rows:
+                self._session.execute(insert(link), rows)
+
+        return ids
+
     def get(self, id: int) -> schemas.Application | None:
         instance = self._get(id)
         return self._mapper.application_model_to_schema(instance) if instance else None
 
-    def filter(self, f: schemas.ApplicationFilter) -> list[schemas.Application]:
-        stmt = select(models.Application).options(
-            joinedload(models.Application.company),
-            selectinload(models.Application.skills),
-            selectinload(models.Application.contacts),
-        )
+    def get_summaries(self, ids: list[int]) -> list[schemas.ApplicationSummary]:
+        """
+        Return summaries of the applications with these ids, in the order
+        given, skipping missing ones.
+        """
+        unique = list(dict.fromkeys(ids))
+        by_id: dict[int, schemas.ApplicationSummary] = {}
+
+        for chunk in batched(unique, IN_CHUNK_SIZE):
+            stmt, _ = self._statement(schemas.ApplicationFilter(), summary=True)
+            rows = self._session.execute(stmt.where(models.Application.id.in_(chunk)))
+            by_id.update((row.id, self._summary(*row)) for row in rows)
+
+        return [by_id[id] for id in unique if id in by_id]
 
+    @staticmethod
+    def _where[S: (Select, Update)](stmt: S, f: schemas.ApplicationFilter) -> S:
         if f.title:
-            stmt = stmt.where(models.Application.title.ilike(f"%{f.title}%"))
+            stmt = stmt.where(
+                models.Application.id.in_(
+                    _containing(models.Application.title, f.title)
+                )
+            )
 
         if f.statuses:
             stmt = stmt.where(models.Application.status.in_(f.statuses))
@@ -81,10 +492,15 @@ class ApplicationRepository:
         if f.company_id:
             stmt = stmt.where(models.Application.company_id == f.company_id)
         elif f.company_name:
-            stmt = stmt.join(models.Application.company).where(
-                models.Company.name.ilike(f"%{f.company_name}%")
+            stmt = stmt.where(
+                models.Application.company_id.in_(
+                    _containing(models.Company.name, f.company_name)
+                )
             )
 
+        if f.contact_id or f.contact_name or f.contact_email or f.contact_url:
+            stmt = stmt.where(models.Application.id.in_(_with_contact(f)))
+
         if f.applied_after:
             stmt = stmt.where(models.Application.date_applied >= f.applied_after)
 
@@ -101,40 +517,357 @@ class ApplicationRepository:
                 models.Application.follow_up_date <= f.follow_up_date_before
             )
 
-        if f.skills:
+        if f.skills and f.all_skills:
+            stmt = stmt.where(models.Application.id.in_(_with_all_skills(f.skills)))
+        elif f.skills:
             stmt = stmt.where(
                 models.Application.skills.any(models.Skill.name.in_(f.skills))
             )
 
+        return stmt
+
+    @staticmethod
+    def _sort(stmt: Select, f: schemas.ApplicationFilter) -> tuple[Select, list]:
+        """
+        Order `stmt` by the sort field, breaking ties by id, and return the
+        columns it's ordered by.
+        """
         match f.sort_by:
             case ApplicationSortField.TITLE:
-                sort_col = models.Application.title
+                sort_cols = [models.Application.title]
             case ApplicationSortField.COMPANY:
-                stmt = stmt.join(models.Application.company)
-                sort_col = models.Company.name
+                stmt = stmt.select_from(
+                    _CrossJoin(
+                        models.Company.__table__,
+                        models.Application.__table__,
+                        models.Company.id == models.Application.company_id,
+                    )
+                )
+                # Each company's applications come from the company index.
+                sort_cols = [models.Company.name, models.Application.created_at]
             case ApplicationSortField.STATUS:
-                sort_col = models.Application.status
+                sort_cols = [models.Application.status, models.Application.created_at]
             case ApplicationSortField.LOCATION_TYPE:
-                sort_col = models.Application.location_type
+                sort_cols = [models.Application.location_type]
             case ApplicationSortField.FOLLOW_UP_DATE:
-                sort_col = models.Application.follow_up_date
+                sort_cols = [models.Application.follow_up_date]
             case ApplicationSortField.CREATED:
-                sort_col = models.Application.created_at
+                sort_cols = [models.Application.created_at]
             case ApplicationSortField.UPDATED:
-                sort_col = models.Application.last_updated
+                sort_cols = [models.Application.last_updated]
             case _:
-                sort_col = models.Application.date_applied
+                sort_cols = [models.Application.date_applied]
+
+        columns = [*sort_cols, models.Application.id]
+        return _order_by(stmt, columns, f.sort_order), columns
+
+    def _statement(
+        self,
+        f: schemas.ApplicationFilter,
+        summary: bool = False,
+    ) -> tuple[Select, list]:
+        # Sorting by company already joins it, and joining it twice keeps
+        # SQLite from walking the company name index to sort.
+        sorted_by_company = f.sort_by == ApplicationSortField.COMPANY
+
+        if summary:
+            stmt = select(
+                models.Application.id,
+                models.Application.title,
+                models.Company.name,
+                models.Application.status,
+                models.Application.date_applied,
+                models.Application.follow_up_date,
+            )
+            if not sorted_by_company:
+                stmt = stmt.join(models.Application.company)
+        else:
+            stmt = select(models.Application).options(
+                contains_eager(models.Application.company)
+                if sorted_by_company
+                else joinedload(models.Application.company),
+                selectinload(models.Application.skills),
+                selectinload(models.Application.contacts),
+            )
 
-        stmt = stmt.order_by(
-            sort_col.desc() if f.sort_order == SortOrder.DESC else sort_col.asc()
+        return self._sort(self._where(stmt, f), f)
+
+    @staticmethod
+    def _summary(
+        id, title, company_name, status, date_applied, follow_up_date
+    ) -> schemas.ApplicationSummary:
+        return schemas.ApplicationSummary(
+            id=id,
+            title=title,
+            company_name=company_name,
+            status=status,
+            date_applied=date_applied,
+            follow_up_date=follow_up_date,
         )
 
+    def filter(self, f: schemas.ApplicationFilter) -> list[schemas.Application]:
+        stmt, _ = self._statement(f)
+
         if f.limit is not None:
             stmt = stmt.limit(f.limit)
 
         instances = self._session.scalars(stmt).unique().all()
         return [self._mapper.application_model_to_schema(i) for i in instances]
 
+    def count(self, f: schemas.ApplicationFilter) -> int:
+        """
+        Count the applications matching the filter, ignoring its sort and limit.
+        """
+        stmt = select(func.count()).select_from(models.Application)
+        return self._session.scalar(self._where(stmt, f))
+
+    def iter_filter(
+        self,
+        f: schemas.ApplicationFilter,
+        chunk_size: int = 500,
+    ) -> Iterator[schemas.Application]:
+        """
+        Like `filter`, but yields applications as they're read, `chunk_size`
+        rows at a time, so memory use doesn't grow with the number of results.
+        Skills and contacts are loaded for each chunk.
+        """
+        stmt, _ = self._statement(f)
+
+        if f.limit is not None:
+            stmt = stmt.limit(f.limit)
+
+        result = self._session.scalars(stmt.execution_options(yield_per=chunk_size))
+        for instances in result.partitions():
+            for instance in instances:
+                yield self._mapper.application_model_to_schema(instance)
+
+    def iter_by_id(
+        self,
+        first_id: int | None = None,
+        last_id: int | None = None,
+        chunk_size: int = 500,
+    ) -> Iterator[schemas.Application]:
+        """
+        Yield applications in id order, optionally only those with ids from
+        `first_id` to `last_id`, `chunk_size` at a time. Rows are read as
+        plain tuples instead of ORM objects, which is several times faster
+        when going through all of them.
+        """
+        stmt = select(
+            models.Application.id,
+            models.Application.title,
+            models.Application.description,
+            models.Application.salary,
+            models.Application.url,
+            models.Application.location_type,
+            models.Application.status,
+            models.Application.date_applied,
+            models.Application.follow_up_date,
+            models.Application.notes,
+            models.Company.id,
+            models.Company.name,
+            models.Company.url,
+            models.Company.industry,
+        ).join(models.Application.company)
+
+        for chunk in _chunks_by_id(
+            self._session,
+            stmt,
+            models.Application.id,
+            first_id,
+            last_id,
+            chunk_size,
+        ):
+            ids = [row[0] for row in chunk]
+            skills, contacts = self._linked(ids)
+
+            for (
+                id,
+                title,
+                description,
+                salary,
+                url,
+                location_type,
+                status,
+                date_applied,
+                follow_up_date,
+                notes,
+                company_id,
+                company_name,
+                company_url,
+                company_industry,
+            ) in chunk:
+                yield schemas.Application(
+                    id=id,
+                    title=title,
+                    description=description,
+                    salary=salary,
+                    url=url,
+                    location_type=location_type,
+                    status=status,
+                    date_applied=date_applied,
+                    follow_up_date=follow_up_date,
+                    notes=notes,
+                    company=schemas.Company(
+                        id=company_id,
+                        name=company_name,
+                        url=company_url,
+                        industry=company_industry,
+                    ),
+                    skills=skills[id],
+                    contacts=contacts[id],
+                )
+
+    def _linked(
+        self,
+        ids: list[int],
+    ) -> tuple[
+        defaultdict[int, list[schemas.Skill]],
+        defaultdict[int, list[schemas.Contact]],
+    ]:
+        """
+        Return the skills and contacts of these applications by their id.
+        """
+        link = models.application_skill_link
+        skills: defaultdict[int, list[schemas.Skill]] = defaultdict(list)
+        for application_id, id, name in self._session.execute(
+            select(link.c.application_id, models.Skill.id, models.Skill.name)
+            .join(models.Skill, models.Skill.id == link.c.skill_id)
+            .where(link.c.application_id.in_(ids))
+        ):
+            skills[application_id].append(schemas.Skill(id=id, name=name))
+
+        link = models.application_contact_link
+        contacts: defaultdict[int, list[schemas.Contact]] = defaultdict(list)
+        for application_id, id, name, email, phone, url in self._session.execute(
+            select(
+                link.c.application_id,
+                models.Contact.id,
+                models.Contact.name,
+                models.Contact.email,
+                models.Contact.phone,
+                models.Contact.url,
+            )
+            .join(models.Contact, models.Contact.id == link.c.contact_id)
+            .where(link.c.application_id.in_(ids))
+        ):
+            contacts[application_id].append(
+                schemas.Contact(id=id, name=name, email=email, phone=phone, url=url)
+            )
+
+        return skills, contacts
+
+    def summaries(
+        self,
+        f: schemas.ApplicationFilter,
+        chunk_size: int = 500,
+    ) -> Iterator[schemas.ApplicationSummary]:
+        """
+        Like `iter_filter`, but only reads the columns in a summary, leaving
+        out descriptions, notes, skills and contacts.
+        """
+        stmt, _ = self._statement(f, summary=True)
+
+        if f.limit is not None:
+            stmt = stmt.limit(f.limit)
+
+        for row in self._session.execute(stmt.execution_options(yield_per=chunk_size)):
+            yield self._summary(*row)
+
+    def page(
+        self,
+        f: schemas.ApplicationFilter,
+        after: str | None = None,
+    ) -> schemas.Page[schemas.Application]:
+        """
+        Return the next `f.limit` applications after the `after` cursor, taken
+        from the previous page, or the first ones without it.
+        """
+        stmt, columns = self._statement(f)
+        return _page(
+            self._session,
+            stmt,
+            columns,
+            f,
+            after,
+            self._mapper.application_model_to_schema,
+        )
+
+    def page_summaries(
+        self,
+        f: schemas.ApplicationFilter,
+        after: str | None = None,
+    ) -> schemas.Page[schemas.ApplicationSummary]:
+        """
+        Return a page of summaries, like `page`. Cursors work with either.
+        """
+        stmt, columns = self._statement(f, summary=True)
+        return _page(self._session, stmt, columns, f, after, self._summary)
+
+    def search(
+        self,
+        query: str,
+        f: schemas.ApplicationFilter,
+    ) -> list[schemas.ApplicationMatch]:
+        """
+        Full-text search over title, description, notes and company name,
+        best matches first. The rest of the filter narrows the results, but
+        its sort options are ignored.
+        """
+        match_query = _fts_query(query)
+        if not match_query:
+            return []
+
+        fts = table("applications_fts", column("rowid"), column("rank"))
+        snippet = func.snippet(
+            literal_column("applications_fts"),
+            -1,
+            schemas.MATCH_START,
+            schemas.MATCH_END,
+            "…",
+            12,
+        )
+        matching = self._where(
+            select(models.Application.id).where(models.Application.id == fts.c.rowid),
+            f,
+        )
+
+        # Querying only the index lets FTS5 rank the matches itself and build
+        # snippets for just the ones returned. Joining `applications` here
+        # would mean ranking and making snippets for every match.
+        stmt = (
+            select(fts.c.rowid, snippet)
+            .where(text("applications_fts MATCH :query").bindparams(query=match_query))
+            .where(matching.exists())
+            .order_by(fts.c.rank)
+        )
+
+        if f.limit is not None:
+            stmt = stmt.limit(f.limit)
+
+        snippets = dict(self._session.execute(stmt).tuples().all())
+        if not snippets:
+            return []
+
+        instances = self._session.scalars(
+            select(models.Application)
+            .where(models.Application.id.in_(snippets))
+            .options(
+                joinedload(models.Application.company),
+                selectinload(models.Application.skills),
+                selectinload(models.Application.contacts),
+            )
+        ).unique()
+        by_id = {instance.id: instance for instance in instances}
+
+        return [
+            schemas.ApplicationMatch(
+                application=self._mapper.application_model_to_schema(by_id[id]),
+                snippet=snippet,
+            )
+            for id, snippet in snippets.items()
+        ]
+
     def list(self) -> list[schemas.Application]:
         return self.filter(schemas.ApplicationFilter())
 
@@ -182,11 +915,37 @@ class ApplicationRepository:
         self._session.flush()
         return self._mapper.application_model_to_schema(instance)
 
+    def existing_urls(self, urls: list[str]) -> set[str]:
+        existing: set[str] = set()
+        for chunk in batched(set(urls), IN_CHUNK_SIZE):
+            existing.update(
+                self._session.scalars(
+                    select(models.Application.url).where(
+                        models.Application.url.in_(chunk)
+                    )
+                )
+            )
+
+        return existing
+
+    def update_where(self, f: schemas.ApplicationFilter, values: dict[str, Any]) -> int:
+        """
+        Set `values` on every application matching `f` with a single UPDATE,
+        and return the number of rows updated. Sorting and limits are ignored,
+        and applications already loaded in the session aren't refreshed.
+        """
+        stmt = self._where(update(models.Application), f).values(values)
+        result = self._session.execute(
+            stmt,
+            execution_options={"synchronize_session": False},
+        )
+        return result.rowcount
+
     def delete(self, id: int) -> None:
-        instance = self._get(id)
-        if instance:
-            self._session.delete(instance)
-            self._session.flush()
+        self.delete_many([id])
+
+    def delete_many(self, ids: list[int]) -> int:
+        return _delete_many(self._session, models.Application, ids)
 
 
 class CompanyRepository:
@@ -208,6 +967,10 @@ class CompanyRepository:
 
         return self._mapper.company_model_to_schema(instance)
 
+    def get_or_create_many(self, names: list[str]) -> list[schemas.Company]:
+        instances = _get_or_create_many(self._session, models.Company, names)
+        return [self._mapper.company_model_to_schema(i) for i in instances]
+
     def add(self, schema: schemas.Company) -> schemas.Company:
         company = self._mapper.company_schema_to_model(schema)
         self._session.add(company)
@@ -219,52 +982,82 @@ class CompanyRepository:
         instance = self._get(id)
         return self._mapper.company_model_to_schema(instance) if instance else None
 
-    def filter(self, f: schemas.CompanyFilter) -> list[schemas.Company]:
-        app_count = func.count(models.Application.id).label("app_count")
-        needs_count = (
-            f.min_applications is not None
-            or f.max_applications is not None
-            or f.sort_by == CompanySortField.NUMBER_APPLICATIONS
-        )
-
-        stmt = select(models.Company)
+    def get_many(self, ids: list[int]) -> list[schemas.Company]:
+        instances = _get_many(self._session, models.Company, ids)
+        return [self._mapper.company_model_to_schema(i) for i in instances]
 
-        if needs_count:
-            stmt = stmt.outerjoin(models.Company.applications).group_by(
-                models.Company.id
+    def iter_by_id(
+        self,
+        first_id: int | None = None,
+        last_id: int | None = None,
+        chunk_size: int = 500,
+    ) -> Iterator[schemas.Company]:
+        for chunk in _chunks_by_id(
+            self._session,
+            select(models.Company.id, models.Company),
+            models.Company.id,
+            first_id,
+            last_id,
+            chunk_size,
+        ):
+            for _, instance in chunk:
+                yield self._mapper.company_model_to_schema(instance)
+
+    def application_counts(self, ids: list[int]) -> dict[int, int]:
+        counts: dict[int, int] = {}
+        for chunk in batched(set(ids), IN_CHUNK_SIZE):
+            rows = self._session.execute(
+                select(models.Company.id, models.Company.application_count).where(
+                    models.Company.id.in_(chunk)
+                )
             )
+            counts.update(rows.tuples().all())
+
+        return counts
 
+    @staticmethod
+    def _where(stmt: Select, f: schemas.CompanyFilter) -> Select:
         if f.name:
-            stmt = stmt.where(models.Company.name.ilike(f"%{f.name}%"))
+            stmt = stmt.where(
+                models.Company.id.in_(_containing(models.Company.name, f.name))
+            )
 
         if f.url:
-            stmt = stmt.where(models.Company.url.ilike(f"%{f.url}%"))
+            stmt = stmt.where(
+                models.Company.id.in_(_containing(models.Company.url, f.url))
+            )
 
         if f.industry:
-            stmt = stmt.where(models.Company.industry.ilike(f"%{f.industry}%"))
+            stmt = stmt.where(
+                models.Company.id.in_(_containing(models.Company.industry, f.industry))
+            )
 
-        having_clauses = []
         if f.min_applications is not None:
-            having_clauses.append(app_count >= f.min_applications)
+            stmt = stmt.where(models.Company.application_count >= f.min_applications)
+
         if f.max_applications is not None:
-            having_clauses.append(app_count <= f.max_applications)
+            stmt = stmt.where(models.Company.application_count <= f.max_applications)
+
+        return stmt
 
-        if having_clauses:
-            stmt = stmt.having(and_(*having_clauses))
+    def _statement(self, f: schemas.CompanyFilter) -> tuple[Select, list]:
+        stmt = self._where(select(models.Company), f)
 
         match f.sort_by:
             case CompanySortField.NAME:
-                sort_col = models.Company.name
+                sort_cols = [models.Company.name]
             case CompanySortField.NUMBER_APPLICATIONS:
-                sort_col = app_count
+                sort_cols = [models.Company.application_count]
             case CompanySortField.UPDATED:
-                sort_col = models.Company.last_updated
+                sort_cols = [models.Company.last_updated]
             case _:
-                sort_col = models.Company.created_at
+                sort_cols = [models.Company.created_at]
 
-        stmt = stmt.order_by(
-            sort_col.desc() if f.sort_order == SortOrder.DESC else sort_col.asc()
-        )
+        columns = [*sort_cols, models.Company.id]
+        return _order_by(stmt, columns, f.sort_order), columns
+
+    def filter(self, f: schemas.CompanyFilter) -> list[schemas.Company]:
+        stmt, _ = self._statement(f)
 
         if f.limit is not None:
             stmt = stmt.limit(f.limit)
@@ -272,6 +1065,29 @@ class CompanyRepository:
         instances = self._session.scalars(stmt).unique().all()
         return [self._mapper.company_model_to_schema(i) for i in instances]
 
+    def count(self, f: schemas.CompanyFilter) -> int:
+        stmt = select(func.count()).select_from(models.Company)
+        return self._session.scalar(self._where(stmt, f))
+
+    def page(
+        self,
+        f: schemas.CompanyFilter,
+        after: str | None = None,
+    ) -> schemas.Page[schemas.Company]:
+        """
+        Return the next `f.limit` companies after the `after` cursor, taken
+        from the previous page, or the first ones without it.
+        """
+        stmt, columns = self._statement(f)
+        return _page(
+            self._session,
+            stmt,
+            columns,
+            f,
+            after,
+            self._mapper.company_model_to_schema,
+        )
+
     def list(self) -> list[schemas.Company]:
         return self.filter(schemas.CompanyFilter())
 
@@ -290,10 +1106,10 @@ class CompanyRepository:
         return self._mapper.company_model_to_schema(instance)
 
     def delete(self, id: int) -> None:
-        instance = self._get(id)
-        if instance:
-            self._session.delete(instance)
-            self._session.flush()
+        self.delete_many([id])
+
+    def delete_many(self, ids: list[int]) -> int:
+        return _delete_many(self._session, models.Company, ids)
 
 
 class ContactRepository:
@@ -314,54 +1130,72 @@ class ContactRepository:
         instance = self._get(id)
         return self._mapper.contact_model_to_schema(instance) if instance else None
 
-    def filter(self, f: schemas.ContactFilter) -> list[schemas.Contact]:
-        app_count = func.count(models.Application.id).label("app_count")
-        needs_count = (
-            f.min_applications is not None
-            or f.max_applications is not None
-            or f.sort_by == ContactSortField.NUMBER_APPLICATIONS
-        )
-
-        stmt = select(models.Contact)
-
-        if needs_count:
-            stmt = stmt.outerjoin(models.Contact.applications).group_by(
-                models.Contact.id
-            )
+    def get_many(self, ids: list[int]) -> list[schemas.Contact]:
+        instances = _get_many(self._session, models.Contact, ids)
+        return [self._mapper.contact_model_to_schema(i) for i in instances]
 
+    def iter_by_id(
+        self,
+        first_id: int | None = None,
+        last_id: int | None = None,
+        chunk_size: int = 500,
+    ) -> Iterator[schemas.Contact]:
+        for chunk in _chunks_by_id(
+            self._session,
+            select(models.Contact.id, models.Contact),
+            models.Contact.id,
+            first_id,
+            last_id,
+            chunk_size,
+        ):
+            for _, instance in chunk:
+                yield self._mapper.contact_model_to_schema(instance)
+
+    @staticmethod
+    def _where(stmt: Select, f: schemas.ContactFilter) -> Select:
         if f.name:
-            stmt = stmt.where(models.Contact.name.ilike(f"%{f.name}%"))
+            stmt = stmt.where(
+                models.Contact.id.in_(_containing(models.Contact.name, f.name))
+            )
 
         if f.url:
-            stmt = stmt.where(models.Contact.url.ilike(f"%{f.url}%"))
+            stmt = stmt.where(
+                models.Contact.id.in_(_containing(models.Contact.url, f.url))
+            )
 
         if f.email:
-            stmt = stmt.where(models.Contact.email.ilike(f"%{f.email}%"))
+            stmt = stmt.where(
+                models.Contact.id.in_(_containing(models.Contact.email, f.email))
+            )
 
-        having_clauses = []
         if f.min_applications is not None:
-            having_clauses.append(app_count >= f.min_applications)
+            stmt = stmt.where(models.Contact.application_count >= f.min_applications)
+
         if f.max_applications is not None:
-            having_clauses.append(app_count <= f.max_applications)
+            stmt = stmt.where(models.Contact.application_count <= f.max_applications)
+
+        return stmt
 
-        if having_clauses:
-            stmt = stmt.having(and_(*having_clauses))
+    def _statement(self, f: schemas.ContactFilter) -> tuple[Select, list]:
+        stmt = self._where(select(models.Contact), f)
 
         match f.sort_by:
             case ContactSortField.NAME:
-                sort_col = models.Contact.name
+                sort_cols = [models.Contact.name]
             case ContactSortField.EMAIL:
-                sort_col = models.Contact.email
+                sort_cols = [models.Contact.email]
             case ContactSortField.NUMBER_APPLICATIONS:
-                sort_col = app_count
+                sort_cols = [models.Contact.application_count]
             case ContactSortField.UPDATED:
-                sort_col = models.Contact.last_updated
+                sort_cols = [models.Contact.last_updated]
             case _:
-                sort_col = models.Contact.created_at
+                sort_cols = [models.Contact.created_at]
 
-        stmt = stmt.order_by(
-            sort_col.desc() if f.sort_order == SortOrder.DESC else sort_col.asc()
-        )
+        columns = [*sort_cols, models.Contact.id]
+        return _order_by(stmt, columns, f.sort_order), columns
+
+    def filter(self, f: schemas.ContactFilter) -> list[schemas.Contact]:
+        stmt, _ = self._statement(f)
 
         if f.limit is not None:
             stmt = stmt.limit(f.limit)
@@ -369,6 +1203,29 @@ class ContactRepository:
         instances = self._session.scalars(stmt).unique().all()
         return [self._mapper.contact_model_to_schema(i) for i in instances]
 
+    def count(self, f: schemas.ContactFilter) -> int:
+        stmt = select(func.count()).select_from(models.Contact)
+        return self._session.scalar(self._where(stmt, f))
+
+    def page(
+        self,
+        f: schemas.ContactFilter,
+        after: str | None = None,
+    ) -> schemas.Page[schemas.Contact]:
+        """
+        Return the next `f.limit` contacts after the `after` cursor, taken
+        from the previous page, or the first ones without it.
+        """
+        stmt, columns = self._statement(f)
+        return _page(
+            self._session,
+            stmt,
+            columns,
+            f,
+            after,
+            self._mapper.contact_model_to_schema,
+        )
+
     def list(self) -> list[schemas.Contact]:
         return self.filter(schemas.ContactFilter())
 
@@ -388,10 +1245,10 @@ class ContactRepository:
         return self._mapper.contact_model_to_schema(instance)
 
     def delete(self, id: int) -> None:
-        instance = self._get(id)
-        if instance:
-            self._session.delete(instance)
-            self._session.flush()
+        self.delete_many([id])
+
+    def delete_many(self, ids: list[int]) -> int:
+        return _delete_many(self._session, models.Contact, ids)
 
 
 class SkillRepository:
@@ -406,6 +1263,27 @@ class SkillRepository:
         instance = self._get(id)
         return self._mapper.skill_model_to_schema(instance) if instance else None
 
+    def get_many(self, ids: list[int]) -> list[schemas.Skill]:
+        instances = _get_many(self._session, models.Skill, ids)
+        return [self._mapper.skill_model_to_schema(i) for i in instances]
+
+    def iter_by_id(
+        self,
+        first_id: int | None = None,
+        last_id: int | None = None,
+        chunk_size: int = 500,
+    ) -> Iterator[schemas.Skill]:
+        for chunk in _chunks_by_id(
+            self._session,
+            select(models.Skill.id, models.Skill),
+            models.Skill.id,
+            first_id,
+            last_id,
+            chunk_size,
+        ):
+            for _, instance in chunk:
+                yield self._mapper.skill_model_to_schema(instance)
+
     def get_or_create(self, name: str) -> schemas.Skill:
         instance = self._session.scalar(
             select(models.Skill).where(models.Skill.name == name)
@@ -417,44 +1295,43 @@ class SkillRepository:
 
         return self._mapper.skill_model_to_schema(instance)
 
-    def filter(self, f: schemas.SkillFilter) -> list[schemas.Skill]:
-        app_count = func.count(models.Application.id).label("app_count")
-        needs_count = (
-            f.min_applications is not None
-            or f.max_applications is not None
-            or f.sort_by == SkillSortField.NUMBER_APPLICATIONS
-        )
-
-        stmt = select(models.Skill)
-
-        if needs_count:
-            stmt = stmt.outerjoin(models.Skill.applications).group_by(models.Skill.id)
+    def get_or_create_many(self, names: list[str]) -> list[schemas.Skill]:
+        instances = _get_or_create_many(self._session, models.Skill, names)
+        return [self._mapper.skill_model_to_schema(i) for i in instances]
 
+    @staticmethod
+    def _where(stmt: Select, f: schemas.SkillFilter) -> Select:
         if f.name:
-            stmt = stmt.where(models.Skill.name.ilike(f"%{f.name}%"))
+            stmt = stmt.where(
+                models.Skill.id.in_(_containing(models.Skill.name, f.name))
+            )
 
-        having_clauses = []
         if f.min_applications is not None:
-            having_clauses.append(app_count >= f.min_applications)
+            stmt = stmt.where(models.Skill.application_count >= f.min_applications)
+
         if f.max_applications is not None:
-            having_clauses.append(app_count <= f.max_applications)
+            stmt = stmt.where(models.Skill.application_count <= f.max_applications)
+
+        return stmt
 
-        if having_clauses:
-            stmt = stmt.having(and_(*having_clauses))
+    def _statement(self, f: schemas.SkillFilter) -> tuple[Select, list]:
+        stmt = self._where(select(models.Skill), f)
 
         match f.sort_by:
             case SkillSortField.NAME:
-                sort_col = models.Skill.name
+                sort_cols = [models.Skill.name]
             case SkillSortField.NUMBER_APPLICATIONS:
-                sort_col = app_count
+                sort_cols = [models.Skill.application_count]
             case SkillSortField.UPDATED:
-                sort_col = models.Skill.last_updated
+                sort_cols = [models.Skill.last_updated]
             case _:
-                sort_col = models.Skill.created_at
+                sort_cols = [models.Skill.created_at]
 
-        stmt = stmt.order_by(
-            sort_col.desc() if f.sort_order == SortOrder.DESC else sort_col.asc()
-        )
+        columns = [*sort_cols, models.Skill.id]
+        return _order_by(stmt, columns, f.sort_order), columns
+
+    def filter(self, f: schemas.SkillFilter) -> list[schemas.Skill]:
+        stmt, _ = self._statement(f)
 
         if f.limit is not None:
             stmt = stmt.limit(f.limit)
@@ -462,6 +1339,29 @@ class SkillRepository:
         instances = self._session.scalars(stmt).unique().all()
         return [self._mapper.skill_model_to_schema(i) for i in instances]
 
+    def count(self, f: schemas.SkillFilter) -> int:
+        stmt = select(func.count()).select_from(models.Skill)
+        return self._session.scalar(self._where(stmt, f))
+
+    def page(
+        self,
+        f: schemas.SkillFilter,
+        after: str | None = None,
+    ) -> schemas.Page[schemas.Skill]:
+        """
+        Return the next `f.limit` skills after the `after` cursor, taken
+        from the previous page, or the first ones without it.
+        """
+        stmt, columns = self._statement(f)
+        return _page(
+            self._session,
+            stmt,
+            columns,
+            f,
+            after,
+            self._mapper.skill_model_to_schema,
+        )
+
     def list(self) -> list[schemas.Skill]:
         return self.filter(schemas.SkillFilter())
 
@@ -478,7 +1378,7 @@ class SkillRepository:
         return self._mapper.skill_model_to_schema(instance)
 
     def delete(self, id: int) -> None:
-        instance = self._get(id)
-        if instance:
-            self._session.delete(instance)
-            self._session.flush()
+        self.delete_many([id])
+
+    def delete_many(self, ids: list[int]) -> int:
+        return _delete_many(self._session, models.Skill, ids)
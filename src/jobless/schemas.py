@@ -1,8 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import date
 
-from email_validator import EmailNotValidError, validate_email
-
 from jobless.enums import (
     ApplicationSortField,
     CompanySortField,
@@ -49,6 +47,8 @@ class Contact:
             raise ValueError("contact name cannot be empty")
 
         if self.email:
+            from email_validator import EmailNotValidError, validate_email
+
             try:
                 validate_email(self.email, check_deliverability=False)
             except EmailNotValidError as e:
@@ -76,14 +76,50 @@ class Application:
             raise ValueError("application title cannot be empty")
 
 
+# What listing applications as a table or list shows.
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ApplicationSummary:
+    id: int
+    title: str
+    company_name: str
+    status: Status
+    date_applied: date | None = None
+    follow_up_date: date | None = None
+
+
+# Wrap the matched words in search snippets.
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ApplicationMatch:
+    application: Application
+    snippet: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Page[T]:
+    items: list[T]
+    # Opaque cursor to pass as `after` for the next page, if there is one.
+    next_cursor: str | None = None
+
+
 @dataclass(slots=True, kw_only=True)
 class ApplicationFilter:
     title: str | None = None
     statuses: list[Status] = field(default_factory=list)
     location_types: list[Location] = field(default_factory=list)
     skills: list[str] = field(default_factory=list)
+    # Match applications with every skill instead of any of them.
+    all_skills: bool = False
     company_name: str | None = None
     company_id: int | None = None
+    # Match applications linked to a contact meeting all of these.
+    contact_id: int | None = None
+    contact_name: str | None = None
+    contact_email: str | None = None
+    contact_url: str | None = None
     applied_after: date | None = None
     applied_before: date | None = None
     follow_up_date_after: date | None = None
@@ -9,12 +9,121 @@ from dotenv import load_dotenv
 from jobless.constants import APP_DIR, CONFIG_FILE_PATH, DB_URL
 
 
+# Named sets of SQLite pragmas. `interactive` is tuned for the short-lived
+# commands you type, `bulk-import` for commands writing many rows at once and
+# `low-memory` for small or shared machines.
+SQLITE_PROFILES: dict[str, dict[str, int | str]] = {
+    "interactive": {
+        "cache_size": 2000,
+        "mmap_size": 134217728,
+        "synchronous": "NORMAL",
+        "journal_size_limit": 27103364,
+        "busy_timeout": 5000,
+        "temp_store": "MEMORY",
+        "wal_autocheckpoint": 1000,
+    },
+    "bulk-import": {
+        "cache_size": -131072,
+        "mmap_size": 268435456,
+        "synchronous": "NORMAL",
+        "journal_size_limit": 268435456,
+        "busy_timeout": 30000,
+        "temp_store": "MEMORY",
+        "wal_autocheckpoint": 10000,
+    },
+    "low-memory": {
+        "cache_size": -512,
+        "mmap_size": 0,
+        "synchronous": "NORMAL",
+        "journal_size_limit": 4194304,
+        "busy_timeout": 5000,
+        "temp_store": "FILE",
+        "wal_autocheckpoint": 250,
+    },
+}
+
+SQLITE_KEYWORDS = {
+    "synchronous": {"OFF", "NORMAL", "FULL", "EXTRA"},
+    "temp_store": {"DEFAULT", "FILE", "MEMORY"},
+}
+
+
 @dataclass(frozen=True, slots=True)
 class Settings:
     db_url: str = field(
         default=f"sqlite:///{DB_URL}",
         metadata={"env": "JOBLESS_DB_URL"},
     )
+    sqlite_profile: str = field(
+        default="interactive",
+        metadata={"env": "JOBLESS_SQLITE_PROFILE"},
+    )
+    sqlite_bulk_profile: str = field(
+        default="bulk-import",
+        metadata={"env": "JOBLESS_SQLITE_BULK_PROFILE"},
+    )
+
+    # Override a single pragma of whichever profile is in use.
+    sqlite_cache_size: int | None = field(
+        default=None,
+        metadata={"env": "JOBLESS_SQLITE_CACHE_SIZE", "parse": int},
+    )
+    sqlite_mmap_size: int | None = field(
+        default=None,
+        metadata={"env": "JOBLESS_SQLITE_MMAP_SIZE", "parse": int},
+    )
+    sqlite_synchronous: str | None = field(
+        default=None,
+        metadata={"env": "JOBLESS_SQLITE_SYNCHRONOUS"},
+    )
+    sqlite_journal_size_limit: int | None = field(
+        default=None,
+        metadata={"env": "JOBLESS_SQLITE_JOURNAL_SIZE_LIMIT", "parse": int},
+    )
+    sqlite_busy_timeout: int | None = field(
+        default=None,
+        metadata={"env": "JOBLESS_SQLITE_BUSY_TIMEOUT", "parse": int},
+    )
+    sqlite_temp_store: str | None = field(
+        default=None,
+        metadata={"env": "JOBLESS_SQLITE_TEMP_STORE"},
+    )
+    sqlite_wal_autocheckpoint: int | None = field(
+        default=None,
+        metadata={"env": "JOBLESS_SQLITE_WAL_AUTOCHECKPOINT", "parse": int},
+    )
+
+    def __post_init__(self):
+        for profile in (self.sqlite_profile, self.sqlite_bulk_profile):
+            if profile not in SQLITE_PROFILES:
+                raise ValueError(
+                    f"unknown SQLite profile '{profile}', "
+                    f"expected one of: {', '.join(SQLITE_PROFILES)}"
+                )
+
+        for pragma, value in self._sqlite_overrides().items():
+            if pragma in SQLITE_KEYWORDS:
+                if str(value).upper() not in SQLITE_KEYWORDS[pragma]:
+                    raise ValueError(f"invalid value for sqlite_{pragma}: {value}")
+            elif not isinstance(value, int) or isinstance(value, bool):
+                raise ValueError(f"sqlite_{pragma} must be an integer")
+
+    def _sqlite_overrides(self) -> dict[str, int | str]:
+        return {
+            pragma: value
+            for pragma in SQLITE_PROFILES["interactive"]
+            if (value := getattr(self, f"sqlite_{pragma}")) is not None
+        }
+
+    def sqlite_pragmas(self, profile: str | None = None) -> dict[str, int | str]:
+        """
+        Pragmas of the given profile, or the configured one, with any
+        individual overrides applied on top.
+        """
+        return {
+            **SQLITE_PROFILES[profile or self.sqlite_profile],
+            **self._sqlite_overrides(),
+        }
 
 
 def load_settings(
@@ -40,7 +149,11 @@ def load_settings(
 
         env_val = os.getenv(env_key)
         if env_val:
-            config_data[f.name] = env_val
+            parse = f.metadata.get("parse", str)
+            try:
+                config_data[f.name] = parse(env_val)
+            except ValueError:
+                raise ValueError(f"invalid value for {env_key}: {env_val}") from None
 
     return Settings(**config_data)
 
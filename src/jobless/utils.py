@@ -1,6 +1,11 @@
 import os
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TextIO
+
+from jobless.enums import FileFormat
 
 
 def get_app_dir(app_name: str) -> Path:
@@ -16,3 +21,41 @@ def get_app_dir(app_name: str) -> Path:
     xdg_config = os.environ.get("XDG_CONFIG_HOME")
     base = Path(xdg_config) if xdg_config else Path.home() / ".config"
     return base / app_slug
+
+
+def guess_file_format(path: Path) -> FileFormat | None:
+    """
+    Tell the format of a data file from its extension, ignoring `.gz`.
+    """
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    if suffixes[-1:] == [".gz"]:
+        suffixes.pop()
+
+    match suffixes[-1:]:
+        case [".csv"]:
+            return FileFormat.CSV
+        case [".jsonl"] | [".ndjson"]:
+            return FileFormat.JSONL
+        case _:
+            return None
+
+
+@contextmanager
+def open_data_file(path: Path, mode: str = "r") -> Iterator[TextIO]:
+    """
+    Open a data file as text, compressed with gzip if it ends in `.gz`.
+    '-' stands for stdin or stdout, which are left open.
+    """
+    if str(path) == "-":
+        yield sys.stdout if "w" in mode else sys.stdin
+        return
+
+    if path.suffix.lower() == ".gz":
+        import gzip
+
+        file = gzip.open(path, f"{mode}t", encoding="utf-8", newline="")
+    else:
+        file = open(path, mode, encoding="utf-8", newline="")
+
+    with file:
+        yield file
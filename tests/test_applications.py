@@ -0,0 +1,49 @@
+from datetime import date
+
+import pytest
+
+from jobless import schemas
+from jobless.commands.applications import has_conditions, parse_where
+from jobless.enums import Status
+
+
+def test_parse_where_builds_a_filter():
+    f = parse_where(
+        [
+            "status=applied",
+            "status=interviewing",
+            "applied-before=2024-03-01",
+            "company-name=acme",
+            "title=a=b",
+        ]
+    )
+
+    assert f == schemas.ApplicationFilter(
+        title="a=b",
+        statuses=[Status.APPLIED, Status.INTERVIEWING],
+        applied_before=date(2024, 3, 1),
+        company_name="acme",
+    )
+
+
+@pytest.mark.parametrize(
+    "condition",
+    [
+        "status",
+        "bogus=1",
+        "status=nope",
+        "company-id=acme",
+        "applied-after=soon",
+        "title=",
+        "skill= ",
+    ],
+)
+def test_parse_where_rejects_invalid_conditions(condition):
+    with pytest.raises(ValueError):
+        parse_where([condition])
+
+
+def test_has_conditions_ignores_modifiers():
+    assert has_conditions(parse_where(["status=applied"]))
+    assert not has_conditions(parse_where([]))
+    assert not has_conditions(parse_where(["all-skills=true"]))
@@ -0,0 +1,49 @@
+import pytest
+
+from jobless.commands.batch import parse_operation
+
+
+def test_parse_operation_splits_command_lines():
+    assert parse_operation("app update 3 --notes 'call back'") == [
+        "app",
+        "update",
+        "3",
+        "--notes",
+        "call back",
+    ]
+
+
+def test_parse_operation_accepts_json_arrays():
+    assert parse_operation('["app", "del", 4, "--force"]') == [
+        "app",
+        "del",
+        "4",
+        "--force",
+    ]
+
+
+def test_parse_operation_expands_json_objects():
+    line = (
+        '{"command": "app update", "args": [3], '
+        '"options": {"status": "applied", "add_skill": ["go", "rust"], '
+        '"notes": null, "force": true}}'
+    )
+
+    assert parse_operation(line) == [
+        "app",
+        "update",
+        "3",
+        "--status",
+        "applied",
+        "--add-skill",
+        "go",
+        "--add-skill",
+        "rust",
+        "--force",
+    ]
+
+
+@pytest.mark.parametrize("line", ['{"args": [1]}', '{"command": "app"', "[1, 2"])
+def test_parse_operation_rejects_invalid_json(line):
+    with pytest.raises(ValueError):
+        parse_operation(line)
@@ -0,0 +1,352 @@
+import json
+import os
+import re
+import socket
+import subprocess
+import sys
+
+import pytest
+
+# Upper bound for the time spent importing modules on `jobless app list`.
+# It's intentionally generous, the goal is to catch regressions like
+# importing every subcommand (or rich) eagerly, not to benchmark.
+IMPORT_BUDGET_SECONDS = 1.5
+
+IMPORT_TIME_RE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \|( *)\S+$")
+
+# Dumps every loaded module to stderr once the command exits.
+RUN_CLI = """
+import atexit, json, sys
+atexit.register(lambda: print(json.dumps(sorted(sys.modules)), file=sys.stderr))
+from jobless.main import main
+main()
+"""
+
+
+def _env(tmp_path) -> dict[str, str]:
+    return {
+        **os.environ,
+        "XDG_CONFIG_HOME": str(tmp_path),
+        "JOBLESS_DB_URL": f"sqlite:///{tmp_path / 'jobs.db'}",
+    }
+
+
+def _run_cli(
+    tmp_path,
+    *args: str,
+    input: str | None = None,
+) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            RUN_CLI,
+            *args,
+        ],
+        env=_env(tmp_path),
+        input=input,
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        check=False,
+    )
+
+
+def _imports(stderr: str) -> tuple[set[str], float]:
+    lines = stderr.splitlines()
+    modules = set(json.loads(lines[-1]))
+
+    total_us = 0
+    for line in lines:
+        match = IMPORT_TIME_RE.match(line)
+        if match and len(match.group(2)) == 1:
+            total_us += int(match.group(1))
+
+    return modules, total_us / 1_000_000
+
+
+@pytest.fixture(scope="module")
+def app_list_imports(tmp_path_factory):
+    result = _run_cli(tmp_path_factory.mktemp("jobless"), "app", "list")
+    return _imports(result.stderr)
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "jobless.commands.companies",
+        "jobless.commands.contacts",
+        "jobless.commands.skills",
+        "rich",
+        "email_validator",
+        "webbrowser",
+    ],
+)
+def test_app_list_does_not_import(app_list_imports, module):
+    modules, _ = app_list_imports
+
+    assert "jobless.commands.applications" in modules
+    assert module not in modules
+
+
+def test_app_list_startup_within_budget(app_list_imports):
+    _, total = app_list_imports
+
+    assert total < IMPORT_BUDGET_SECONDS
+
+
+def test_help_does_not_import_subcommands_or_database(tmp_path):
+    result = _run_cli(tmp_path, "--help")
+    modules, _ = _imports(result.stderr)
+
+    assert result.returncode == 0
+    assert not any(m.startswith("jobless.commands") for m in modules)
+    assert "sqlalchemy" not in modules
+
+
+def test_completion_does_not_import_database_layer(tmp_path):
+    _run_cli(tmp_path, "company", "add", "-n", "Acme")
+
+    # Shells ask for completions by running the program with these set, and
+    # the variable is named after the program.
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; sys.argv[0] = 'jobless'\n" + RUN_CLI,
+        ],
+        env={
+            **_env(tmp_path),
+            "_JOBLESS_COMPLETE": "complete_bash",
+            "COMP_WORDS": "jobless app add --company A",
+            "COMP_CWORD": "4",
+        },
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        check=False,
+    )
+    modules = set(json.loads(result.stderr.splitlines()[-1]))
+
+    assert result.stdout.split() == ["Acme"]
+    assert "jobless.commands.applications" in modules
+    assert "sqlalchemy" not in modules
+
+
+def test_shell_runs_commands_against_one_context(tmp_path):
+    result = _run_cli(
+        tmp_path,
+        "shell",
+        input="company add -n Acme\ncompany list --format list\nexit\n",
+    )
+
+    assert result.returncode == 0
+    assert "Company added" in result.stdout
+    assert "Acme" in result.stdout
+
+
+def test_shell_keeps_running_after_a_failing_command(tmp_path):
+    result = _run_cli(
+        tmp_path,
+        "shell",
+        input="app view 404\nbogus\ndaemon\nskill list\n",
+    )
+
+    assert result.returncode == 0
+    assert "daemon can't run inside the shell" in result.stderr
+    assert "application 404 not found" in result.stderr
+    assert "No such command 'bogus'" in result.stderr
+    assert "No skills found" in result.stderr
+
+
+def test_batch_rolls_back_failed_operations_only(tmp_path):
+    result = _run_cli(
+        tmp_path,
+        "batch",
+        input=(
+            "company add -n Acme\n"
+            '{"command": "company add", "options": {"name": "Globex"}}\n'
+            "company add -n Acme\n"
+            "company del 1\n"
+        ),
+    )
+
+    assert result.returncode == 1
+    assert "line 3: (sqlite3.IntegrityError)" in result.stderr
+    assert "line 4: failed, rolled back" in result.stderr
+    assert "2 operation(s) succeeded, 2 failed" in result.stderr
+
+    listing = _run_cli(tmp_path, "company", "list", "--format", "list")
+    assert "Acme" in listing.stdout
+    assert "Globex" in listing.stdout
+
+
+@pytest.mark.parametrize("group", ["app", "company", "contact", "skill"])
+def test_list_refuses_limit_with_page_size(tmp_path, group):
+    result = _run_cli(tmp_path, group, "list", "--limit", "5", "--page-size", "2")
+
+    assert result.returncode == 1
+    assert "--limit and --page-size conflict" in result.stderr
+
+
+def test_app_update_where_refuses_to_match_everything_by_accident(tmp_path):
+    _run_cli(tmp_path, "app", "add", "-t", "SRE", "-c", "Acme")
+
+    empty = _run_cli(
+        tmp_path, "app", "update", "--where", "title=", "--status", "ghosted"
+    )
+    modifier_only = _run_cli(
+        tmp_path, "app", "update", "--where", "all-skills=true", "--status", "ghosted"
+    )
+    empty_title = _run_cli(
+        tmp_path, "app", "update", "--where", "title=SRE", "--title", ""
+    )
+
+    assert empty.returncode == modifier_only.returncode == 1
+    assert "missing a value for title" in empty.stderr
+    assert "pass --all" in modifier_only.stderr
+    assert empty_title.returncode == 1
+    assert "application title cannot be empty" in empty_title.stderr
+    assert "Traceback" not in empty_title.stderr
+
+    dry_run = _run_cli(
+        tmp_path, "app", "update", "--all", "--status", "ghosted", "--dry-run"
+    )
+    assert "1 application(s) would be updated" in dry_run.stdout
+
+    listing = _run_cli(tmp_path, "app", "list", "--status", "saved", "--count")
+    assert listing.stdout.strip() == "1"
+
+
+def _ask_daemon(tmp_path, *argv: str) -> list[dict]:
+    """
+    Send a command straight to the daemon and return every message it sends
+    back, which only the daemon itself can produce.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(tmp_path / "jobless" / "daemon.sock"))
+        request = {
+            "argv": list(argv),
+            "cwd": str(tmp_path),
+            "db_url": _env(tmp_path)["JOBLESS_DB_URL"],
+        }
+        connection.sendall(json.dumps(request).encode() + b"\n")
+        with connection.makefile("rb") as reader:
+            return [json.loads(line) for line in reader]
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    process = subprocess.Popen(
+        [sys.executable, "-c", "from jobless.main import main; main()", "daemon"],
+        env=_env(tmp_path),
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert "Listening on" in process.stderr.readline()
+        yield process
+    finally:
+        process.kill()
+        process.stderr.close()
+
+
+def _run_client(tmp_path, *args: str, input: str | None = None):
+    return subprocess.run(
+        [sys.executable, "-c", "from jobless.client import main; main()", *args],
+        env=_env(tmp_path),
+        input=input,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs unix sockets")
+def test_client_forwards_to_daemon_and_falls_back_without_it(tmp_path):
+    assert (
+        "Company added" in _run_client(tmp_path, "company", "add", "-n", "Acme").stdout
+    )
+
+    process = subprocess.Popen(
+        [sys.executable, "-c", "from jobless.main import main; main()", "daemon"],
+        env=_env(tmp_path),
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert "Listening on" in process.stderr.readline()
+
+        result = _run_client(tmp_path, "company", "list", "--format", "list")
+        assert result.returncode == 0
+        assert "Acme" in result.stdout
+
+        assert _run_client(tmp_path, "daemon", "--stop").returncode == 0
+        process.wait(timeout=5)
+    finally:
+        process.kill()
+        process.stderr.close()
+
+    assert not (tmp_path / "jobless" / "daemon.sock").exists()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs unix sockets")
+def test_daemon_runs_forwarded_commands_itself(tmp_path, daemon):
+    added = _ask_daemon(tmp_path, "company", "add", "-n", "Acme")
+    listed = _ask_daemon(tmp_path, "company", "list", "--format", "list")
+    missing = _ask_daemon(tmp_path, "company", "view", "404")
+
+    assert added == [{"stream": "stdout", "data": "Company added\n"}, {"exit": 0}]
+    assert {"exit": 0} in listed
+    assert "Acme" in listed[0]["data"]
+    assert missing[-1] == {"exit": 1}
+    assert "company 404 not found" in missing[0]["data"]
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs unix sockets")
+@pytest.mark.parametrize("command", ["shell", "daemon", "export"])
+def test_daemon_refuses_nested_commands(tmp_path, daemon, command):
+    assert _ask_daemon(tmp_path, command) == [
+        {"stream": "stderr", "data": f"{command} can't run in the daemon\n"},
+        {"exit": 1},
+    ]
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs unix sockets")
+def test_prompting_commands_fall_back_without_repeating_output(tmp_path, daemon):
+    _run_cli(tmp_path, "app", "add", "-t", "SRE", "-c", "Acme")
+
+    # The missing id is reported before the prompt for the other one, and
+    # none of that may reach the client before it falls back.
+    assert _ask_daemon(tmp_path, "app", "del", "99", "1") == [{"fallback": True}]
+
+    result = _run_client(tmp_path, "app", "del", "99", "1", input="y\n")
+
+    assert result.returncode == 0
+    assert result.stderr.count("application 99 not found") == 1
+    assert "Application 1 deleted" in result.stdout
+
+
+def test_profile_prints_phases_and_saves_stats(tmp_path):
+    result = _run_cli(tmp_path, "--save-profile", "company", "add", "-n", "Acme")
+
+    assert result.returncode == 0
+    assert re.search(r"^Profiled [\d.]+s, after [\d.]+s starting", result.stderr, re.M)
+    for phase in ("startup", "sql", "mapping", "rendering", "other"):
+        assert re.search(rf"^  {phase} +\d", result.stderr, re.MULTILINE)
+
+    # Resolving the command imports the database layer, which is profiled.
+    startup = re.search(r"^  startup +([\d.]+)s", result.stderr, re.M)
+    assert float(startup.group(1)) > 0
+
+    assert list((tmp_path / "jobless" / "profiles").glob("*.pstats"))
+
+
+def test_export_reports_when_there_is_nothing_to_export(tmp_path):
+    result = _run_cli(tmp_path, "export", "skills", "-o", str(tmp_path / "skills.csv"))
+
+    assert result.returncode == 0
+    assert "No skills to export" in result.stderr
+    assert "Exported" not in result.stderr
@@ -0,0 +1,81 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from jobless import completion, models
+from jobless.db import get_engine, init_db
+
+
+def _add(db_path, *instances) -> None:
+    engine = get_engine(f"sqlite:///{db_path}")
+    init_db(engine)
+    with Session(engine) as session:
+        session.add_all(instances)
+        session.commit()
+    engine.dispose()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "jobs.db"
+    _add(
+        path,
+        models.Company(name="Acme"),
+        models.Company(name="Globex"),
+        models.Skill(name="Python"),
+        models.Contact(name="Jane Doe"),
+    )
+    return path
+
+
+@pytest.fixture
+def index_path(tmp_path, db_path, monkeypatch):
+    path = tmp_path / "completion.json"
+    monkeypatch.setattr(completion, "INDEX_PATH", path)
+    monkeypatch.setattr(completion, "_db_path", lambda: db_path)
+    return path
+
+
+def test_load_index_builds_index_file(db_path, index_path):
+    index = completion.load_index(db_path, index_path)
+
+    assert index["companies"] == ["Acme", "Globex"]
+    assert index["skills"] == ["Python"]
+    assert index_path.exists()
+
+
+def test_load_index_reuses_index_while_database_is_unchanged(
+    db_path, index_path, monkeypatch
+):
+    completion.load_index(db_path, index_path)
+
+    def _fail(db_path):
+        raise AssertionError("index should not be rebuilt")
+
+    monkeypatch.setattr(completion, "build_index", _fail)
+    assert completion.load_index(db_path, index_path)["skills"] == ["Python"]
+
+
+def test_load_index_rebuilds_after_database_changes(db_path, index_path):
+    completion.load_index(db_path, index_path)
+    _add(db_path, models.Company(name="Initech"))
+
+    index = completion.load_index(db_path, index_path)
+
+    assert "Initech" in index["companies"]
+
+
+def test_complete_companies_matches_prefix_ignoring_case(index_path):
+    assert completion.complete_companies("gl") == ["Globex"]
+    assert completion.complete_companies("") == ["Acme", "Globex"]
+
+
+def test_complete_contacts_returns_ids_with_names(index_path):
+    assert completion.complete_contacts("") == [("1", "Jane Doe")]
+    assert completion.complete_contacts("2") == []
+
+
+def test_completers_return_nothing_without_a_database(tmp_path, monkeypatch):
+    monkeypatch.setattr(completion, "INDEX_PATH", tmp_path / "completion.json")
+    monkeypatch.setattr(completion, "_db_path", lambda: tmp_path / "missing.db")
+
+    assert completion.complete_skills("py") == []
@@ -0,0 +1,63 @@
+from sqlalchemy import select
+
+from jobless import models
+from tests.factories import (
+    ApplicationFactory,
+    CompanyFactory,
+    ContactFactory,
+    SkillFactory,
+)
+
+
+def _counts(session, model) -> dict[int, int]:
+    session.expire_all()
+    return dict(session.execute(select(model.id, model.application_count)).all())
+
+
+def test_company_counts_follow_applications(session):
+    acme, globex = CompanyFactory.create_batch(2)
+    moved, removed, _ = ApplicationFactory.create_batch(3, company=acme)
+
+    moved.company = globex
+    session.delete(removed)
+    session.flush()
+
+    assert _counts(session, models.Company) == {acme.id: 1, globex.id: 1}
+
+
+def test_skill_and_contact_counts_follow_links(session):
+    python, sql = SkillFactory.create_batch(2)
+    contact = ContactFactory()
+    kept = ApplicationFactory(skills=[python, sql], contacts=[contact])
+    removed = ApplicationFactory(skills=[python], contacts=[contact])
+
+    kept.skills = [sql]
+    session.delete(removed)
+    session.flush()
+
+    assert _counts(session, models.Skill) == {python.id: 0, sql.id: 1}
+    assert _counts(session, models.Contact) == {contact.id: 1}
+
+
+def test_counts_follow_cascading_deletes(session):
+    company = CompanyFactory()
+    skill = SkillFactory()
+    ApplicationFactory(company=company, skills=[skill])
+
+    session.delete(company)
+    session.flush()
+
+    assert _counts(session, models.Skill) == {skill.id: 0}
+
+
+def test_counts_follow_bulk_deletes(session, application_repo, company_repo):
+    acme, globex = CompanyFactory.create_batch(2)
+    skill = SkillFactory()
+    deleted = ApplicationFactory(company=acme, skills=[skill])
+    ApplicationFactory(company=globex, skills=[skill])
+
+    application_repo.delete_many([deleted.id])
+    company_repo.delete_many([globex.id])
+
+    assert _counts(session, models.Company) == {acme.id: 0}
+    assert _counts(session, models.Skill) == {skill.id: 0}
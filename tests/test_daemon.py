@@ -0,0 +1,46 @@
+import json
+import socket
+
+import pytest
+
+from jobless.commands import daemon
+
+
+@pytest.fixture
+def connection():
+    ours, theirs = socket.socketpair()
+    with ours, theirs:
+        yield ours, theirs.makefile("rb")
+
+
+def _received(reader, count: int) -> list[dict]:
+    return [json.loads(reader.readline()) for _ in range(count)]
+
+
+def test_output_is_held_back_in_order(connection):
+    ours, reader = connection
+    output = daemon._Output(ours)
+
+    output.write("stderr", "not found\n")
+    output.write("stdout", "a\n")
+    output.write("stdout", "b\n")
+    assert not output.streaming
+
+    output.flush()
+
+    assert _received(reader, 2) == [
+        {"stream": "stderr", "data": "not found\n"},
+        {"stream": "stdout", "data": "a\nb\n"},
+    ]
+
+
+def test_output_streams_past_the_hold_limit(connection, monkeypatch):
+    monkeypatch.setattr(daemon, "HOLD_LIMIT", 10)
+    ours, reader = connection
+    output = daemon._Output(ours)
+
+    output.write("stdout", "12345")
+    output.write("stdout", "67890")
+
+    assert output.streaming
+    assert _received(reader, 1) == [{"stream": "stdout", "data": "1234567890"}]
@@ -0,0 +1,107 @@
+import pytest
+from sqlalchemy import event, insert, inspect, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from jobless import models
+from jobless.context import AppContext
+from jobless.db import (
+    SCHEMA_VERSION,
+    get_engine,
+    get_schema_version,
+    init_db,
+    use_pragmas,
+)
+from jobless.mapper import Mapper
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    engine = get_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    yield engine
+    engine.dispose()
+
+
+def _record_statements(engine) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    return statements
+
+
+def test_init_db_creates_schema_and_stamps_version(file_engine):
+    init_db(file_engine)
+
+    with file_engine.connect() as connection:
+        assert get_schema_version(connection) == SCHEMA_VERSION
+
+    assert "applications" in inspect(file_engine).get_table_names()
+
+
+def test_init_db_skips_ddl_when_up_to_date(file_engine):
+    init_db(file_engine)
+    statements = _record_statements(file_engine)
+
+    init_db(file_engine)
+
+    assert [s for s in statements if s != "BEGIN"] == ["PRAGMA user_version"]
+
+
+def test_init_db_upgrades_unversioned_database(file_engine):
+    init_db(file_engine)
+    with file_engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA user_version = 0")
+        connection.commit()
+
+    init_db(file_engine)
+
+    with file_engine.connect() as connection:
+        assert get_schema_version(connection) == SCHEMA_VERSION
+
+
+def _pragma(connection, name: str):
+    return connection.exec_driver_sql(f"PRAGMA {name}").scalar_one()
+
+
+def test_get_engine_applies_pragmas(tmp_path):
+    engine = get_engine(
+        f"sqlite:///{tmp_path / 'jobs.db'}",
+        pragmas={"cache_size": -512, "busy_timeout": 1234},
+    )
+
+    with engine.connect() as connection:
+        assert _pragma(connection, "cache_size") == -512
+        assert _pragma(connection, "busy_timeout") == 1234
+        assert _pragma(connection, "journal_mode") == "wal"
+
+    engine.dispose()
+
+
+def test_use_pragmas_restores_previous_values(file_engine):
+    with file_engine.connect() as connection:
+        with use_pragmas(connection, {"synchronous": "OFF", "cache_size": -4096}):
+            assert _pragma(connection, "synchronous") == 0
+            assert _pragma(connection, "cache_size") == -4096
+            connection.rollback()
+
+        assert _pragma(connection, "synchronous") == 1
+        assert _pragma(connection, "cache_size") == 2000
+
+
+def test_batch_transactions_begin_with_the_write_lock(tmp_path):
+    engine = get_engine(
+        f"sqlite:///{tmp_path / 'jobs.db'}", pragmas={"busy_timeout": 0}
+    )
+    init_db(engine)
+    context = AppContext(session_factory=sessionmaker(bind=engine), mapper=Mapper())
+
+    with context.batch() as session, engine.connect() as other:
+        session.execute(select(models.Company.id)).all()
+
+        with pytest.raises(OperationalError, match="locked"):
+            other.execute(insert(models.Company), [{"name": "Acme"}])
+
+    engine.dispose()
@@ -0,0 +1,158 @@
+import csv
+import gzip
+import io
+import json
+from datetime import date
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from jobless import models
+from jobless.db import get_engine, init_db
+from jobless.enums import ExportTarget, FileFormat
+from jobless.exporter import (
+    FIELDS,
+    export_parallel,
+    part_path,
+    read_records,
+    split_ids,
+    write_records,
+)
+from jobless.importer import Importer
+from jobless.importer import read_records as read_import_records
+from tests.factories import ApplicationFactory, ContactFactory, SkillFactory
+
+
+def _export(session, mapper, target, format) -> str:
+    file = io.StringIO()
+    write_records(read_records(session, mapper, target), file, format, FIELDS[target])
+    return file.getvalue()
+
+
+def test_export_applications_as_jsonl(session, mapper):
+    contact = ContactFactory()
+    app = ApplicationFactory(
+        title="SRE",
+        skills=[SkillFactory(name="go"), SkillFactory(name="linux")],
+        contacts=[contact],
+        date_applied=date(2024, 1, 2),
+    )
+    session.flush()
+
+    (line,) = _export(
+        session, mapper, ExportTarget.APPLICATIONS, FileFormat.JSONL
+    ).splitlines()
+    record = json.loads(line)
+
+    assert list(record) == FIELDS[ExportTarget.APPLICATIONS]
+    assert record["id"] == app.id
+    assert record["company"] == app.company.name
+    assert record["date_applied"] == "2024-01-02"
+    assert record["follow_up_date"] is None
+    assert sorted(record["skills"]) == ["go", "linux"]
+    assert record["contacts"] == [contact.id]
+
+
+def test_export_joins_lists_in_csv(session, mapper):
+    ApplicationFactory(skills=[SkillFactory(name="go"), SkillFactory(name="rust")])
+    session.flush()
+
+    exported = _export(session, mapper, ExportTarget.APPLICATIONS, FileFormat.CSV)
+    reader = csv.DictReader(io.StringIO(exported))
+    (row,) = reader
+
+    assert reader.fieldnames == FIELDS[ExportTarget.APPLICATIONS]
+    assert sorted(row["skills"].split(";")) == ["go", "rust"]
+
+
+def test_export_other_targets(session, mapper):
+    SkillFactory(name="python")
+    ContactFactory(name="Ada", email="ada@example.com")
+    session.flush()
+
+    skills = _export(session, mapper, ExportTarget.SKILLS, FileFormat.CSV)
+    contacts = _export(session, mapper, ExportTarget.CONTACTS, FileFormat.JSONL)
+
+    assert skills.splitlines()[1].endswith(",python")
+    assert json.loads(contacts)["email"] == "ada@example.com"
+
+
+def test_exported_applications_import_back(session, mapper):
+    for i in range(5):
+        ApplicationFactory(
+            title=f"Job {i}",
+            skills=[SkillFactory(name=f"skill-{i}")],
+            date_applied=date(2024, 1, i + 1),
+        )
+    session.flush()
+    exported = _export(session, mapper, ExportTarget.APPLICATIONS, FileFormat.CSV)
+    session.execute(models.Application.__table__.delete())
+
+    result = Importer(session, mapper).run(
+        read_import_records(io.StringIO(exported), FileFormat.CSV),
+        commit=session.flush,
+    )
+
+    assert (result.imported, result.failed) == (5, 0)
+    assert sorted(session.scalars(select(models.Application.title))) == [
+        f"Job {i}" for i in range(5)
+    ]
+
+
+def test_split_ids_covers_every_id_once(session):
+    apps = ApplicationFactory.create_batch(10)
+    session.flush()
+
+    ranges = split_ids(session, ExportTarget.APPLICATIONS, 3)
+    ids = [app.id for app in apps]
+
+    assert len(ranges) == 3
+    assert sorted(
+        id for first, last in ranges for id in ids if first <= id <= last
+    ) == sorted(ids)
+    assert split_ids(session, ExportTarget.SKILLS, 3) == []
+    assert len(split_ids(session, ExportTarget.APPLICATIONS, 50)) == 10
+
+
+def test_part_path_keeps_extensions(tmp_path):
+    assert part_path(tmp_path / "apps.jsonl.gz", 2) == tmp_path / "apps-2.jsonl.gz"
+    assert part_path(tmp_path / "apps.csv", 1) == tmp_path / "apps-1.csv"
+
+
+def test_export_parallel_writes_a_file_per_worker(tmp_path, mapper):
+    db_url = f"sqlite:///{tmp_path / 'jobless.db'}"
+    engine = get_engine(db_url)
+    init_db(engine)
+    with Session(engine) as session:
+        session.add_all(
+            models.Application(
+                title=f"Job {i}",
+                company=models.Company(name=f"Company {i}"),
+            )
+            for i in range(7)
+        )
+        session.commit()
+
+        counts = export_parallel(
+            session,
+            db_url,
+            {},
+            ExportTarget.APPLICATIONS,
+            FileFormat.JSONL,
+            tmp_path / "apps.jsonl.gz",
+            workers=2,
+        )
+        total = session.scalar(select(func.count()).select_from(models.Application))
+    engine.dispose()
+
+    assert list(counts) == [tmp_path / "apps-1.jsonl.gz", tmp_path / "apps-2.jsonl.gz"]
+    assert sum(counts.values()) == total == 7
+
+    ids = []
+    for path, count in counts.items():
+        with gzip.open(path, "rt") as file:
+            lines = file.read().splitlines()
+        assert len(lines) == count
+        ids += [json.loads(line)["id"] for line in lines]
+
+    assert ids == sorted(set(ids))
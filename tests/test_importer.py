@@ -0,0 +1,200 @@
+import io
+from datetime import date
+
+import pytest
+from sqlalchemy import event, func, select
+
+from jobless import models, schemas
+from jobless.enums import FileFormat, Status
+from jobless.importer import Importer, parse_record, read_records
+from tests.factories import ApplicationFactory, SkillFactory
+
+CSV = """\
+title,company,status,skills,url,date_applied
+Backend Engineer,Acme,applied,python;go,https://jobs.example.com/1,2024-01-02
+SRE,Initech,,go; linux,,
+Data Engineer,Acme,,python,,
+"""
+
+
+def _count(session, model) -> int:
+    return session.scalar(select(func.count()).select_from(model))
+
+
+def test_read_records_numbers_csv_rows_and_jsonl_lines():
+    csv_records = list(read_records(io.StringIO(CSV), FileFormat.CSV))
+    jsonl_records = list(
+        read_records(io.StringIO('{"a": 1}\n\n{"b": 2}\n'), FileFormat.JSONL)
+    )
+
+    assert [number for number, _ in csv_records] == [2, 3, 4]
+    assert csv_records[1][1]["title"] == "SRE"
+    assert jsonl_records == [(1, '{"a": 1}\n'), (3, '{"b": 2}\n')]
+
+
+def test_parse_record_accepts_csv_rows_and_json():
+    row = next(read_records(io.StringIO(CSV), FileFormat.CSV))[1]
+    line = (
+        '{"title": "Backend Engineer", "company": "Acme", "status": "applied", '
+        '"skills": ["python", "go"], "url": "https://jobs.example.com/1", '
+        '"date_applied": "2024-01-02", "id": 7}'
+    )
+
+    assert parse_record(row) == parse_record(line)
+    assert parse_record(line) == schemas.Application(
+        title="Backend Engineer",
+        company=schemas.Company(name="Acme"),
+        status=Status.APPLIED,
+        skills=[schemas.Skill(name="python"), schemas.Skill(name="go")],
+        url="https://jobs.example.com/1",
+        date_applied=date(2024, 1, 2),
+    )
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        '{"title": "SRE"}',
+        "[1, 2]",
+        "{not json",
+        '{"title": "SRE", "company": "Acme", "status": "hired"}',
+        '{"title": "SRE", "company": "Acme", "date_applied": "soon"}',
+        '{"title": "SRE", "company": "Acme", "skills": 3}',
+        '{"title": "SRE", "company": "Acme", "tags": []}',
+    ],
+)
+def test_parse_record_rejects_invalid_records(record):
+    with pytest.raises(ValueError):
+        parse_record(record)
+
+
+def test_import_reuses_companies_and_skills(session, mapper):
+    SkillFactory(name="python")
+    errors = []
+
+    result = Importer(session, mapper).run(
+        read_records(io.StringIO(CSV + "Broken,,,,,\n"), FileFormat.CSV),
+        chunk_size=2,
+        commit=session.flush,
+        on_error=lambda number, error: errors.append(number),
+    )
+
+    assert (result.imported, result.failed) == (3, 1)
+    assert errors == [5]
+    assert _count(session, models.Company) == 2
+    assert sorted(session.scalars(select(models.Skill.name))) == [
+        "go",
+        "linux",
+        "python",
+    ]
+    assert (
+        session.scalars(
+            select(models.Skill.application_count).where(models.Skill.name == "python")
+        ).one()
+        == 2
+    )
+
+
+def test_import_skips_taken_urls(session, mapper):
+    ApplicationFactory(url="https://jobs.example.com/1")
+    records = [
+        (1, {"title": "Dev", "company": "Acme", "url": "https://jobs.example.com/1"}),
+        (2, {"title": "Ops", "company": "Acme", "url": "https://jobs.example.com/2"}),
+        (3, {"title": "QA", "company": "Acme", "url": "https://jobs.example.com/2"}),
+    ]
+
+    result = Importer(session, mapper).run(records, commit=session.flush)
+
+    assert (result.imported, result.duplicates) == (1, 2)
+
+
+def test_import_inserts_each_chunk_with_a_few_statements(engine, session, mapper):
+    records = [
+        (
+            i,
+            {
+                "title": f"Job {i}",
+                "company": f"Company {i % 3}",
+                "skills": "a;b",
+                "url": f"https://jobs.example.com/{i}" if i % 2 else None,
+            },
+        )
+        for i in range(50)
+    ]
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        Importer(session, mapper).run(records, commit=session.flush)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert len(statements) < 10
+    assert _count(session, models.application_skill_link) == 100
+
+
+def test_interrupted_import_resumes_without_duplicates(session, mapper):
+    records = [(i, {"title": f"Job {i}", "company": "Acme"}) for i in range(10)]
+
+    def interrupted():
+        yield from records[:5]
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        Importer(session, mapper).run(
+            interrupted(), source="jobs.csv", chunk_size=2, commit=session.flush
+        )
+
+    # The fifth record was still waiting for its chunk to fill up.
+    assert _count(session, models.Application) == 4
+
+    result = Importer(session, mapper).run(
+        records, source="jobs.csv", chunk_size=2, commit=session.flush
+    )
+
+    assert (result.resumed_after, result.imported) == (4, 6)
+    assert sorted(session.scalars(select(models.Application.title))) == [
+        f"Job {i}" for i in range(10)
+    ]
+
+
+def _tables(session) -> set[str]:
+    return set(
+        session.connection()
+        .exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'table'")
+        .scalars()
+    )
+
+
+def test_import_of_a_changed_source_starts_over(session, mapper):
+    records = [(i, {"title": f"Job {i}", "company": "Acme"}) for i in range(4)]
+
+    def interrupted():
+        yield from records[:3]
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        Importer(session, mapper).run(
+            interrupted(),
+            source="jobs.csv",
+            version="1",
+            chunk_size=2,
+            commit=session.flush,
+        )
+
+    result = Importer(session, mapper).run(
+        records, source="jobs.csv", version="2", chunk_size=2, commit=session.flush
+    )
+
+    assert (result.resumed_after, result.imported) == (0, 4)
+
+
+def test_finished_import_drops_progress_table(session, mapper):
+    records = [(1, {"title": "SRE", "company": "Acme"})]
+
+    Importer(session, mapper).run(records, source="jobs.csv", commit=session.flush)
+
+    assert "import_progress" not in _tables(session)
@@ -0,0 +1,231 @@
+import pytest
+from sqlalchemy import insert
+
+from jobless import migrations
+from jobless.counters import APPLICATION_COUNTERS
+from jobless.db import get_engine, get_schema_version, init_db
+from jobless.migrations import (
+    SCHEMA_VERSION,
+    Migration,
+    add_column,
+    backfill,
+    create_indexes,
+    migrate,
+)
+from jobless.models import Application, Company
+
+
+@pytest.fixture
+def connection(tmp_path):
+    engine = get_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    init_db(engine)
+
+    with engine.connect() as connection:
+        yield connection
+
+    engine.dispose()
+
+
+def _add_companies(connection, count: int) -> None:
+    connection.execute(
+        insert(Company),
+        [{"name": f"company {i}"} for i in range(count)],
+    )
+    connection.commit()
+
+
+def _columns(connection, table: str) -> list[str]:
+    return [
+        row.name for row in connection.exec_driver_sql(f"PRAGMA table_info({table})")
+    ]
+
+
+def _tables(connection) -> set[str]:
+    return set(
+        connection.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        ).scalars()
+    )
+
+
+def test_new_database_is_stamped_with_latest_version(connection):
+    assert get_schema_version(connection) == SCHEMA_VERSION
+
+
+def test_migrate_runs_pending_migrations_in_order(connection, monkeypatch):
+    ran = []
+    monkeypatch.setattr(
+        migrations,
+        "MIGRATIONS",
+        [Migration(v, f"step {v}", lambda _, v=v: ran.append(v)) for v in (1, 2, 3)],
+    )
+
+    migrate(connection, 1, on_migration=lambda m: ran.append(m.description))
+
+    assert ran == ["step 2", 2, "step 3", 3]
+    assert get_schema_version(connection) == 3
+
+
+def test_migrate_does_not_announce_baseline(connection, monkeypatch):
+    monkeypatch.setattr(
+        migrations,
+        "MIGRATIONS",
+        [
+            Migration(1, "baseline", lambda _: None, announce=False),
+            Migration(2, "step 2", lambda _: None),
+        ],
+    )
+    announced = []
+
+    migrate(connection, 0, on_migration=lambda m: announced.append(m.description))
+
+    assert announced == ["step 2"]
+    assert get_schema_version(connection) == 2
+
+
+def test_backfill_keeps_progress_of_other_backfills(connection):
+    _add_companies(connection, 3)
+    connection.exec_driver_sql(
+        "CREATE TABLE migration_progress (name TEXT PRIMARY KEY, last_id INTEGER NOT NULL)"
+    )
+    connection.exec_driver_sql("INSERT INTO migration_progress VALUES ('other', 1)")
+    connection.commit()
+
+    backfill(connection, "industry", "companies", "industry = 'tech'")
+
+    assert connection.exec_driver_sql(
+        "SELECT name FROM migration_progress"
+    ).scalars().all() == ["other"]
+
+
+def test_add_column_is_idempotent(connection):
+    connection.exec_driver_sql("ALTER TABLE applications DROP COLUMN salary")
+    connection.commit()
+
+    add_column(connection, "applications", "salary")
+    add_column(connection, "applications", "salary")
+
+    assert _columns(connection, "applications").count("salary") == 1
+
+
+def test_create_indexes_is_idempotent(connection):
+    connection.exec_driver_sql("DROP INDEX ix_applications_date_applied")
+    connection.commit()
+
+    create_indexes(connection, "ix_applications_date_applied")
+    create_indexes(connection, "ix_applications_date_applied")
+
+    indexes = connection.exec_driver_sql("PRAGMA index_list(applications)")
+    assert "ix_applications_date_applied" in {row.name for row in indexes}
+
+
+def test_backfill_updates_every_row_in_chunks(connection):
+    _add_companies(connection, 10)
+
+    backfill(connection, "industry", "companies", "industry = 'tech'", chunk_size=3)
+
+    assert (
+        connection.exec_driver_sql(
+            "SELECT count(*) FROM companies WHERE industry = 'tech'"
+        ).scalar_one()
+        == 10
+    )
+    assert "migration_progress" not in _tables(connection)
+
+
+def test_backfill_resumes_where_it_stopped(connection):
+    _add_companies(connection, 10)
+    connection.exec_driver_sql(
+        "CREATE TABLE migration_progress (name TEXT PRIMARY KEY, last_id INTEGER NOT NULL)"
+    )
+    connection.exec_driver_sql("INSERT INTO migration_progress VALUES ('industry', 6)")
+    connection.commit()
+
+    backfill(connection, "industry", "companies", "industry = 'tech'", chunk_size=3)
+
+    ids = connection.exec_driver_sql(
+        "SELECT id FROM companies WHERE industry = 'tech'"
+    ).scalars()
+    assert list(ids) == [7, 8, 9, 10]
+
+
+def test_search_migration_indexes_existing_applications(tmp_path):
+    engine = get_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    init_db(engine)
+
+    with engine.connect() as connection:
+        connection.execute(insert(Company), [{"name": "Acme"}])
+        connection.execute(insert(Application), [{"title": "Dev", "company_id": 1}])
+        connection.exec_driver_sql("DROP TABLE applications_fts")
+        connection.exec_driver_sql("PRAGMA user_version = 1")
+        connection.commit()
+
+    init_db(engine)
+
+    with engine.connect() as connection:
+        assert get_schema_version(connection) >= 2
+        assert (
+            connection.exec_driver_sql(
+                "SELECT rowid FROM applications_fts WHERE applications_fts MATCH 'acme'"
+            ).scalar_one()
+            == 1
+        )
+
+    engine.dispose()
+
+
+def test_substring_index_migration_indexes_existing_rows(tmp_path):
+    engine = get_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    init_db(engine)
+
+    with engine.connect() as connection:
+        connection.execute(insert(Company), [{"name": "Globex Corporation"}])
+        connection.exec_driver_sql("DROP TABLE companies_trgm")
+        connection.exec_driver_sql("PRAGMA user_version = 3")
+        connection.commit()
+
+    init_db(engine)
+
+    with engine.connect() as connection:
+        assert (
+            connection.exec_driver_sql(
+                "SELECT rowid FROM companies_trgm WHERE name LIKE '%CORP%'"
+            ).scalar_one()
+            == 1
+        )
+
+    engine.dispose()
+
+
+def test_application_count_migration_counts_existing_rows(tmp_path):
+    engine = get_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    init_db(engine)
+
+    with engine.connect() as connection:
+        for table in APPLICATION_COUNTERS:
+            for event in ["insert", "delete", "update"]:
+                connection.exec_driver_sql(f"DROP TRIGGER {table}_count_{event}")
+
+        connection.execute(insert(Company), [{"name": "Acme"}])
+        connection.execute(
+            insert(Application),
+            [{"title": "Dev", "company_id": 1}, {"title": "Ops", "company_id": 1}],
+        )
+        connection.exec_driver_sql("PRAGMA user_version = 4")
+        connection.commit()
+
+    init_db(engine)
+
+    with engine.connect() as connection:
+        # Same tables as a new database, nothing left over from the backfill.
+        assert "migration_progress" not in _tables(connection)
+
+        connection.execute(insert(Application), [{"title": "QA", "company_id": 1}])
+        assert (
+            connection.exec_driver_sql(
+                "SELECT application_count FROM companies WHERE id = 1"
+            ).scalar_one()
+            == 3
+        )
+
+    engine.dispose()
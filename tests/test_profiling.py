@@ -0,0 +1,69 @@
+import pytest
+
+from jobless.cli import profile_options
+from jobless.profiling import Profiler, _phase_shares, phase_of
+
+
+@pytest.mark.parametrize(
+    ("filename", "function", "phase"),
+    [
+        ("<frozen importlib._bootstrap>", "_find_and_load", "startup"),
+        ("/site-packages/jobless/commands/applications.py", "<module>", "startup"),
+        ("/site-packages/sqlalchemy/orm/query.py", "all", "sql"),
+        ("~", "<method 'execute' of 'sqlite3.Cursor' objects>", "sql"),
+        ("/site-packages/jobless/mapper.py", "to_application_schema", "mapping"),
+        ("/site-packages/rich/console.py", "print", "rendering"),
+        ("/site-packages/jobless/commands/utils.py", "print_table", "rendering"),
+        ("~", "<built-in method builtins.isinstance>", None),
+    ],
+)
+def test_phase_of(filename, function, phase):
+    assert phase_of(filename, function) == phase
+
+
+def test_unknown_functions_count_towards_their_callers():
+    query = ("/sqlalchemy/orm/query.py", 1, "all")
+    table = ("/rich/table.py", 1, "add_row")
+    command = ("/jobless/commands/applications.py", 1, "list")
+    helper = ("~", 0, "<built-in method builtins.isinstance>")
+
+    stats = {
+        query: (1, 1, 0.1, 0.1, {}),
+        table: (1, 1, 0.1, 0.1, {}),
+        command: (1, 1, 0.1, 0.1, {}),
+        helper: (
+            4,
+            4,
+            0.4,
+            0.4,
+            {query: (3, 3, 0.3, 0.3), table: (1, 1, 0.1, 0.1)},
+        ),
+    }
+
+    assert _phase_shares(stats, helper, {}) == pytest.approx(
+        {"sql": 0.75, "rendering": 0.25}
+    )
+    assert _phase_shares(stats, command, {}) == {"other": 1.0}
+
+
+def test_profiler_saves_stats(tmp_path):
+    profiler = Profiler()
+    profiler.start()
+    sorted(range(1000), key=str)
+    profiler.stop()
+
+    assert "Profiled" in profiler.report()
+    assert profiler.save(tmp_path).parent == tmp_path
+
+
+@pytest.mark.parametrize(
+    ("args", "options"),
+    [
+        (["--profile", "app", "list"], (True, False)),
+        (["--save-profile", "app", "list"], (True, True)),
+        (["app", "list", "--profile"], (False, False)),
+        ([], (False, False)),
+    ],
+)
+def test_profile_options_only_reads_root_options(args, options):
+    assert profile_options(args) == options
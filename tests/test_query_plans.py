@@ -0,0 +1,229 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.dialects import sqlite
+
+from jobless import models, schemas
+from jobless.enums import (
+    ApplicationSortField,
+    CompanySortField,
+    ContactSortField,
+    Location,
+    SkillSortField,
+    SortOrder,
+    Status,
+)
+from jobless.repositories import _CrossJoin
+from tests.factories import ApplicationFactory
+
+
+@pytest.fixture
+def query_plan(engine, session):
+    """
+    Return the query plan of the first statement run by the given callable.
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    def plan(run) -> list[str]:
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            run()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        statement, parameters = statements[0]
+        rows = session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        )
+        return [row.detail for row in rows]
+
+    ApplicationFactory.create_batch(3)
+    return plan
+
+
+@pytest.mark.parametrize("method", ["filter", "summaries"])
+@pytest.mark.parametrize("sort_order", list(SortOrder))
+@pytest.mark.parametrize("sort_by", list(ApplicationSortField))
+def test_application_sorts_use_an_index(
+    query_plan, application_repo, sort_by, sort_order, method
+):
+    f = schemas.ApplicationFilter(sort_by=sort_by, sort_order=sort_order, limit=20)
+
+    plan = query_plan(lambda: list(getattr(application_repo, method)(f)))
+
+    assert not any("TEMP B-TREE" in step for step in plan), plan
+
+
+@pytest.mark.parametrize(
+    "f",
+    [
+        schemas.ApplicationFilter(statuses=[Status.APPLIED]),
+        schemas.ApplicationFilter(company_id=1),
+        schemas.ApplicationFilter(statuses=[Status.APPLIED], sort_order=SortOrder.DESC),
+        schemas.ApplicationFilter(company_id=1, sort_order=SortOrder.DESC),
+    ],
+)
+def test_application_filters_sorted_by_creation_use_an_index(
+    query_plan, application_repo, f
+):
+    plan = query_plan(lambda: application_repo.filter(f))
+
+    assert not any("TEMP B-TREE" in step for step in plan), plan
+    assert not any(step.startswith("SCAN applications") for step in plan), plan
+
+
+@pytest.mark.parametrize("sort_by", list(ApplicationSortField))
+@pytest.mark.parametrize(
+    "conditions",
+    [
+        {"statuses": [Status.APPLIED]},
+        {"location_types": [Location.REMOTE]},
+        {"company_id": 1},
+        {"company_name": "acme"},
+        {"title": "engineer"},
+        {"skills": ["python"]},
+        {"skills": ["python", "go"], "all_skills": True},
+        {"contact_id": 1},
+        {"applied_after": date(2024, 1, 1)},
+    ],
+)
+def test_application_filters_combined_with_sorts_use_an_index(
+    query_plan, application_repo, conditions, sort_by
+):
+    f = schemas.ApplicationFilter(**conditions, sort_by=sort_by, limit=20)
+
+    plan = query_plan(lambda: application_repo.filter(f))
+    scans = [step for step in plan if step.split()[:2] == ["SCAN", "applications"]]
+
+    # Applications are either walked in sort order through an index, or
+    # narrowed down through one before being sorted, never both scanned
+    # and sorted.
+    assert "SCAN applications" not in scans, plan
+    assert not (scans and "USE TEMP B-TREE FOR ORDER BY" in plan), plan
+
+
+def test_cross_join_keeps_nested_joins_and_aliases():
+    company = models.Company.__table__.alias("c")
+    application = models.Application.__table__.alias("a")
+    link = models.application_skill_link
+    join = _CrossJoin(
+        company.join(application, application.c.company_id == company.c.id),
+        link,
+        link.c.application_id == application.c.id,
+    )
+
+    sql = str(
+        select(link.c.skill_id).select_from(join).compile(dialect=sqlite.dialect())
+    )
+
+    assert sql.count("CROSS JOIN") == 1
+    assert (
+        "FROM companies AS c JOIN applications AS a ON a.company_id = c.id "
+        "CROSS JOIN application_skill_link ON "
+    ) in sql
+
+
+@pytest.mark.parametrize(
+    ("link", "column"),
+    [
+        ("application_skill_link", "skill_id"),
+        ("application_contact_link", "contact_id"),
+    ],
+)
+def test_link_tables_can_be_searched_from_either_side(session, link, column):
+    plan = session.connection().exec_driver_sql(
+        f"EXPLAIN QUERY PLAN SELECT application_id FROM {link} WHERE {column} = 1"
+    )
+
+    assert "USING COVERING INDEX" in next(plan).detail
+
+
+@pytest.mark.parametrize(
+    ("repo", "f", "index"),
+    [
+        ("application_repo", schemas.ApplicationFilter(title="eng"), "applications"),
+        (
+            "application_repo",
+            schemas.ApplicationFilter(company_name="acme"),
+            "companies",
+        ),
+        ("company_repo", schemas.CompanyFilter(industry="soft"), "companies"),
+        ("contact_repo", schemas.ContactFilter(email="example"), "contacts"),
+        ("skill_repo", schemas.SkillFilter(name="python"), "skills"),
+    ],
+)
+def test_substring_filters_use_trigram_index(query_plan, request, repo, f, index):
+    repo = request.getfixturevalue(repo)
+
+    plan = query_plan(lambda: repo.filter(f))
+
+    assert f"SCAN {index}_trgm VIRTUAL TABLE" in "\n".join(plan), plan
+
+
+def test_application_count_reads_only_an_index(query_plan, application_repo):
+    f = schemas.ApplicationFilter(statuses=[Status.APPLIED, Status.REJECTED])
+
+    plan = query_plan(lambda: application_repo.count(f))
+
+    assert plan == [
+        "SEARCH applications USING COVERING INDEX "
+        "ix_applications_status_created_at (status=?)"
+    ]
+
+
+@pytest.mark.parametrize(
+    ("repo", "f"),
+    [
+        (
+            "company_repo",
+            schemas.CompanyFilter(sort_by=CompanySortField.NUMBER_APPLICATIONS),
+        ),
+        (
+            "contact_repo",
+            schemas.ContactFilter(
+                sort_by=ContactSortField.NUMBER_APPLICATIONS,
+                sort_order=SortOrder.ASC,
+            ),
+        ),
+        (
+            "skill_repo",
+            schemas.SkillFilter(
+                min_applications=2,
+                sort_by=SkillSortField.NUMBER_APPLICATIONS,
+            ),
+        ),
+    ],
+)
+def test_application_counts_use_an_index(query_plan, request, repo, f):
+    repo = request.getfixturevalue(repo)
+    f.limit = 20
+
+    plan = query_plan(lambda: repo.filter(f))
+
+    assert not any("TEMP B-TREE" in step for step in plan), plan
+    assert not any("applications" in step for step in plan), plan
+    assert "application_count" in plan[0], plan
+
+
+def test_all_skills_filter_reads_the_skill_link_index(query_plan, application_repo):
+    f = schemas.ApplicationFilter(skills=["python", "rust"], all_skills=True)
+
+    plan = query_plan(lambda: application_repo.count(f))
+
+    assert any("ix_application_skill_link_skill_id" in step for step in plan), plan
+    assert not any(step.startswith("SCAN") for step in plan), plan
+
+
+def test_contact_filter_starts_from_the_contact_link_index(
+    query_plan, application_repo
+):
+    f = schemas.ApplicationFilter(contact_id=1, limit=20)
+
+    plan = query_plan(lambda: application_repo.filter(f))
+
+    assert any("ix_application_contact_link_contact_id" in step for step in plan)
+    assert not any(step.startswith("SCAN applications") for step in plan), plan
@@ -1,8 +1,19 @@
+from dataclasses import replace
+from datetime import date
+
 import pytest
+from sqlalchemy import event, func, select
 from sqlalchemy.exc import IntegrityError
 
-from jobless import schemas
-from jobless.enums import CompanySortField, SkillSortField, SortOrder
+from jobless import models, schemas
+from jobless.enums import (
+    ApplicationSortField,
+    CompanySortField,
+    ContactSortField,
+    SkillSortField,
+    SortOrder,
+    Status,
+)
 from tests.factories import (
     ApplicationFactory,
     CompanyFactory,
@@ -85,6 +96,44 @@ def test_company_delete_cascades_to_applications(company_repo, application_repo)
     assert application_repo.get(app.id) is None
 
 
+@pytest.mark.parametrize("through_orm", [False, True])
+def test_company_delete_leaves_applications_to_the_database(
+    engine, session, company_repo, through_orm
+):
+    company = CompanyFactory()
+    ApplicationFactory.create_batch(5, company=company, skills=[SkillFactory()])
+    session.expire_all()
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        if through_orm:
+            session.delete(session.get(models.Company, company.id))
+            session.flush()
+        else:
+            company_repo.delete(company.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert [s for s in statements if "applications" in s] == []
+    assert session.scalar(select(func.count()).select_from(models.Application)) == 0
+
+
+def test_company_delete_many(company_repo, application_repo):
+    kept, *deleted = CompanyFactory.create_batch(3)
+    app = ApplicationFactory(company=deleted[0])
+    ids = [c.id for c in deleted]
+
+    assert company_repo.application_counts(ids) == {ids[0]: 1, ids[1]: 0}
+    assert company_repo.delete_many([*ids, 999]) == 2
+    assert company_repo.get_many([kept.id, *ids]) == [company_repo.get(kept.id)]
+    assert application_repo.get(app.id) is None
+
+
 def test_company_filter_by_name_partial(company_repo):
     CompanyFactory(name="Apple")
     CompanyFactory(name="Microsoft")
@@ -379,3 +428,396 @@ def test_skill_filter_limit(skill_repo):
 
     results = skill_repo.filter(schemas.SkillFilter(limit=3))
     assert len(results) == 3
+
+
+def test_application_search_ranks_title_matches_first(application_repo):
+    in_notes = ApplicationFactory(
+        title="Backend engineer", notes="Some Python", description=None
+    )
+    in_title = ApplicationFactory(title="Python developer", description=None)
+    ApplicationFactory(title="Go developer", description="No snakes here")
+
+    results = application_repo.search("python", schemas.ApplicationFilter())
+
+    assert [r.application.id for r in results] == [in_title.id, in_notes.id]
+    assert f"{schemas.MATCH_START}Python{schemas.MATCH_END}" in results[0].snippet
+
+
+def test_application_search_matches_prefixes_and_every_word(application_repo):
+    app = ApplicationFactory(title="Senior Kubernetes engineer", description=None)
+    ApplicationFactory(title="Junior Kubernetes engineer", description=None)
+
+    results = application_repo.search("kube* senior", schemas.ApplicationFilter())
+
+    assert [r.application.id for r in results] == [app.id]
+
+
+def test_application_search_applies_filters(application_repo):
+    ApplicationFactory(title="Python developer", status=Status.SAVED, description=None)
+    applied = ApplicationFactory(
+        title="Python developer", status=Status.APPLIED, description=None
+    )
+
+    results = application_repo.search(
+        "python",
+        schemas.ApplicationFilter(statuses=[Status.APPLIED]),
+    )
+
+    assert [r.application.id for r in results] == [applied.id]
+
+
+def test_application_search_follows_updates_and_deletes(session, application_repo):
+    app = ApplicationFactory(
+        title="Developer", company=CompanyFactory(name="Acme"), description=None
+    )
+    removed = ApplicationFactory(title="Developer", description=None)
+
+    app.company.name = "Initech"
+    session.delete(removed)
+    session.flush()
+
+    f = schemas.ApplicationFilter()
+    assert not application_repo.search("acme", f)
+    assert [r.application.id for r in application_repo.search("initech", f)] == [app.id]
+    assert [r.application.id for r in application_repo.search("developer", f)] == [
+        app.id
+    ]
+
+
+@pytest.mark.parametrize(
+    ("query", "titles"),
+    [
+        ('c++ "remote', ["C++ developer (remote)"]),
+        ('say "hi"', ["Python engineer"]),
+        # Neither a column filter nor boolean operators.
+        ("title:python", ["Python engineer"]),
+        ("python OR rust", ["Python OR Rust engineer"]),
+        ("NOT rust", []),
+        ("-", []),
+        ("*", []),
+        # A trailing '*' is still a prefix.
+        ("pyth*", ["Python OR Rust engineer", "Python engineer"]),
+    ],
+)
+def test_application_search_treats_query_syntax_as_text(
+    application_repo, query, titles
+):
+    ApplicationFactory(title="C++ developer (remote)", description=None, notes=None)
+    ApplicationFactory(title="Python OR Rust engineer", description=None, notes=None)
+    ApplicationFactory(
+        title="Python engineer",
+        description=None,
+        notes='say "hi" to title:python',
+    )
+
+    matches = application_repo.search(query, schemas.ApplicationFilter())
+
+    assert sorted(m.application.title for m in matches) == titles
+
+
+def test_substring_filters_follow_updates_and_deletes(
+    session, company_repo, skill_repo
+):
+    company = CompanyFactory(name="Initech")
+    SkillFactory(name="PostgreSQL")
+    removed = SkillFactory(name="MySQL")
+
+    company.name = "Initrode"
+    session.delete(removed)
+    session.flush()
+
+    assert not company_repo.filter(schemas.CompanyFilter(name="tech"))
+    assert [c.id for c in company_repo.filter(schemas.CompanyFilter(name="TROD"))] == [
+        company.id
+    ]
+    assert [s.name for s in skill_repo.filter(schemas.SkillFilter(name="sql"))] == [
+        "PostgreSQL"
+    ]
+
+
+def _page_ids(repo, f) -> list[int]:
+    ids, after = [], None
+    while True:
+        page = repo.page(f, after)
+        ids += [item.id for item in page.items]
+        if not page.next_cursor:
+            return ids
+
+        after = page.next_cursor
+
+
+@pytest.mark.parametrize("sort_order", list(SortOrder))
+@pytest.mark.parametrize("sort_by", list(ApplicationSortField))
+def test_application_page_walks_every_result_in_order(
+    application_repo, sort_by, sort_order
+):
+    companies = CompanyFactory.create_batch(3)
+    for i in range(10):
+        # Repeated values and missing dates, to page through ties and NULLs.
+        ApplicationFactory(
+            company=companies[i % 3],
+            status=list(Status)[i % 3],
+            date_applied=date(2024, 1, 1 + i % 2) if i % 3 else None,
+        )
+
+    f = schemas.ApplicationFilter(sort_by=sort_by, sort_order=sort_order)
+    expected = [app.id for app in application_repo.filter(f)]
+
+    f.limit = 3
+    assert _page_ids(application_repo, f) == expected
+
+
+@pytest.mark.parametrize("sort_order", list(SortOrder))
+def test_company_page_by_application_count(company_repo, sort_order):
+    for n in [2, 0, 2, 1, 0]:
+        ApplicationFactory.create_batch(n, company=CompanyFactory())
+
+    f = schemas.CompanyFilter(
+        sort_by=CompanySortField.NUMBER_APPLICATIONS,
+        sort_order=sort_order,
+    )
+    expected = [company.id for company in company_repo.filter(f)]
+
+    f.limit = 2
+    assert _page_ids(company_repo, f) == expected
+
+
+def test_contact_page_by_email_with_missing_emails(contact_repo):
+    for i in range(7):
+        ContactFactory(email=None if i % 2 else f"c{i % 3}{i}@example.com")
+
+    for sort_order in SortOrder:
+        f = schemas.ContactFilter(sort_by=ContactSortField.EMAIL, sort_order=sort_order)
+        expected = [contact.id for contact in contact_repo.filter(f)]
+
+        f.limit = 2
+        assert _page_ids(contact_repo, f) == expected
+
+
+def test_page_returns_no_cursor_on_the_last_page(skill_repo):
+    SkillFactory.create_batch(4)
+
+    page = skill_repo.page(schemas.SkillFilter(limit=4))
+    assert len(page.items) == 4
+    assert page.next_cursor is None
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor", "W10"])
+def test_page_rejects_invalid_cursors(skill_repo, cursor):
+    with pytest.raises(ValueError, match="invalid cursor"):
+        skill_repo.page(schemas.SkillFilter(limit=1), cursor)
+
+
+def test_page_rejects_cursors_from_another_sort(skill_repo):
+    SkillFactory.create_batch(2)
+    page = skill_repo.page(schemas.SkillFilter(limit=1))
+
+    with pytest.raises(ValueError, match="sort options"):
+        skill_repo.page(
+            schemas.SkillFilter(limit=1, sort_by=SkillSortField.NAME),
+            page.next_cursor,
+        )
+
+
+def test_application_iter_filter_streams_the_filter_results(application_repo):
+    skills = SkillFactory.create_batch(2)
+    contact = ContactFactory()
+    for i in range(5):
+        ApplicationFactory(skills=skills[: i % 3], contacts=[contact] if i % 2 else [])
+
+    f = schemas.ApplicationFilter(sort_by=ApplicationSortField.TITLE)
+    streamed = application_repo.iter_filter(f, chunk_size=2)
+
+    assert not isinstance(streamed, list)
+    assert list(streamed) == application_repo.filter(f)
+
+
+def test_application_summaries_match_the_full_records(application_repo):
+    ApplicationFactory.create_batch(3, date_applied=date(2024, 3, 1))
+
+    f = schemas.ApplicationFilter(sort_by=ApplicationSortField.COMPANY)
+    summaries = list(application_repo.summaries(f))
+
+    assert [(s.id, s.title, s.company_name, s.date_applied) for s in summaries] == [
+        (a.id, a.title, a.company.name, a.date_applied)
+        for a in application_repo.filter(f)
+    ]
+
+
+def test_application_summary_pages_share_cursors_with_full_pages(application_repo):
+    ApplicationFactory.create_batch(3)
+
+    f = schemas.ApplicationFilter(limit=2)
+    first = application_repo.page_summaries(f)
+    rest = application_repo.page(f, first.next_cursor)
+
+    assert [s.id for s in first.items] + [a.id for a in rest.items] == [
+        a.id for a in application_repo.filter(schemas.ApplicationFilter())
+    ]
+
+
+def test_counts_match_the_filter_results(
+    application_repo, company_repo, contact_repo, skill_repo
+):
+    python = SkillFactory(name="python")
+    contact = ContactFactory()
+    for i in range(6):
+        ApplicationFactory(
+            status=Status.APPLIED if i % 2 else Status.SAVED,
+            skills=[python] if i % 3 else [],
+            contacts=[contact] if i == 0 else [],
+        )
+
+    for repo, f in [
+        (application_repo, schemas.ApplicationFilter(statuses=[Status.APPLIED])),
+        (application_repo, schemas.ApplicationFilter(skills=["python"], limit=1)),
+        (company_repo, schemas.CompanyFilter(min_applications=1)),
+        (company_repo, schemas.CompanyFilter(name="company")),
+        (contact_repo, schemas.ContactFilter(max_applications=0)),
+        (skill_repo, schemas.SkillFilter(min_applications=4)),
+    ]:
+        expected = len(repo.filter(replace(f, limit=None)))
+        assert repo.count(f) == expected, f
+
+
+def test_application_filter_all_skills_needs_every_skill(application_repo):
+    python, rust, go = (SkillFactory(name=n) for n in ["python", "rust", "go"])
+    both = ApplicationFactory(skills=[python, rust])
+    ApplicationFactory(skills=[python, go])
+    ApplicationFactory(skills=[rust])
+    everything = ApplicationFactory(skills=[python, rust, go])
+
+    f = schemas.ApplicationFilter(skills=["python", "rust", "python"], all_skills=True)
+
+    assert {a.id for a in application_repo.filter(f)} == {both.id, everything.id}
+    assert application_repo.count(f) == 2
+
+
+def test_application_filter_by_contact(application_repo):
+    sarah = ContactFactory(name="Sarah Connor", email="sarah@cyberdyne.com")
+    john = ContactFactory(name="John Connor", email="john@resistance.org")
+    with_sarah = ApplicationFactory(contacts=[sarah])
+    with_both = ApplicationFactory(contacts=[sarah, john])
+    ApplicationFactory(contacts=[john])
+    ApplicationFactory()
+
+    def ids(**kwargs) -> set[int]:
+        return {
+            a.id for a in application_repo.filter(schemas.ApplicationFilter(**kwargs))
+        }
+
+    assert ids(contact_id=sarah.id) == {with_sarah.id, with_both.id}
+    assert ids(contact_name="sarah") == {with_sarah.id, with_both.id}
+    assert ids(contact_email="cyberdyne") == {with_sarah.id, with_both.id}
+    # Every condition has to hold for the same contact.
+    assert ids(contact_name="john", contact_email="cyberdyne") == set()
+
+
+def test_get_or_create_many_takes_two_statements(engine, session, skill_repo):
+    SkillFactory(name="python")
+    names = [f"skill {i}" for i in range(20)] + ["python", "skill 3"]
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        skills = skill_repo.get_or_create_many(names)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert len(statements) == 2
+    assert [s.name for s in skills] == names[:-1]
+    assert len({s.id for s in skills}) == 21
+
+
+def test_get_or_create_many_creates_complete_rows(session, company_repo):
+    existing = CompanyFactory(name="Initech")
+
+    companies = company_repo.get_or_create_many(["Initech", "Initrode"])
+
+    assert companies[0].id == existing.id
+    created = session.get(models.Company, companies[1].id)
+    assert created.created_at is not None
+    assert created.application_count == 0
+    assert [
+        c.name for c in company_repo.filter(schemas.CompanyFilter(name="trode"))
+    ] == ["Initrode"]
+
+
+def test_get_many_keeps_the_given_order(contact_repo, application_repo):
+    first, second = ContactFactory.create_batch(2)
+    apps = ApplicationFactory.create_batch(3)
+
+    assert [c.id for c in contact_repo.get_many([second.id, 999, first.id])] == [
+        second.id,
+        first.id,
+    ]
+    summaries = application_repo.get_summaries([apps[2].id, apps[0].id, apps[2].id])
+    assert [(s.id, s.company_name) for s in summaries] == [
+        (apps[2].id, apps[2].company.name),
+        (apps[0].id, apps[0].company.name),
+    ]
+
+
+def test_delete_many_removes_links(session, application_repo, skill_repo):
+    skill = SkillFactory()
+    contact = ContactFactory()
+    deleted = ApplicationFactory.create_batch(3, skills=[skill], contacts=[contact])
+    kept = ApplicationFactory(skills=[skill])
+
+    assert application_repo.delete_many([a.id for a in deleted]) == 3
+
+    session.expire_all()
+    assert [
+        a.id for a in application_repo.iter_filter(schemas.ApplicationFilter())
+    ] == [kept.id]
+    assert session.get(models.Contact, contact.id).applications == []
+
+    assert skill_repo.delete_many([skill.id]) == 1
+    session.expire_all()
+    assert session.get(models.Application, kept.id).skills == []
+
+
+def test_update_where_changes_matching_applications(session, application_repo):
+    python = SkillFactory(name="python")
+    stale = ApplicationFactory(
+        status=Status.APPLIED,
+        date_applied=date(2024, 1, 1),
+        follow_up_date=date(2024, 2, 1),
+        skills=[python],
+    )
+    recent = ApplicationFactory(status=Status.APPLIED, date_applied=date(2024, 6, 1))
+    other = ApplicationFactory(status=Status.APPLIED, date_applied=date(2024, 1, 1))
+    last_updated = stale.last_updated
+    f = schemas.ApplicationFilter(
+        statuses=[Status.APPLIED],
+        applied_before=date(2024, 3, 1),
+        skills=["python"],
+    )
+
+    updated = application_repo.update_where(
+        f, {"status": Status.GHOSTED, "follow_up_date": None}
+    )
+
+    assert updated == 1
+    session.expire_all()
+    assert (stale.status, stale.follow_up_date) == (Status.GHOSTED, None)
+    assert stale.last_updated >= last_updated
+    assert recent.status == other.status == Status.APPLIED
+    assert application_repo.count(f) == 0
+
+
+def test_application_iter_by_id_matches_get(application_repo):
+    apps = [
+        ApplicationFactory(skills=[SkillFactory(), SkillFactory()]) for _ in range(5)
+    ]
+    ids = [app.id for app in apps]
+
+    chunked = list(application_repo.iter_by_id(chunk_size=2))
+    ranged = list(application_repo.iter_by_id(ids[1], ids[3], chunk_size=2))
+
+    assert chunked == [application_repo.get(id) for id in ids]
+    assert [app.id for app in ranged] == ids[1:4]
@@ -0,0 +1,65 @@
+import pytest
+
+from jobless.settings import SQLITE_PROFILES, Settings, load_settings
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch):
+    for name in ("JOBLESS_SQLITE_PROFILE", "JOBLESS_SQLITE_CACHE_SIZE"):
+        monkeypatch.delenv(name, raising=False)
+
+    return tmp_path / "config.toml"
+
+
+def test_sqlite_pragmas_default_to_interactive_profile():
+    assert Settings().sqlite_pragmas() == SQLITE_PROFILES["interactive"]
+
+
+def test_sqlite_pragmas_apply_overrides_to_any_profile():
+    settings = Settings(sqlite_profile="low-memory", sqlite_busy_timeout=100)
+
+    assert settings.sqlite_pragmas()["busy_timeout"] == 100
+    assert settings.sqlite_pragmas()["mmap_size"] == 0
+    assert settings.sqlite_pragmas("bulk-import")["busy_timeout"] == 100
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"sqlite_profile": "turbo"},
+        {"sqlite_bulk_profile": "turbo"},
+        {"sqlite_synchronous": "SOMETIMES"},
+        {"sqlite_temp_store": "1; DROP TABLE applications"},
+        {"sqlite_cache_size": "2000"},
+    ],
+)
+def test_invalid_sqlite_settings(kwargs):
+    with pytest.raises(ValueError):
+        Settings(**kwargs)
+
+
+def test_load_settings_reads_config_file(tmp_path, config_path):
+    config_path.write_text('sqlite_profile = "low-memory"\nsqlite_cache_size = -64\n')
+
+    settings = load_settings(app_dir=tmp_path, config_path=config_path)
+
+    assert settings.sqlite_profile == "low-memory"
+    assert settings.sqlite_cache_size == -64
+
+
+def test_load_settings_parses_env_vars(tmp_path, config_path, monkeypatch):
+    config_path.write_text("sqlite_cache_size = -64\n")
+    monkeypatch.setenv("JOBLESS_SQLITE_PROFILE", "bulk-import")
+    monkeypatch.setenv("JOBLESS_SQLITE_CACHE_SIZE", "-8000")
+
+    settings = load_settings(app_dir=tmp_path, config_path=config_path)
+
+    assert settings.sqlite_profile == "bulk-import"
+    assert settings.sqlite_cache_size == -8000
+
+
+def test_load_settings_rejects_malformed_env_vars(tmp_path, config_path, monkeypatch):
+    monkeypatch.setenv("JOBLESS_SQLITE_CACHE_SIZE", "lots")
+
+    with pytest.raises(ValueError, match="JOBLESS_SQLITE_CACHE_SIZE"):
+        load_settings(app_dir=tmp_path, config_path=config_path)
@@ -0,0 +1,46 @@
+import io
+import json
+from datetime import date
+
+import pytest
+
+from jobless import schemas
+from jobless.commands.utils import print_matches, write_json_list
+from jobless.enums import OutputFormat
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        [],
+        [{"id": 1}],
+        [
+            {"id": 1, "skills": [{"name": "python"}], "notes": "multi\nline"},
+            {"id": 2, "skills": [], "date_applied": date(2024, 1, 2)},
+        ],
+    ],
+)
+def test_write_json_list_matches_json_dumps(items):
+    file = io.StringIO()
+    write_json_list(iter(items), file)
+
+    expected = json.dumps(items, indent=2, default=str, ensure_ascii=False)
+    assert file.getvalue() == expected + "\n"
+
+
+def test_print_matches_writes_json_as_is(capsys):
+    app = schemas.Application(
+        id=1,
+        title="[bold]SRE[/bold]",
+        company=schemas.Company(id=1, name="Acme"),
+    )
+    snippet = f"uses {schemas.MATCH_START}[red]{schemas.MATCH_END} tags"
+
+    print_matches(
+        [schemas.ApplicationMatch(application=app, snippet=snippet)],
+        OutputFormat.JSON,
+    )
+    (match,) = json.loads(capsys.readouterr().out)
+
+    assert match["title"] == "[bold]SRE[/bold]"
+    assert match["snippet"] == "uses [red] tags"